@@ -8,6 +8,7 @@ if os.getenv("FLASK_ENV") == "production":
 
 from .extensions import jwt, socketio, limiter, cache
 from app.db import init_db
+from app.game_logic import configure_logging
 from config import Config
 from app.models.user import User
 from werkzeug.middleware.proxy_fix import ProxyFix
@@ -31,6 +32,8 @@ def create_app(config_class=Config, testing=False):
     CORS(app, supports_credentials=True, resources={r"/*": {"origins": origin_list}})
     # db - see db.py
     init_db(app)
+    # game engine logs - level from ENGINE_LOG_LEVEL (see app/game_logic/log.py)
+    configure_logging()
 
     # seed bot account
     with app.app_context():
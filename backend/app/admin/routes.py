@@ -4,6 +4,8 @@ from flask import abort, jsonify, request
 from app.admin import admin
 from app.db import db
 from app.models.user import RoleEnum, User
+from app.extensions import scheduler
+from app.payloads import encode_stats
 from sqlite3 import IntegrityError
 
 
@@ -78,4 +80,10 @@ def create_user():
         db.session.commit()    
     except IntegrityError as e:
         abort(500) # username taken
-    return jsonify(new_usr.to_dict()), 201
\ No newline at end of file
+    return jsonify(new_usr.to_dict()), 201
+
+@admin.route("/metrics", methods=["GET"])
+@jwt_required()
+@admin_required
+def get_metrics():
+    return jsonify({"socket_encoding": encode_stats.snapshot(), "timers": scheduler.metrics()})
@@ -10,10 +10,15 @@ implementation logic.
 """
 
 from app.bot.decision_engine import DecisionEngine
-from app.game_logic import Card, best_hand_from_cards
+from app.bot.preflop_table import preflop_score
+from app.game_logic import ALL_CARDS, Card, Deck, best_hand_from_cards
+from app.game_logic.canonical import canonical_cards, canonical_key
+from app.game_logic.evaluator import HandState, add_cards, evaluate_masks
+from functools import lru_cache
 import math
 
 DEFAULT_PHASE_ALPHA = {"flop": 0.4, "turn": 0.7, "river": 1.0}
+SCORE_CACHE_SIZE = 1 << 14
 
 
 class HeuristicDecisionEngine(DecisionEngine):
@@ -53,6 +58,15 @@ class HeuristicDecisionEngine(DecisionEngine):
         based on the primary tiebreaker card (e.g. pair rank). 0.0 means
         all pairs score identically; 0.5 means pair of Aces can score up to
         halfway between pair and two-pair. Default 0.5.
+    flop_lookahead : int
+        Cards of lookahead used for potential on the flop. 1 scores each
+        possible turn card; 2 enumerates every turn+river pair (1,081 runouts)
+        so runner-runner draws count. Turn potential always uses 1.
+        Default 1.
+    preflop_equity : bool
+        Score preflop hands from the precomputed all-in equity table
+        (app/bot/preflop_table.py) for the number of players still in the
+        hand, instead of the rank-sum formula and bonuses. Default False.
     """
 
     def __init__(
@@ -66,6 +80,8 @@ class HeuristicDecisionEngine(DecisionEngine):
         preflop_connected_bonus: float = 0.05,
         pot_odds_sensitivity: float = 0.5,
         kicker_weight: float = 0.5,
+        flop_lookahead: int = 1,
+        preflop_equity: bool = False,
     ):
         self.aggr_thresh = aggr_thresh
         self.call_thresh = call_thresh
@@ -76,6 +92,8 @@ class HeuristicDecisionEngine(DecisionEngine):
         self.preflop_connected_bonus = preflop_connected_bonus
         self.pot_odds_sensitivity = pot_odds_sensitivity
         self.kicker_weight = kicker_weight
+        self.flop_lookahead = flop_lookahead
+        self.preflop_equity = preflop_equity
 
     # ── public interface ────────────────────────────────────────────────────
 
@@ -90,6 +108,10 @@ class HeuristicDecisionEngine(DecisionEngine):
         hole_cards = [_parse_card(s) for s in game_state["my_cards"]]
         board_cards = [_parse_card(s) for s in game_state["board"]]
 
+        if phase == "preflop" and self.preflop_equity:
+            players = [p for p in game_state.get("players", []) if not p["folded"]]
+            return preflop_score(hole_cards[0].to_int(), hole_cards[1].to_int(), max(len(players), 2))
+
         if phase == "preflop":
             return _preflop_strength(
                 hole_cards,
@@ -98,13 +120,13 @@ class HeuristicDecisionEngine(DecisionEngine):
                 self.preflop_connected_bonus,
             )
 
-        current_norm = _current_strength(hole_cards, board_cards, kicker_weight=self.kicker_weight)
         alpha = self.phase_alpha.get(phase, 1.0)
+        lookahead = 0 if alpha >= 1.0 else self.flop_lookahead if phase == "flop" else 1
+        key = canonical_key([c.to_int() for c in hole_cards], [c.to_int() for c in board_cards])
+        current_norm, potential = _postflop_components(key, self.kicker_weight, lookahead)
 
         if alpha >= 1.0:
             return current_norm
-
-        potential = _potential(hole_cards, board_cards, current_norm, kicker_weight=self.kicker_weight)
         return alpha * current_norm + (1.0 - alpha) * potential
 
     # ── action selection ────────────────────────────────────────────────────
@@ -167,8 +189,7 @@ class HeuristicDecisionEngine(DecisionEngine):
 # ── module-level pure helpers (importable for unit tests) ──────────────────
 
 def _parse_card(card_str: str) -> Card:
-    rank, _, suit = card_str.partition(" of ")
-    return Card(rank, suit)
+    return Card.from_str(card_str)
 
 
 def _preflop_strength(
@@ -178,7 +199,7 @@ def _preflop_strength(
     connected_bonus: float,
 ) -> float:
     """Hole-card quality heuristic for the preflop phase (0–1)."""
-    ranks = sorted([Card.RANKS.index(c.rank) for c in hole_cards], reverse=True)
+    ranks = sorted([c.to_int() >> 2 for c in hole_cards], reverse=True)
     base = (ranks[0] + ranks[1]) / 24.0  # max = Ace(12) + Ace(12) = 24
     if ranks[0] == ranks[1]:
         base += pair_bonus
@@ -189,6 +210,25 @@ def _preflop_strength(
     return min(base, 1.0)
 
 
+@lru_cache(maxsize=SCORE_CACHE_SIZE)
+def _postflop_components(key: tuple, kicker_weight: float, lookahead: int) -> tuple[float, float]:
+    """
+    (current strength, potential) for a canonical hole/board key, so spots
+    that are identical up to suits share one cache entry across hands and
+    tables. lookahead=0 skips the potential calculation.
+    """
+    hole, board = canonical_cards(key)
+    # One HandState serves both the made-hand score and every lookahead runout
+    state = HandState(hole + board)
+    current = _strength_norm(state.strength() >> 16, 4.0, kicker_weight)
+    if not lookahead:
+        return current, 0.0
+    hole_cards, board_cards = [ALL_CARDS[c] for c in hole], [ALL_CARDS[c] for c in board]
+    return current, _potential(
+        hole_cards, board_cards, current, kicker_weight=kicker_weight, lookahead=lookahead, state=state,
+    )
+
+
 def _current_strength(
     hole_cards: list, board_cards: list, base: float = 4.0, kicker_weight: float = 0.0
 ) -> float:
@@ -201,11 +241,17 @@ def _current_strength(
     bonus is half the gap to the next hand-rank level.
     """
     best = best_hand_from_cards(hole_cards + board_cards)
-    rank = best.hand_rank                           # int 1–10
+    return _strength_norm(best.strength >> 16, base, kicker_weight)
+
+
+@lru_cache(maxsize=None)
+def _strength_norm(rank_key: int, base: float = 4.0, kicker_weight: float = 0.0) -> float:
+    """Normalise a hand strength; rank_key is strength >> 16 (rank, primary tiebreaker)."""
+    rank = rank_key >> 4                           # int 1–10
     x = (rank - 1) / 9.0                           # linear 0–1
     base_score = math.log(1 + x * (base - 1)) / math.log(base)  # logarithmic 0–1
 
-    if kicker_weight > 0 and best.card_ranks and rank >= 2:
+    if kicker_weight > 0 and rank >= 2:
         # Score of the next hand-rank level (or 1.0 for royal flush)
         if rank < 10:
             next_x = rank / 9.0          # == (rank + 1 - 1) / 9
@@ -213,8 +259,8 @@ def _current_strength(
         else:
             next_score = 1.0
         rank_gap = next_score - base_score
-        # card_ranks[0] is the primary tiebreaker (0–12); scale to fraction of gap
-        kicker_bonus = (best.card_ranks[0] / 12.0) * rank_gap * kicker_weight
+        # the low nibble is the primary tiebreaker (0–12); scale to fraction of gap
+        kicker_bonus = ((rank_key & 0xF) / 12.0) * rank_gap * kicker_weight
         return min(1.0, base_score + kicker_bonus)
 
     return base_score
@@ -224,28 +270,41 @@ def _potential(
     hole_cards: list, board_cards: list, current_norm: float,
     ceiling_weight: float = 0.5,
     kicker_weight: float = 0.0,
+    lookahead: int = 1,
+    state: HandState | None = None,
 ) -> float:
-    """Expected improvement in normalised strength from the next unknown card.
+    """Expected improvement in normalised strength from the next unknown card(s).
 
     ceiling_weight blends avg future strength with max future strength,
     so draws with a high ceiling (e.g. flush draw) aren't diluted by the
     majority of cards that don't hit.
-    kicker_weight is forwarded to _current_strength for consistent scoring.
+    kicker_weight is forwarded to _strength_norm for consistent scoring.
+    lookahead=2 enumerates every pair of next two cards instead of one
+    card (capped at the cards left to come on the board).
+    state, if given, is a HandState already holding hole + board.
     """
-    known_reprs = {repr(c) for c in hole_cards + board_cards}
-    remaining = [
-        Card(r, s)
-        for r in Card.RANKS
-        for s in Card.SUITS
-        if repr(Card(r, s)) not in known_reprs
-    ]
-    if not remaining:
-        return 0.0
-
-    future_norms = [
-        _current_strength(hole_cards, board_cards + [c], kicker_weight=kicker_weight)
-        for c in remaining
-    ]
+    if len(board_cards) >= 5:
+        return 0.0  # river: nothing left to come
+    known = [c.to_int() for c in hole_cards + board_cards]
+    deck = Deck()
+    for c in known:
+        deck.remove(c)
+    remaining = list(deck)
+
+    # Fold the known cards into rank/suit masks once, then add each runout on top
+    masks = (state or HandState(known)).masks
+    if lookahead >= 2 and len(board_cards) <= 3:
+        future_norms = []
+        for i, turn in enumerate(remaining):
+            after_turn = add_cards(masks, (turn,))
+            for river in remaining[i + 1:]:
+                strength = evaluate_masks(*add_cards(after_turn, (river,)))
+                future_norms.append(_strength_norm(strength >> 16, 4.0, kicker_weight))
+    else:
+        future_norms = [
+            _strength_norm(evaluate_masks(*add_cards(masks, (c,))) >> 16, 4.0, kicker_weight)
+            for c in remaining
+        ]
     avg_future = sum(future_norms) / len(future_norms)
     max_future = max(future_norms)
     blended = (1 - ceiling_weight) * avg_future + ceiling_weight * max_future
@@ -16,8 +16,8 @@ class PokerBot:
 
     def get_action(self, game: PokerRound) -> tuple[str, int | None]:
         """
-        Serialize the game state for this bot's perspective and ask the engine
-        for an action.
+        Ask the engine for an action on the game state from this bot's
+        perspective (the table's cached public view plus the bot's cards).
 
         Returns:
             (action, amount) ready to pass to game.handle_player_action()
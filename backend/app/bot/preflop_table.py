@@ -0,0 +1,100 @@
+"""
+Precomputed all-in preflop equity for the 169 canonical starting hands.
+
+The table is a (169, 7) float32 array: row = hand class (see hand_class),
+column = players at the table minus 2 (2–8 players), value = equity of the
+hand against that many uniformly random opponent hands. It ships as
+data/preflop_equity.npy and is loaded on first use.
+
+Rebuild (from backend/):
+    python -m app.bot.preflop_table --iterations 20000 --seed 0
+"""
+import argparse
+import os
+
+import numpy as np
+
+from app.game_logic import calculate_equity_vs_random
+
+TABLE_PATH = os.path.join(os.path.dirname(__file__), "data", "preflop_equity.npy")
+MIN_PLAYERS = 2
+MAX_PLAYERS = 8
+NUM_CLASSES = 169
+
+_table: np.ndarray | None = None
+_normalised: np.ndarray | None = None
+
+
+def hand_class(card_a: int, card_b: int) -> int:
+    """
+    Map two integer-encoded hole cards to a class in 0–168 on a 13x13 grid:
+    pairs on the diagonal, suited hands at [high][low], offsuit at [low][high].
+    """
+    high, low = max(card_a >> 2, card_b >> 2), min(card_a >> 2, card_b >> 2)
+    if (card_a & 3) == (card_b & 3):
+        return high * 13 + low
+    return low * 13 + high
+
+
+def representative(cls: int) -> tuple[int, int]:
+    """One concrete pair of cards for a hand class (inverse of hand_class)."""
+    row, col = divmod(cls, 13)
+    if row > col:
+        return row * 4, col * 4          # suited: both suit 0
+    return col * 4, row * 4 + 1          # pair / offsuit: suits 0 and 1
+
+
+def load_table() -> np.ndarray:
+    global _table
+    if _table is None:
+        _table = np.load(TABLE_PATH)
+    return _table
+
+
+def preflop_equity(card_a: int, card_b: int, num_players: int) -> float:
+    """Raw all-in equity of the hand against num_players - 1 random hands."""
+    num_players = min(max(num_players, MIN_PLAYERS), MAX_PLAYERS)
+    return float(load_table()[hand_class(card_a, card_b), num_players - MIN_PLAYERS])
+
+
+def preflop_score(card_a: int, card_b: int, num_players: int) -> float:
+    """
+    Equity rescaled per player count so the weakest class scores 0 and the
+    strongest scores 1, on the same 0–1 scale as the other bot scores.
+    """
+    global _normalised
+    if _normalised is None:
+        table = load_table()
+        low, high = table.min(axis=0), table.max(axis=0)
+        _normalised = (table - low) / (high - low)
+    num_players = min(max(num_players, MIN_PLAYERS), MAX_PLAYERS)
+    return float(_normalised[hand_class(card_a, card_b), num_players - MIN_PLAYERS])
+
+
+def build_table(iterations: int, seed: int) -> np.ndarray:
+    table = np.zeros((NUM_CLASSES, MAX_PLAYERS - MIN_PLAYERS + 1), dtype=np.float32)
+    for cls in range(NUM_CLASSES):
+        hole = representative(cls)
+        for players in range(MIN_PLAYERS, MAX_PLAYERS + 1):
+            result = calculate_equity_vs_random(
+                hole, players - 1, iterations=iterations, seed=seed + cls * 16 + players,
+            )
+            table[cls, players - MIN_PLAYERS] = result.equity[0]
+    return table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the preflop equity table.")
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=TABLE_PATH)
+    args = parser.parse_args()
+
+    table = build_table(args.iterations, args.seed)
+    os.makedirs(os.path.dirname(args.out), exist_ok=True)
+    np.save(args.out, table)
+    print(f"wrote {table.shape} table to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Headless hand simulator: plays PokerRound hands to completion between
+DecisionEngines, with no sockets, Flask app or turn delays.
+
+    result = simulate([("heuristic", HeuristicDecisionEngine()),
+                       ("random", RandomDecisionEngine())], hands=20_000, seed=1)
+    print(result.report())
+
+or from backend/:
+
+    python -m app.bot.simulator --hands 20000 --engines heuristic random random
+
+Each seat is a (label, engine) pair; several seats may share a label and
+their results are pooled. The hands are split into tasks run on a process
+pool (one per core by default). Each task seats the players in its own
+random order at a fresh table seeded from spawn_seeds(seed, tasks), so a
+run is reproducible for a given seed and task count. The button rotates
+every hand, and a player left with no more than the small blind rebuys to
+the starting stack, like the live rebuy rule.
+
+Win rates are in big blinds per 100 hands, from each seat's chip change
+per hand, with a 95% normal confidence interval. An action an engine
+returns that PokerRound rejects is played as a fold and counted.
+"""
+from __future__ import annotations
+import argparse
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.bot.decision_engine import DecisionEngine, RandomDecisionEngine
+from app.bot.heuristic_engine import HeuristicDecisionEngine
+from app.game_logic import InvalidActionError, InvalidAmountError, Player, PokerRound, set_log_level, spawn_seeds
+
+Seat = Tuple[str, DecisionEngine]
+
+ENGINES = {
+    "heuristic": HeuristicDecisionEngine,
+    "random": RandomDecisionEngine,
+}
+TASKS_PER_WORKER = 4
+Z95 = 1.96
+
+
+@dataclass(frozen=True)
+class EngineResult:
+    label: str
+    hands: int           # seat-hands played by this label
+    bb_per_100: float    # mean chip change per hand, in big blinds per 100 hands
+    ci95: float          # half-width of the 95% interval on bb_per_100
+    rebuys: int
+    invalid_actions: int
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    hands: int
+    seconds: float
+    hands_per_second: float
+    engines: List[EngineResult]
+
+    def report(self) -> str:
+        lines = [f"{self.hands:,} hands in {self.seconds:.1f}s ({self.hands_per_second:,.0f} hands/s)"]
+        for e in self.engines:
+            lines.append(
+                f"  {e.label:<12} {e.bb_per_100:+9.2f} ± {e.ci95:6.2f} bb/100"
+                f"  ({e.hands:,} seat-hands, {e.rebuys} rebuys, {e.invalid_actions} invalid)"
+            )
+        return "\n".join(lines)
+
+
+def play_hand(game: PokerRound, engines: Dict[str, DecisionEngine]) -> List[str]:
+    """
+    Play one hand to completion, starting it on the next button. Returns
+    the name of the player behind each rejected (folded) action.
+    """
+    invalid = []
+    game.start_next_round()
+    while not game.is_action_finished:
+        name = game.get_player_to_act_and_actions()["player_to_act"]
+        game_state = game.serialize_for_player(name)
+        action, amount = engines[name].decide(game_state, game_state["available_actions"])
+        try:
+            game.handle_player_action(name, action, amount)
+        except (InvalidActionError, InvalidAmountError):
+            invalid.append(name)
+            game.handle_player_action(name, "fold", None)
+    game.end_poker_round()
+    return invalid
+
+
+def _run_task(seats: Sequence[Seat], hands: int, small_blind: int, big_blind: int, stack: int, seed: int) -> dict:
+    """Play hands at one table; returns per-label sums for aggregation."""
+    # Engines that draw from the random module (RandomDecisionEngine) are
+    # seeded too; the caller's state is put back, as workers=1 runs here.
+    saved = random.getstate()
+    random.seed(seed)
+    try:
+        return _play_table(seats, hands, small_blind, big_blind, stack, seed)
+    finally:
+        random.setstate(saved)
+
+
+def _play_table(seats: Sequence[Seat], hands: int, small_blind: int, big_blind: int, stack: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    order = list(range(len(seats)))
+    rng.shuffle(order)
+    names = [f"{seats[i][0]}#{i}" for i in order]
+    labels = {name: seats[i][0] for name, i in zip(names, order)}
+    engines = {name: seats[i][1] for name, i in zip(names, order)}
+    game = PokerRound([Player(name, stack) for name in names], small_blind, big_blind, seed=seed)
+    players = list(game.table._seats)
+
+    stats = {label: [0, 0.0, 0.0, 0, 0] for label in labels.values()}  # n, sum, sum of squares, rebuys, invalid
+    for _ in range(hands):
+        for player in players:
+            if player.chips <= small_blind:
+                game.set_chips(player, stack)
+                stats[labels[player.name]][3] += 1
+        before = [player.chips for player in players]
+        for name in play_hand(game, engines):
+            stats[labels[name]][4] += 1
+        for player, start in zip(players, before):
+            won = (player.chips - start) / big_blind
+            s = stats[labels[player.name]]
+            s[0] += 1
+            s[1] += won
+            s[2] += won * won
+    return stats
+
+
+def _run_task_args(args: tuple) -> dict:
+    return _run_task(*args)
+
+
+def _silence() -> None:
+    set_log_level("silent")
+
+
+def simulate(
+    seats: Sequence[Seat],
+    hands: int,
+    small_blind: int = 5,
+    big_blind: int = 10,
+    stack: int = 1000,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> SimulationResult:
+    """
+    Play hands hands between seats (2-8 (label, engine) pairs). workers=1
+    runs in this process; otherwise engines must be picklable.
+    """
+    if not 2 <= len(seats) <= 8:
+        raise ValueError("a table seats 2 to 8 players")
+    workers = workers or os.cpu_count() or 1
+    tasks = min(hands, workers * TASKS_PER_WORKER) if workers > 1 else 1
+    task_seeds = spawn_seeds(seed, tasks)
+    jobs = [
+        (tuple(seats), hands // tasks + (i < hands % tasks), small_blind, big_blind, stack, task_seed)
+        for i, task_seed in enumerate(task_seeds)
+    ]
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [_run_task_args(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_silence) as pool:
+            results = list(pool.map(_run_task_args, jobs))
+    seconds = time.perf_counter() - start
+
+    totals: Dict[str, List[float]] = {}
+    for stats in results:
+        for label, values in stats.items():
+            acc = totals.setdefault(label, [0, 0.0, 0.0, 0, 0])
+            for k, v in enumerate(values):
+                acc[k] += v
+
+    engines = []
+    for label, (n, total, squares, rebuys, invalid) in totals.items():
+        mean = total / n
+        variance = max(squares / n - mean * mean, 0.0) * n / max(n - 1, 1)
+        engines.append(EngineResult(label, n, 100 * mean, 100 * Z95 * math.sqrt(variance / n), rebuys, invalid))
+    engines.sort(key=lambda e: e.bb_per_100, reverse=True)
+    return SimulationResult(hands, seconds, hands / seconds if seconds else 0.0, engines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hands", type=int, default=10_000)
+    parser.add_argument("--engines", nargs="+", default=["heuristic", "random"], choices=sorted(ENGINES))
+    parser.add_argument("--small-blind", type=int, default=5)
+    parser.add_argument("--big-blind", type=int, default=10)
+    parser.add_argument("--stack", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="default: one per core")
+    args = parser.parse_args()
+
+    set_log_level("silent")
+    seats = [(name, ENGINES[name]()) for name in args.engines]
+    result = simulate(seats, args.hands, args.small_blind, args.big_blind, args.stack, args.seed, args.workers)
+    print(result.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,8 @@ from app.bot.heuristic_engine import (
     _current_strength,
     _potential,
 )
-from app.game_logic import Card, best_hand_from_cards
+from app.bot.preflop_table import hand_class, representative, preflop_equity, preflop_score
+from app.game_logic import Card, best_hand_from_cards, card_to_int
 
 # ---------------------------------------------------------------------------
 # Shared fixtures
@@ -217,6 +218,67 @@ class TestPotential:
         current = _current_strength(hole, board)
         assert _potential(hole, board, current) >= 0.0
 
+    def test_two_card_lookahead_sees_runner_runner(self):
+        # Backdoor flush + straight draw: only a turn+river runout completes it
+        hole  = [_parse_card("9 of spades"), _parse_card("8 of spades")]
+        board = [_parse_card(s) for s in ["7 of spades", "2 of hearts", "K of clubs"]]
+        current = _current_strength(hole, board)
+        one = _potential(hole, board, current, lookahead=1)
+        two = _potential(hole, board, current, lookahead=2)
+        assert two > one
+
+    def test_two_card_lookahead_on_turn_uses_one_card(self):
+        hole  = [_parse_card("A of spades"), _parse_card("K of spades")]
+        board = [_parse_card(s) for s in ["2 of spades", "7 of spades", "J of clubs", "3 of hearts"]]
+        current = _current_strength(hole, board)
+        assert _potential(hole, board, current, lookahead=2) == _potential(hole, board, current)
+
+    def test_two_card_lookahead_fits_bot_turn_budget(self):
+        import time
+        hole  = [_parse_card("A of spades"), _parse_card("K of spades")]
+        board = [_parse_card(s) for s in ["2 of spades", "7 of hearts", "J of clubs"]]
+        current = _current_strength(hole, board)
+        start = time.perf_counter()
+        _potential(hole, board, current, lookahead=2)
+        assert time.perf_counter() - start < 0.5
+
+
+# ---------------------------------------------------------------------------
+# preflop equity table
+# ---------------------------------------------------------------------------
+
+def cls_of(a: str, b: str) -> int:
+    return hand_class(card_to_int(a), card_to_int(b))
+
+class TestPreflopTable:
+    def test_169_distinct_classes(self):
+        classes = {hand_class(a, b) for a in range(52) for b in range(52) if a != b}
+        assert classes == set(range(169))
+
+    def test_representative_round_trip(self):
+        for cls in range(169):
+            assert hand_class(*representative(cls)) == cls
+
+    def test_suit_and_order_invariant(self):
+        assert cls_of("A of spades", "K of spades") == cls_of("K of hearts", "A of hearts")
+        assert cls_of("A of spades", "K of hearts") != cls_of("A of spades", "K of spades")
+
+    def test_ordering_heads_up(self):
+        aa = preflop_equity(card_to_int("A of spades"), card_to_int("A of hearts"), 2)
+        kk = preflop_equity(card_to_int("K of spades"), card_to_int("K of hearts"), 2)
+        junk = preflop_equity(card_to_int("7 of spades"), card_to_int("2 of hearts"), 2)
+        assert aa == pytest.approx(0.85, abs=0.01)
+        assert aa > kk > junk
+
+    def test_equity_drops_with_more_players(self):
+        aa = [preflop_equity(card_to_int("A of spades"), card_to_int("A of hearts"), n) for n in range(2, 9)]
+        assert aa == sorted(aa, reverse=True)
+
+    def test_score_normalised(self):
+        for n in range(2, 9):
+            assert preflop_score(card_to_int("A of spades"), card_to_int("A of hearts"), n) == pytest.approx(1.0)
+            assert 0.0 <= preflop_score(card_to_int("7 of spades"), card_to_int("2 of hearts"), n) < 0.1
+
 
 # ---------------------------------------------------------------------------
 # HeuristicDecisionEngine.decide
@@ -247,6 +309,26 @@ class TestHeuristicDecisionEngine:
         action, _ = self.engine.decide(FLOP_STATE_FLUSH_DRAW, STANDARD_ACTIONS)
         assert action in ("raise", "call", "check")
 
+    def test_flop_lookahead_two_scores_draw_higher(self):
+        one = HeuristicDecisionEngine(flop_lookahead=1)._compute_score(FLOP_STATE_FLUSH_DRAW)
+        two = HeuristicDecisionEngine(flop_lookahead=2)._compute_score(FLOP_STATE_FLUSH_DRAW)
+        assert two > one
+
+    def test_isomorphic_spots_score_identically(self):
+        hearts = {**FLOP_STATE_FLUSH_DRAW,
+                  "my_cards": ["A of hearts", "K of hearts"],
+                  "board": ["2 of hearts", "7 of hearts", "J of diamonds"]}
+        assert self.engine._compute_score(hearts) == self.engine._compute_score(FLOP_STATE_FLUSH_DRAW)
+
+    def test_preflop_equity_scorer(self):
+        engine = HeuristicDecisionEngine(preflop_equity=True)
+        players = [{"username": u, "chips": 500, "folded": False, "current_bet": 0} for u in "abc"]
+        aces = {"my_cards": ["A of spades", "A of hearts"], "board": [], "phase": "preflop", "players": players}
+        junk = {**aces, "my_cards": ["7 of spades", "2 of hearts"]}
+        assert engine._compute_score(aces) == pytest.approx(1.0)
+        assert engine._compute_score(junk) < 0.1
+        assert engine.decide(junk, FOLD_ONLY)[0] == "fold"
+
     def test_returns_valid_action(self):
         valid = {a["action"] for a in STANDARD_ACTIONS}
         action, _ = self.engine.decide(RIVER_STATE_TRIPS, STANDARD_ACTIONS)
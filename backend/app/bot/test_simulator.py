@@ -0,0 +1,102 @@
+"""
+Tests for the headless simulator (app/bot/simulator.py).
+
+Covers:
+  - play_hand: plays a hand to completion and conserves chips
+  - simulate: zero-sum results, pooled labels, seed reproducibility,
+    rebuys through set_chips, invalid actions, the process pool path, the
+    caller's random state left untouched
+"""
+import random
+
+import pytest
+
+from app.bot.decision_engine import DecisionEngine, RandomDecisionEngine
+from app.bot.heuristic_engine import HeuristicDecisionEngine
+from app.bot.simulator import play_hand, simulate
+from app.game_logic import Player, PokerRound
+
+
+class AlwaysRaiseTooSmall(DecisionEngine):
+    """Raises below the minimum whenever it can raise (always rejected)."""
+
+    def decide(self, game_state, available_actions):
+        for a in available_actions:
+            if a["min"]:
+                return a["action"], a["min"] - 1
+        return available_actions[0]["action"], None
+
+
+def chips_lost(result, big_blind=10):
+    """Chips that left the table; only the odd chips of split pots (dropped by Pot.award_pot) should."""
+    return -round(sum(e.bb_per_100 * e.hands for e in result.engines) / 100 * big_blind)
+
+
+class TestPlayHand:
+    def test_conserves_chips(self):
+        random.seed(4)
+        game = PokerRound([Player("a", 500), Player("b", 300), Player("c", 800)], 5, 10, seed=4)
+        engines = {name: RandomDecisionEngine() for name in "abc"}
+        for _ in range(20):
+            for p in game.table._seats:
+                p.chips = max(p.chips, 100)
+            before = sum(p.chips for p in game.table._seats)
+            play_hand(game, engines)
+            assert game.is_action_finished
+            # Split pots may drop odd chips, nothing else leaves the table
+            assert before - 3 <= sum(p.chips for p in game.table._seats) <= before
+
+
+class TestSimulate:
+    def test_zero_sum_and_pooled_labels(self):
+        seats = [("heuristic", HeuristicDecisionEngine()), ("random", RandomDecisionEngine()), ("random", RandomDecisionEngine())]
+        result = simulate(seats, hands=200, seed=7, workers=1)
+        assert result.hands == 200
+        assert {e.label: e.hands for e in result.engines} == {"heuristic": 200, "random": 400}
+        assert 0 <= chips_lost(result) < 10
+        assert all(e.ci95 > 0 for e in result.engines)
+        assert sum(e.rebuys for e in result.engines) > 0
+        assert "bb/100" in result.report()
+
+    def test_reproducible_for_a_seed(self):
+        seats = [("a", RandomDecisionEngine()), ("b", RandomDecisionEngine())]
+        first = simulate(seats, hands=150, seed=3, workers=1)
+        second = simulate(seats, hands=150, seed=3, workers=1)
+        assert [(e.label, e.bb_per_100) for e in first.engines] == [(e.label, e.bb_per_100) for e in second.engines]
+
+    def test_leaves_global_random_state_alone(self):
+        seats = [("a", RandomDecisionEngine()), ("b", RandomDecisionEngine())]
+        random.seed(11)
+        state = random.getstate()
+        simulate(seats, hands=30, seed=3, workers=1)
+        assert random.getstate() == state
+
+    def test_rebuys_go_through_set_chips(self, monkeypatch):
+        seats = [("a", RandomDecisionEngine()), ("b", RandomDecisionEngine())]
+        calls = []
+        set_chips = PokerRound.set_chips
+
+        def spy(game, player, chips):
+            calls.append(chips)
+            set_chips(game, player, chips)
+
+        monkeypatch.setattr(PokerRound, "set_chips", spy)
+        result = simulate(seats, hands=200, stack=100, seed=7, workers=1)
+        assert calls and set(calls) == {100}
+        assert len(calls) == sum(e.rebuys for e in result.engines)
+
+    def test_invalid_actions_fold(self):
+        seats = [("bad", AlwaysRaiseTooSmall()), ("random", RandomDecisionEngine())]
+        result = simulate(seats, hands=50, seed=1, workers=1)
+        invalid = {e.label: e.invalid_actions for e in result.engines}
+        assert invalid["bad"] > 0 and invalid["random"] == 0
+
+    def test_process_pool(self):
+        seats = [("heuristic", HeuristicDecisionEngine()), ("random", RandomDecisionEngine())]
+        result = simulate(seats, hands=40, seed=2, workers=2)
+        assert sum(e.hands for e in result.engines) == 80
+        assert 0 <= chips_lost(result) < 10
+
+    def test_table_size(self):
+        with pytest.raises(ValueError):
+            simulate([("solo", RandomDecisionEngine())], hands=1, workers=1)
@@ -3,13 +3,18 @@ from flask_jwt_extended import JWTManager
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_caching import Cache
+from app.payloads import SocketJSON
+from app.timer.scheduler import Scheduler
 import os
 
 jwt = JWTManager()
 if os.getenv("FLASK_ENV") == "production":
-    socketio = SocketIO(cors_allowed_origins=["https://poker.soljt.ch", "https://www.poker.soljt.ch"], async_mode="eventlet")
+    socketio = SocketIO(cors_allowed_origins=["https://poker.soljt.ch", "https://www.poker.soljt.ch"], async_mode="eventlet", json=SocketJSON)
 else:
-    socketio = SocketIO(cors_allowed_origins="*")
+    socketio = SocketIO(cors_allowed_origins="*", json=SocketJSON)
+
+# kick deadlines, inter-hand delays and bot wake-ups for every table
+scheduler = Scheduler(spawn=socketio.start_background_task)
 
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "")
 REDIS_HOST = os.getenv("CACHE_REDIS_HOST", "localhost")
@@ -1,7 +1,8 @@
-from flask import jsonify, request
+from flask import current_app, jsonify, request
 from flask_jwt_extended import current_user, jwt_required
 from app.game import game
 import app.state as state
+from app.payloads import join_objects
 
 @game.route("/state", methods=["GET"])
 @jwt_required()
@@ -18,16 +19,16 @@ def get_game_state():
     if not username in state.get_players(game_id):
         return jsonify({"error": f"Could not find user {username} in player list for game_id {game_id}."})
     
-    response = state.get_game(game_id).serialize_for_player(username)
     try:
-        response = jsonify(response)
+        seq, state_json = state.get_state_sync(game_id).encoded_state(state.get_game(game_id), username)
+        response = join_objects(state_json, f'{{"seq":{seq}}}')
     except Exception as e:
         print("\n\nERROR FROM GET GAME STATE")
         print(e)
         print("\n\n")
-        return jsonify({"error", "not serializeable"})
+        return jsonify({"error": "not serializeable"})
     
-    return response
+    return current_app.response_class(response, mimetype="application/json")
 
 @game.route("/host", methods=["GET"])
 @jwt_required()
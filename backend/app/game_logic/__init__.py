@@ -3,12 +3,18 @@ Re-exports all public symbols from the game_logic package so that
 external modules can continue to import from app.game_logic directly.
 """
 from app.game_logic.enums import Rank, Suit, Action, Phase, HandRank
-from app.game_logic.card import Card, Deck
+from app.game_logic.log import configure as configure_logging, set_level as set_log_level
+from app.game_logic.rng import make_rng, spawn_generators, spawn_seeds
+from app.game_logic.card import ALL_CARDS, Card, Deck, card_to_int, int_to_card, int_to_str
 from app.game_logic.hand import Hand, best_hand_from_cards
+from app.game_logic.backend import BACKEND as EVALUATOR_BACKEND, evaluate_batch
+from app.game_logic.evaluator import encode_hands
+from app.game_logic.equity import EquityResult, calculate_equity, calculate_equity_vs_random
+from app.game_logic.canonical import canonical_key, cached_strength, cached_equity
 from app.game_logic.player import Player
 from app.game_logic.table import Table
-from app.game_logic.pot import Pot, PotCollection
-from app.game_logic.poker_round import PokerRound
+from app.game_logic.pot import Pot, PotCollection, PotLedger
+from app.game_logic.poker_round import ActionOption, PokerRound
 from app.game_logic.exceptions import (
     InvalidActionError,
     InvalidAmountError,
@@ -18,11 +24,15 @@ from app.game_logic.exceptions import (
 
 __all__ = [
     "Rank", "Suit", "Action", "Phase", "HandRank",
-    "Card", "Deck",
-    "Hand", "best_hand_from_cards",
+    "configure_logging", "set_log_level",
+    "make_rng", "spawn_generators", "spawn_seeds",
+    "ALL_CARDS", "Card", "Deck", "card_to_int", "int_to_card", "int_to_str",
+    "Hand", "best_hand_from_cards", "EVALUATOR_BACKEND", "evaluate_batch", "encode_hands",
+    "EquityResult", "calculate_equity", "calculate_equity_vs_random",
+    "canonical_key", "cached_strength", "cached_equity",
     "Player",
     "Table",
-    "Pot", "PotCollection",
-    "PokerRound",
+    "Pot", "PotCollection", "PotLedger",
+    "ActionOption", "PokerRound",
     "InvalidActionError", "InvalidAmountError", "NotPlayersTurnError", "TooManyPlayersError",
 ]
@@ -0,0 +1,58 @@
+"""
+Evaluator backend selection.
+
+The backend is chosen once, at import:
+  - "numba":  JIT-compiled evaluate() / evaluate_batch() (evaluator_numba.py),
+              used when numba is installed
+  - "python": the pure-Python / NumPy evaluator in evaluator.py, which is
+              always available and is the reference for parity tests
+
+Set POKER_EVAL_BACKEND=python or =numba to force one; forcing numba when it
+is not installed raises ImportError. Both backends return identical
+strengths, so callers can switch freely.
+"""
+from __future__ import annotations
+import os
+from typing import Callable, Dict, Iterable, Tuple
+
+import numpy as np
+
+from app.game_logic import evaluator
+
+EvaluateFn = Callable[[Iterable[int]], int]
+BatchFn = Callable[[np.ndarray], np.ndarray]
+
+BACKENDS = ("numba", "python")
+
+
+def load_backend(name: str) -> Tuple[EvaluateFn, BatchFn]:
+    """(evaluate, evaluate_batch) for a backend; ImportError if it is unavailable."""
+    if name == "python":
+        return evaluator.evaluate, evaluator.evaluate_batch
+    if name == "numba":
+        from app.game_logic import evaluator_numba
+
+        return evaluator_numba.evaluate, evaluator_numba.evaluate_batch
+    raise ValueError(f"unknown evaluator backend {name!r}, expected one of {BACKENDS}")
+
+
+def available_backends() -> Dict[str, Tuple[EvaluateFn, BatchFn]]:
+    backends = {}
+    for name in BACKENDS:
+        try:
+            backends[name] = load_backend(name)
+        except ImportError:
+            pass
+    return backends
+
+
+def _select() -> str:
+    forced = os.getenv("POKER_EVAL_BACKEND")
+    if forced:
+        load_backend(forced)
+        return forced
+    return next(iter(available_backends()))
+
+
+BACKEND = _select()
+evaluate, evaluate_batch = load_backend(BACKEND)
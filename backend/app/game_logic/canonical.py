@@ -0,0 +1,98 @@
+"""
+Suit-isomorphism canonicalisation and bounded caches built on it.
+
+Two spots that differ only by a relabelling of suits (A♠K♠ on 2♠7♠J♣ vs
+A♥K♥ on 2♥7♥J♦) have the same hand strengths and equities. canonical_key()
+maps card groups (hole cards, board, dead cards, other players' holes) to
+a key that is equal for exactly those spots: for each suit it records the
+13-bit rank mask of every group, and the four per-suit signatures are
+sorted, which erases the suit labels.
+
+The cached_* helpers key functools.lru_cache on that canonical form, so
+repeat evaluations across hands and tables become dict hits. Evaluating a
+single 7-card strength is about as cheap as building the key, so caching
+pays off for the costly calls: bot potential and equity.
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from app.game_logic.card import card_to_int
+from app.game_logic.equity import DEFAULT_ITERATIONS, EXACT_THRESHOLD, EquityResult, calculate_equity
+from app.game_logic.backend import evaluate
+
+CanonicalKey = Tuple[Tuple[int, ...], ...]
+
+STRENGTH_CACHE_SIZE = 1 << 16
+EQUITY_CACHE_SIZE = 4096
+
+
+def canonical_key(*groups: Iterable[int]) -> CanonicalKey:
+    """Canonical key for integer-encoded card groups, invariant under suit permutation."""
+    signatures = [[0] * len(groups) for _ in range(4)]
+    for g, cards in enumerate(groups):
+        for c in cards:
+            signatures[c & 3][g] |= 1 << (c >> 2)
+    return tuple(sorted(map(tuple, signatures), reverse=True))
+
+
+def canonical_cards(key: CanonicalKey) -> List[List[int]]:
+    """A representative of the key's class: the card groups, with suits 0–3 in key order."""
+    groups: List[List[int]] = [[] for _ in key[0]]
+    for suit, signature in enumerate(key):
+        for g, mask in enumerate(signature):
+            rank = 0
+            while mask:
+                if mask & 1:
+                    groups[g].append(rank * 4 + suit)
+                mask >>= 1
+                rank += 1
+    return groups
+
+
+@lru_cache(maxsize=STRENGTH_CACHE_SIZE)
+def _strength(key: CanonicalKey) -> int:
+    hole, board = canonical_cards(key)
+    return evaluate(hole + board)
+
+
+def cached_strength(hole: Iterable[int], board: Iterable[int]) -> int:
+    """evaluate(hole + board) through the canonical cache."""
+    return _strength(canonical_key(hole, board))
+
+
+@lru_cache(maxsize=EQUITY_CACHE_SIZE)
+def _equity(key: CanonicalKey, players: int, iterations: int, seed: Optional[int], exact_threshold: int) -> EquityResult:
+    groups = canonical_cards(key)
+    return calculate_equity(
+        groups[:players], board=groups[players], dead=groups[players + 1],
+        iterations=iterations, seed=seed, exact_threshold=exact_threshold,
+    )
+
+
+def cached_equity(
+    hole_cards: Sequence[Sequence],
+    board: Iterable = (),
+    dead: Iterable = (),
+    iterations: int = DEFAULT_ITERATIONS,
+    seed: Optional[int] = None,
+    exact_threshold: int = EXACT_THRESHOLD,
+) -> EquityResult:
+    """
+    calculate_equity() through the canonical cache. Player order is kept in
+    the key. A Monte Carlo result is cached as-is, so with seed=None later
+    hits return the first estimate rather than a fresh sample.
+    """
+    groups = [[c if isinstance(c, int) else card_to_int(c) for c in hand] for hand in hole_cards]
+    groups.append([c if isinstance(c, int) else card_to_int(c) for c in board])
+    groups.append([c if isinstance(c, int) else card_to_int(c) for c in dead])
+    return _equity(canonical_key(*groups), len(hole_cards), iterations, seed, exact_threshold)
+
+
+def cache_info() -> dict:
+    return {"strength": _strength.cache_info(), "equity": _equity.cache_info()}
+
+
+def clear_caches() -> None:
+    _strength.cache_clear()
+    _equity.cache_clear()
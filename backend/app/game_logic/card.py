@@ -1,9 +1,21 @@
 from __future__ import annotations
-import random
 from dataclasses import dataclass
-from typing import ClassVar, List
+from typing import ClassVar, Dict, Iterator, List, Optional, Tuple, Union
 
 from app.game_logic.enums import Rank, Suit
+from app.game_logic.rng import Rng, randbelow
+
+
+# ── integer encoding ─────────────────────────────────────────────────────────
+# A card is encoded as rank_index * 4 + suit_index (0–51), where rank_index
+# follows Card.RANKS (2 → 0 … A → 12) and suit_index follows Card.SUITS.
+# rank_index is therefore card_int >> 2 and suit_index is card_int & 3.
+
+RANK_INDEX: Dict[Rank, int] = {rank: i for i, rank in enumerate(Rank)}
+SUIT_INDEX: Dict[Suit, int] = {suit: i for i, suit in enumerate(Suit)}
+
+CARD_STRS: Tuple[str, ...] = tuple(f"{rank} of {suit}" for rank in Rank for suit in Suit)
+_INT_BY_STR: Dict[str, int] = {s: i for i, s in enumerate(CARD_STRS)}
 
 
 @dataclass(frozen=True)
@@ -21,23 +33,135 @@ class Card:
             object.__setattr__(self, "rank", Rank(self.rank))
         if not isinstance(self.suit, Suit):
             object.__setattr__(self, "suit", Suit(self.suit))
+        # Cache the integer encoding; not a dataclass field, so eq/hash are unaffected
+        object.__setattr__(self, "_int", RANK_INDEX[self.rank] * 4 + SUIT_INDEX[self.suit])
 
     def __lt__(self, other: Card) -> bool:
-        return Card.RANKS.index(self.rank) < Card.RANKS.index(other.rank)
+        return self._int >> 2 < other._int >> 2
 
     def __repr__(self) -> str:
         return f"{self.rank} of {self.suit}"
 
+    def to_int(self) -> int:
+        return self._int
+
+    @classmethod
+    def from_int(cls, card_int: int) -> Card:
+        return ALL_CARDS[card_int]
+
+    @classmethod
+    def from_str(cls, card_str: str) -> Card:
+        """Parse the "A of spades" form produced by repr()."""
+        return ALL_CARDS[_INT_BY_STR[card_str]]
+
+
+# One shared instance per card, indexed by integer encoding
+ALL_CARDS: Tuple[Card, ...] = tuple(Card(rank, suit) for rank in Rank for suit in Suit)
+
+
+def card_to_int(card: Union[Card, str]) -> int:
+    """Encode a Card or an "A of spades" string as an int in 0–51."""
+    if isinstance(card, Card):
+        return card._int
+    return _INT_BY_STR[card]
+
+
+def int_to_card(card_int: int) -> Card:
+    return ALL_CARDS[card_int]
+
+
+def int_to_str(card_int: int) -> str:
+    return CARD_STRS[card_int]
+
+
+FULL_DECK_MASK = (1 << 52) - 1
+_IDENTITY = range(52)
+
 
 class Deck:
-    def __init__(self) -> None:
-        self.cards: List[Card] = [Card(rank, suit) for rank in Rank for suit in Suit]
-        random.shuffle(self.cards)
+    """
+    52 integer-encoded cards in a preallocated array, dealt by partial
+    Fisher–Yates: each deal swaps a random undealt card to the end of the
+    live region and shrinks it, so no full shuffle is needed. A bitmask of
+    undealt cards gives O(1) membership, and _pos gives O(1) removal of
+    known (dead) cards. reset() restores all 52 cards in place.
+
+    rng may be a random.Random (including SystemRandom), a numpy Generator
+    or None for the global random module. reset() also restores the card
+    order, so the deal is a pure function of the rng state: a deck reset
+    with an equally seeded rng deals the same cards.
+    """
+
+    def __init__(self, rng: Optional[Rng] = None) -> None:
+        self._cards: List[int] = list(range(52))
+        self._pos: List[int] = list(range(52))   # card -> index in _cards
+        self._size = 52                            # _cards[:_size] are undealt
+        self.mask = FULL_DECK_MASK                 # bit c set while card c is undealt
+        self.rng = rng
+
+    @property
+    def rng(self) -> Optional[Rng]:
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: Optional[Rng]) -> None:
+        self._rng = rng
+        self._randbelow = randbelow(rng)
+
+    def reset(self, rng: Optional[Rng] = None) -> None:
+        """Return every card to the deck, optionally switching to a new rng."""
+        self._cards[:] = _IDENTITY
+        self._pos[:] = _IDENTITY
+        self._size = 52
+        self.mask = FULL_DECK_MASK
+        if rng is not None:
+            self.rng = rng
+
+    def _take(self, idx: int) -> int:
+        """Swap _cards[idx] to the end of the live region and drop it."""
+        last = self._size - 1
+        card, moved = self._cards[idx], self._cards[last]
+        self._cards[idx], self._cards[last] = moved, card
+        self._pos[moved], self._pos[card] = idx, last
+        self._size = last
+        self.mask &= ~(1 << card)
+        return card
+
+    def deal_ints(self, hand_size: int) -> List[int]:
+        """Deal like deal(), but return integer-encoded cards."""
+        if self._size < hand_size:
+            raise Exception("DECK EMPTY")
+        randbelow_ = self._randbelow
+        return [self._take(randbelow_(self._size)) for _ in range(hand_size)]
 
     def deal(self, hand_size: int) -> List[Card]:
-        if len(self.cards) >= hand_size:
-            return [self.cards.pop() for _ in range(hand_size)]
-        raise Exception("DECK EMPTY")
+        return [ALL_CARDS[c] for c in self.deal_ints(hand_size)]
+
+    def remove(self, card: Union[Card, str, int]) -> None:
+        """Take a known card out of the deck, e.g. dead cards for equity."""
+        c = card if isinstance(card, int) else card_to_int(card)
+        if not self.mask >> c & 1:
+            raise ValueError(f"{int_to_str(c)} is not in the deck")
+        self._take(self._pos[c])
+
+    def __contains__(self, card: Union[Card, str, int]) -> bool:
+        c = card if isinstance(card, int) else card_to_int(card)
+        return bool(self.mask >> c & 1)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[int]:
+        """Undealt cards as ints, in ascending order."""
+        mask = self.mask
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    @property
+    def cards(self) -> List[Card]:
+        return [ALL_CARDS[c] for c in self]
 
     def __repr__(self) -> str:
         return f"{', '.join(map(str, self.cards))}"
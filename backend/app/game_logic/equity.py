@@ -0,0 +1,208 @@
+"""
+All-in equity for 2–8 known hands on a partial board.
+
+Runouts are enumerated exhaustively when there are few enough of them
+(flop/turn/river, or small preflop spots with many dead cards); otherwise
+they are sampled with a seeded Monte Carlo, in chunks, until an iteration
+or wall-clock budget is used up. Every runout is scored for all players at
+once with evaluate_batch().
+"""
+from __future__ import annotations
+import itertools
+import math
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from app.game_logic.card import Card, Deck, card_to_int
+from app.game_logic.backend import evaluate_batch
+
+CardLike = Union[Card, str, int]
+
+MIN_PLAYERS = 2
+MAX_PLAYERS = 8
+DEFAULT_ITERATIONS = 20_000
+EXACT_THRESHOLD = 50_000  # enumerate when C(remaining, missing) is at most this
+CHUNK_SIZE = 4_096
+Z_95 = 1.96
+
+
+@dataclass(frozen=True)
+class EquityResult:
+    """Immutable throughout (tuples), so a cached result can be shared by every caller."""
+    win: Tuple[float, ...]       # P(sole best hand), per player
+    tie: Tuple[float, ...]       # P(sharing the best hand), per player
+    equity: Tuple[float, ...]    # expected pot share: win + tie split shares
+    ci95: Tuple[float, ...]      # half-width of the 95% interval on equity (0 when exact)
+    samples: int           # runouts evaluated
+    exact: bool            # True when every runout was enumerated
+
+
+def _to_int(card: CardLike) -> int:
+    return card if isinstance(card, int) else card_to_int(card)
+
+
+def _remaining(known: List[int], duplicate_msg: str) -> np.ndarray:
+    """The cards not in known, ascending; raises ValueError if known repeats a card."""
+    deck = Deck()
+    for c in known:
+        if c not in deck:
+            raise ValueError(duplicate_msg)
+        deck.remove(c)
+    return np.fromiter(deck, dtype=np.int64, count=len(deck))
+
+
+def _score(holes: Sequence[np.ndarray], board: np.ndarray, runouts: np.ndarray) -> np.ndarray:
+    """
+    Return each player's pot share for every runout, shape (players, R).
+    Each hole is a fixed (2,) pair or an (R, 2) array of per-runout pairs.
+    """
+    n = runouts.shape[0]
+    full_board = np.hstack([np.broadcast_to(board, (n, board.size)), runouts])
+    strengths = np.stack([
+        evaluate_batch(np.hstack([np.broadcast_to(hole, (n, 2)), full_board]))
+        for hole in holes
+    ])
+    winners = strengths == strengths.max(axis=0)
+    return winners / winners.sum(axis=0)
+
+
+def _sample(rng: np.random.Generator, deck: np.ndarray, rows: int, k: int) -> np.ndarray:
+    """Draw k distinct cards from deck for each of rows runouts."""
+    # Partial shuffle per row: the first k columns of a random permutation
+    return deck[np.argsort(rng.random((rows, deck.size)), axis=1)[:, :k]]
+
+
+class _Tally:
+    """Running per-player sums over scored runouts."""
+
+    def __init__(self, players: int) -> None:
+        self.wins = np.zeros(players)
+        self.ties = np.zeros(players)
+        self.shares = np.zeros(players)
+        self.shares_sq = np.zeros(players)
+        self.samples = 0
+
+    def add(self, shares: np.ndarray) -> None:
+        self.wins += (shares == 1.0).sum(axis=1)
+        self.ties += ((shares > 0.0) & (shares < 1.0)).sum(axis=1)
+        self.shares += shares.sum(axis=1)
+        self.shares_sq += (shares ** 2).sum(axis=1)
+        self.samples += shares.shape[1]
+
+    def result(self, exact: bool) -> EquityResult:
+        n = self.samples
+        equity = self.shares / n
+        if exact:
+            ci95 = np.zeros_like(equity)
+        else:
+            variance = np.maximum(self.shares_sq / n - equity ** 2, 0.0)
+            ci95 = Z_95 * np.sqrt(variance / n)
+        return EquityResult(
+            win=tuple((self.wins / n).tolist()),
+            tie=tuple((self.ties / n).tolist()),
+            equity=tuple(equity.tolist()),
+            ci95=tuple(ci95.tolist()),
+            samples=n,
+            exact=exact,
+        )
+
+
+def calculate_equity(
+    hole_cards: Sequence[Sequence[CardLike]],
+    board: Iterable[CardLike] = (),
+    dead: Iterable[CardLike] = (),
+    iterations: int = DEFAULT_ITERATIONS,
+    time_budget: Optional[float] = None,
+    seed: Optional[int] = None,
+    exact_threshold: int = EXACT_THRESHOLD,
+    rng: Optional[np.random.Generator] = None,
+) -> EquityResult:
+    """
+    Compute win/tie probabilities for each hand in hole_cards.
+
+    Cards may be Card objects, "A of spades" strings or ints. time_budget
+    (seconds) caps Monte Carlo wall time; sampling stops at whichever of
+    iterations / time_budget is reached first, after at least one chunk.
+    rng, if given, is used instead of a Generator seeded from seed, so a
+    simulation worker can pass its own stream (see rng.spawn_generators).
+    """
+    holes = np.array([[_to_int(c) for c in hand] for hand in hole_cards], dtype=np.int64)
+    board_ints = np.array([_to_int(c) for c in board], dtype=np.int64)
+    dead_ints = [_to_int(c) for c in dead]
+
+    if not MIN_PLAYERS <= len(holes) <= MAX_PLAYERS:
+        raise ValueError(f"need {MIN_PLAYERS}-{MAX_PLAYERS} hands, got {len(holes)}")
+    if holes.shape[1:] != (2,):
+        raise ValueError("every hand needs exactly two hole cards")
+    if board_ints.size > 5:
+        raise ValueError(f"board has {board_ints.size} cards")
+    if iterations < 1:
+        raise ValueError(f"iterations must be at least 1, got {iterations}")
+    known = holes.ravel().tolist() + board_ints.tolist() + dead_ints
+    remaining = _remaining(known, "duplicate card among hands, board and dead cards")
+    missing = 5 - board_ints.size
+    tally = _Tally(len(holes))
+
+    exact = math.comb(remaining.size, missing) <= exact_threshold
+    if exact:
+        runouts = np.array(list(itertools.combinations(remaining.tolist(), missing)), dtype=np.int64)
+        tally.add(_score(holes, board_ints, runouts))
+        return tally.result(exact=True)
+
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+    while tally.samples < iterations:
+        chunk = min(CHUNK_SIZE, iterations - tally.samples)
+        tally.add(_score(holes, board_ints, _sample(rng, remaining, chunk, missing)))
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+    return tally.result(exact=False)
+
+
+def calculate_equity_vs_random(
+    hole_cards: Sequence[CardLike],
+    num_opponents: int,
+    board: Iterable[CardLike] = (),
+    dead: Iterable[CardLike] = (),
+    iterations: int = DEFAULT_ITERATIONS,
+    time_budget: Optional[float] = None,
+    seed: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> EquityResult:
+    """
+    Monte Carlo equity of one known hand against num_opponents uniformly
+    random hands. The result tuples hold a single entry, for hole_cards.
+    rng overrides seed as in calculate_equity().
+    """
+    hole = np.array([_to_int(c) for c in hole_cards], dtype=np.int64)
+    board_ints = np.array([_to_int(c) for c in board], dtype=np.int64)
+    dead_ints = [_to_int(c) for c in dead]
+
+    if not MIN_PLAYERS <= num_opponents + 1 <= MAX_PLAYERS:
+        raise ValueError(f"need 1-{MAX_PLAYERS - 1} opponents, got {num_opponents}")
+    if hole.shape != (2,):
+        raise ValueError("hand needs exactly two hole cards")
+    if board_ints.size > 5:
+        raise ValueError(f"board has {board_ints.size} cards")
+    if iterations < 1:
+        raise ValueError(f"iterations must be at least 1, got {iterations}")
+    known = hole.tolist() + board_ints.tolist() + dead_ints
+    remaining = _remaining(known, "duplicate card among hand, board and dead cards")
+    missing = 5 - board_ints.size
+    tally = _Tally(1)
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+    while tally.samples < iterations:
+        chunk = min(CHUNK_SIZE, iterations - tally.samples)
+        picks = _sample(rng, remaining, chunk, 2 * num_opponents + missing)
+        opponents = [picks[:, 2 * i: 2 * i + 2] for i in range(num_opponents)]
+        shares = _score([hole] + opponents, board_ints, picks[:, 2 * num_opponents:])
+        tally.add(shares[:1])
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+    return tally.result(exact=False)
@@ -0,0 +1,299 @@
+"""
+Table-driven hand evaluator over integer-encoded cards (see card.py).
+
+evaluate() scores a 5-, 6- or 7-card set in a single pass and returns one
+comparable integer strength:
+
+    hand_rank << 20 | t0 << 16 | t1 << 12 | t2 << 8 | t3 << 4 | t4
+
+where t0… are the Hand.card_ranks tiebreakers, left-aligned in 4-bit
+nibbles. Comparing two strengths as ints gives the same result as comparing
+the equivalent Hand objects.
+
+Cards are folded into 13-bit rank masks (one per suit, plus masks of ranks
+seen at least 1/2/3/4 times); everything else is a lookup into tables
+indexed by those masks. evaluate_batch() applies the same tables to an
+(N, k) array of cards with NumPy, for bulk work (equity, bot lookahead,
+offline analysis of recorded hands).
+"""
+from __future__ import annotations
+from typing import Iterable, List, Tuple, Union
+
+import numpy as np
+
+from app.game_logic.enums import HandRank
+
+RANK_SHIFT = 20
+TIEBREAK_BITS = 4
+MAX_TIEBREAKS = RANK_SHIFT // TIEBREAK_BITS
+
+# Number of tiebreakers Hand.evaluate() produces for each category
+TIEBREAK_LEN = {
+    HandRank.HIGH_CARD: 5,
+    HandRank.PAIR: 4,
+    HandRank.TWO_PAIR: 3,
+    HandRank.TRIPS: 3,
+    HandRank.STRAIGHT: 1,
+    HandRank.FLUSH: 1,
+    HandRank.FULL_HOUSE: 2,
+    HandRank.QUADS: 2,
+    HandRank.STRAIGHT_FLUSH: 1,
+    HandRank.ROYAL_FLUSH: 0,
+}
+
+_HIGH_CARD = HandRank.HIGH_CARD << RANK_SHIFT
+_PAIR = HandRank.PAIR << RANK_SHIFT
+_TWO_PAIR = HandRank.TWO_PAIR << RANK_SHIFT
+_TRIPS = HandRank.TRIPS << RANK_SHIFT
+_STRAIGHT = HandRank.STRAIGHT << RANK_SHIFT
+_FLUSH = HandRank.FLUSH << RANK_SHIFT
+_FULL_HOUSE = HandRank.FULL_HOUSE << RANK_SHIFT
+_QUADS = HandRank.QUADS << RANK_SHIFT
+_STRAIGHT_FLUSH = HandRank.STRAIGHT_FLUSH << RANK_SHIFT
+_ROYAL_FLUSH = HandRank.ROYAL_FLUSH << RANK_SHIFT
+
+
+def pack_strength(hand_rank: int, card_ranks: List[int]) -> int:
+    """
+    Pack (hand_rank, card_ranks) into a single comparable int. Only the
+    first five tiebreakers fit; a Hand over more than five cards (e.g. seven
+    unpaired cards) lists further kickers, which never decide a showdown.
+    """
+    strength = hand_rank << RANK_SHIFT
+    shift = RANK_SHIFT - TIEBREAK_BITS
+    for r in card_ranks[:MAX_TIEBREAKS]:
+        strength |= r << shift
+        shift -= TIEBREAK_BITS
+    return strength
+
+
+def unpack_strength(strength: int) -> Tuple[HandRank, List[int]]:
+    """Inverse of pack_strength()."""
+    hand_rank = HandRank(strength >> RANK_SHIFT)
+    card_ranks = [
+        (strength >> (RANK_SHIFT - TIEBREAK_BITS * (i + 1))) & 0xF
+        for i in range(TIEBREAK_LEN[hand_rank])
+    ]
+    return hand_rank, card_ranks
+
+
+# ── lookup tables (indexed by 13-bit rank mask) ──────────────────────────────
+
+def _build_tables() -> Tuple[List[int], List[int], List[int], List[int]]:
+    popcount = [0] * 8192
+    top = [-1] * 8192
+    top5 = [0] * 8192       # up to five highest ranks, packed like tiebreakers
+    straight_top = [-1] * 8192
+
+    straights = [(0b11111 << low, low + 4) for low in range(8, -1, -1)]
+    straights.append((0b1000000001111, 3))  # wheel: A-2-3-4-5 plays as 5-high
+
+    for mask in range(1, 8192):
+        ranks = [r for r in range(12, -1, -1) if mask >> r & 1]
+        popcount[mask] = len(ranks)
+        top[mask] = ranks[0]
+        top5[mask] = pack_strength(0, ranks[:5])
+        for pattern, high in straights:
+            if mask & pattern == pattern:
+                straight_top[mask] = high
+                break
+    return popcount, top, top5, straight_top
+
+
+POPCOUNT, TOP_RANK, TOP5_PACKED, STRAIGHT_TOP = _build_tables()
+
+
+# (suit_masks, seen1, seen2, seen3, seen4) as taken by evaluate_masks()
+Masks = Tuple[Tuple[int, int, int, int], int, int, int, int]
+EMPTY_MASKS: Masks = ((0, 0, 0, 0), 0, 0, 0, 0)
+
+
+def add_cards(masks: Masks, cards: Iterable[int]) -> Masks:
+    """Return a copy of masks with cards folded in, for incremental scoring."""
+    suit_masks, seen1, seen2, seen3, seen4 = masks
+    suit_masks = list(suit_masks)
+    for c in cards:
+        bit = 1 << (c >> 2)
+        suit_masks[c & 3] |= bit
+        seen4 |= seen3 & bit
+        seen3 |= seen2 & bit
+        seen2 |= seen1 & bit
+        seen1 |= bit
+    return tuple(suit_masks), seen1, seen2, seen3, seen4
+
+
+class HandState:
+    """
+    Masks for a set of cards that only grows: hole cards, then each street.
+    add() folds in just the new cards, so scoring on the turn and river
+    pays for one card rather than re-evaluating hole + board from scratch.
+    """
+
+    __slots__ = ("masks", "num_cards")
+
+    def __init__(self, cards: Iterable[int] = ()) -> None:
+        cards = list(cards)
+        self.masks: Masks = add_cards(EMPTY_MASKS, cards)
+        self.num_cards = len(cards)
+
+    def add(self, cards: Iterable[int]) -> None:
+        cards = list(cards)
+        self.masks = add_cards(self.masks, cards)
+        self.num_cards += len(cards)
+
+    def with_cards(self, cards: Iterable[int]) -> Masks:
+        """Masks with cards added, leaving this state unchanged (for lookahead)."""
+        return add_cards(self.masks, cards)
+
+    def strength(self) -> int:
+        """evaluate() of the cards so far; needs at least five."""
+        return evaluate_masks(*self.masks)
+
+
+def evaluate(cards: Iterable[int]) -> int:
+    """Strength of the best 5-card hand in 5–7 integer-encoded cards."""
+    suit_masks = [0, 0, 0, 0]
+    seen1 = seen2 = seen3 = seen4 = 0
+    for c in cards:
+        bit = 1 << (c >> 2)
+        suit_masks[c & 3] |= bit
+        seen4 |= seen3 & bit
+        seen3 |= seen2 & bit
+        seen2 |= seen1 & bit
+        seen1 |= bit
+    return evaluate_masks(suit_masks, seen1, seen2, seen3, seen4)
+
+
+def evaluate_masks(suit_masks: List[int], seen1: int, seen2: int, seen3: int, seen4: int) -> int:
+    """
+    Score precomputed masks: one rank mask per suit, and masks of the ranks
+    held at least once, twice, three and four times.
+    """
+    # With 7 or fewer cards a flush excludes quads and full houses
+    for suit_mask in suit_masks:
+        if POPCOUNT[suit_mask] >= 5:
+            high = STRAIGHT_TOP[suit_mask]
+            if high == 12:
+                return _ROYAL_FLUSH
+            if high >= 0:
+                return _STRAIGHT_FLUSH | high << 16
+            return _FLUSH | TOP_RANK[suit_mask] << 16
+
+    if seen4:
+        quads = TOP_RANK[seen4]
+        return _QUADS | quads << 16 | TOP_RANK[seen1 & ~(1 << quads)] << 12
+
+    if seen3:
+        trips = TOP_RANK[seen3]
+        pairs = seen2 & ~(1 << trips)
+        if pairs:
+            return _FULL_HOUSE | trips << 16 | TOP_RANK[pairs] << 12
+
+    high = STRAIGHT_TOP[seen1]
+    if high >= 0:
+        return _STRAIGHT | high << 16
+
+    if seen3:
+        return _TRIPS | trips << 16 | (TOP5_PACKED[seen1 & ~(1 << trips)] >> 4) & 0xFF00
+
+    if seen2:
+        high_pair = TOP_RANK[seen2]
+        rest = seen2 & ~(1 << high_pair)
+        if rest:
+            low_pair = TOP_RANK[rest]
+            kicker = TOP_RANK[seen1 & ~(1 << high_pair | 1 << low_pair)]
+            return _TWO_PAIR | high_pair << 16 | low_pair << 12 | kicker << 8
+        return _PAIR | high_pair << 16 | (TOP5_PACKED[seen1 & ~(1 << high_pair)] >> 4) & 0xFFF0
+
+    return _HIGH_CARD | TOP5_PACKED[seen1]
+
+
+# ── NumPy batch evaluation ───────────────────────────────────────────────────
+
+_NP_POPCOUNT = np.array(POPCOUNT, dtype=np.int64)
+_NP_STRAIGHT_TOP = np.array(STRAIGHT_TOP, dtype=np.int64)
+_NP_TOP5_PACKED = np.array(TOP5_PACKED, dtype=np.int64)
+# TOP_RANK[0] is -1; rows that hit it are discarded by np.select, but clamp
+# it to 0 so it is still a valid shift count while computing them
+_NP_TOP_RANK = np.maximum(np.array(TOP_RANK, dtype=np.int64), 0)
+
+
+def evaluate_batch(cards: np.ndarray) -> np.ndarray:
+    """
+    Vectorised evaluate(): take an (N, k) array of integer-encoded cards,
+    5 <= k <= 7, and return an (N,) int64 array of strengths.
+    """
+    cards = np.asarray(cards, dtype=np.int64)
+    if cards.ndim != 2 or not 5 <= cards.shape[1] <= 7:
+        raise ValueError(f"expected an (N, 5..7) array of cards, got shape {cards.shape}")
+    n = cards.shape[0]
+    ranks = cards >> 2
+    bits = np.int64(1) << ranks
+    # One bit per distinct card: rank + 13 * suit, so each suit is a 13-bit lane
+    card_bits = bits << (13 * (cards & 3))
+
+    seen1 = np.zeros(n, dtype=np.int64)
+    seen2 = np.zeros(n, dtype=np.int64)
+    seen3 = np.zeros(n, dtype=np.int64)
+    seen4 = np.zeros(n, dtype=np.int64)
+    for j in range(cards.shape[1]):
+        bit = bits[:, j]
+        seen4 |= seen3 & bit
+        seen3 |= seen2 & bit
+        seen2 |= seen1 & bit
+        seen1 |= bit
+    all_cards = np.bitwise_or.reduce(card_bits, axis=1)
+
+    # At most one suit can hold five of seven cards
+    flush_mask = np.zeros(n, dtype=np.int64)
+    for s in range(4):
+        suit_mask = (all_cards >> (13 * s)) & 0x1FFF
+        flush_mask |= np.where(_NP_POPCOUNT[suit_mask] >= 5, suit_mask, 0)
+    is_flush = flush_mask != 0
+    flush_straight = _NP_STRAIGHT_TOP[flush_mask]
+
+    quads = _NP_TOP_RANK[seen4]
+    trips = _NP_TOP_RANK[seen3]
+    fh_pairs = seen2 & ~(np.int64(1) << trips)
+    straight = _NP_STRAIGHT_TOP[seen1]
+    high_pair = _NP_TOP_RANK[seen2]
+    low_pairs = seen2 & ~(np.int64(1) << high_pair)
+    low_pair = _NP_TOP_RANK[low_pairs]
+
+    conditions = [
+        is_flush & (flush_straight == 12),
+        is_flush & (flush_straight >= 0),
+        is_flush,
+        seen4 != 0,
+        (seen3 != 0) & (fh_pairs != 0),
+        straight >= 0,
+        seen3 != 0,
+        low_pairs != 0,
+        seen2 != 0,
+    ]
+    choices = [
+        np.full(n, _ROYAL_FLUSH, dtype=np.int64),
+        _STRAIGHT_FLUSH | flush_straight << 16,
+        _FLUSH | _NP_TOP_RANK[flush_mask] << 16,
+        _QUADS | quads << 16 | _NP_TOP_RANK[seen1 & ~(np.int64(1) << quads)] << 12,
+        _FULL_HOUSE | trips << 16 | _NP_TOP_RANK[fh_pairs] << 12,
+        _STRAIGHT | straight << 16,
+        _TRIPS | trips << 16 | (_NP_TOP5_PACKED[seen1 & ~(np.int64(1) << trips)] >> 4) & 0xFF00,
+        _TWO_PAIR | high_pair << 16 | low_pair << 12
+        | _NP_TOP_RANK[seen1 & ~(np.int64(1) << high_pair | np.int64(1) << low_pair)] << 8,
+        _PAIR | high_pair << 16 | (_NP_TOP5_PACKED[seen1 & ~(np.int64(1) << high_pair)] >> 4) & 0xFFF0,
+    ]
+    return np.select(conditions, choices, default=_HIGH_CARD | _NP_TOP5_PACKED[seen1])
+
+
+def encode_hands(hands: Iterable[Iterable[Union[str, int]]]) -> np.ndarray:
+    """
+    Build an evaluate_batch() input from rows of "A of spades" strings or
+    ints, e.g. my_cards + board lists read back from games_*.jsonl records.
+    """
+    from app.game_logic.card import card_to_int
+
+    return np.array(
+        [[c if isinstance(c, int) else card_to_int(c) for c in row] for row in hands],
+        dtype=np.int64,
+    )
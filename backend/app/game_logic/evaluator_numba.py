@@ -0,0 +1,120 @@
+"""
+numba-compiled evaluate() / evaluate_batch() over the same lookup tables as
+evaluator.py, which remains the reference implementation. Importing this
+module raises ImportError when numba is not installed; backend.py handles
+the fallback.
+
+Functions are compiled lazily on first call (once per tuple length for
+evaluate()) and cached to __pycache__ so later processes skip the JIT.
+"""
+from __future__ import annotations
+from typing import Iterable
+
+import numpy as np
+from numba import njit
+
+from app.game_logic.evaluator import (
+    POPCOUNT,
+    STRAIGHT_TOP,
+    TOP5_PACKED,
+    TOP_RANK,
+    _FLUSH,
+    _FULL_HOUSE,
+    _HIGH_CARD,
+    _PAIR,
+    _QUADS,
+    _ROYAL_FLUSH,
+    _STRAIGHT,
+    _STRAIGHT_FLUSH,
+    _TRIPS,
+    _TWO_PAIR,
+)
+
+# Module-level arrays are frozen into the compiled code as constants
+_POPCOUNT = np.array(POPCOUNT, dtype=np.int64)
+_TOP_RANK = np.array(TOP_RANK, dtype=np.int64)
+_TOP5_PACKED = np.array(TOP5_PACKED, dtype=np.int64)
+_STRAIGHT_TOP = np.array(STRAIGHT_TOP, dtype=np.int64)
+
+_ROYAL = int(_ROYAL_FLUSH)
+_SF = int(_STRAIGHT_FLUSH)
+_FL = int(_FLUSH)
+_QU = int(_QUADS)
+_FH = int(_FULL_HOUSE)
+_ST = int(_STRAIGHT)
+_TR = int(_TRIPS)
+_TP = int(_TWO_PAIR)
+_PR = int(_PAIR)
+_HC = int(_HIGH_CARD)
+
+
+@njit(cache=True)
+def _evaluate(cards) -> int:
+    """evaluator.evaluate() for a tuple or 1-d array of 5–7 card ints."""
+    suits = np.zeros(4, dtype=np.int64)
+    seen1 = seen2 = seen3 = seen4 = 0
+    for c in cards:
+        bit = 1 << (c >> 2)
+        suits[c & 3] |= bit
+        seen4 |= seen3 & bit
+        seen3 |= seen2 & bit
+        seen2 |= seen1 & bit
+        seen1 |= bit
+
+    for s in range(4):
+        suit_mask = suits[s]
+        if _POPCOUNT[suit_mask] >= 5:
+            high = _STRAIGHT_TOP[suit_mask]
+            if high == 12:
+                return _ROYAL
+            if high >= 0:
+                return _SF | high << 16
+            return _FL | _TOP_RANK[suit_mask] << 16
+
+    if seen4:
+        quads = _TOP_RANK[seen4]
+        return _QU | quads << 16 | _TOP_RANK[seen1 & ~(1 << quads)] << 12
+
+    if seen3:
+        trips = _TOP_RANK[seen3]
+        pairs = seen2 & ~(1 << trips)
+        if pairs:
+            return _FH | trips << 16 | _TOP_RANK[pairs] << 12
+
+    high = _STRAIGHT_TOP[seen1]
+    if high >= 0:
+        return _ST | high << 16
+
+    if seen3:
+        trips = _TOP_RANK[seen3]
+        return _TR | trips << 16 | (_TOP5_PACKED[seen1 & ~(1 << trips)] >> 4) & 0xFF00
+
+    if seen2:
+        high_pair = _TOP_RANK[seen2]
+        rest = seen2 & ~(1 << high_pair)
+        if rest:
+            low_pair = _TOP_RANK[rest]
+            kicker = _TOP_RANK[seen1 & ~(1 << high_pair | 1 << low_pair)]
+            return _TP | high_pair << 16 | low_pair << 12 | kicker << 8
+        return _PR | high_pair << 16 | (_TOP5_PACKED[seen1 & ~(1 << high_pair)] >> 4) & 0xFFF0
+
+    return _HC | _TOP5_PACKED[seen1]
+
+
+@njit(cache=True)
+def _evaluate_rows(cards: np.ndarray) -> np.ndarray:
+    out = np.empty(cards.shape[0], dtype=np.int64)
+    for i in range(cards.shape[0]):
+        out[i] = _evaluate(cards[i])
+    return out
+
+
+def evaluate(cards: Iterable[int]) -> int:
+    return _evaluate(tuple(cards))
+
+
+def evaluate_batch(cards: np.ndarray) -> np.ndarray:
+    cards = np.ascontiguousarray(cards, dtype=np.int64)
+    if cards.ndim != 2 or not 5 <= cards.shape[1] <= 7:
+        raise ValueError(f"expected an (N, 5..7) array of cards, got shape {cards.shape}")
+    return _evaluate_rows(cards)
@@ -1,9 +1,41 @@
 from __future__ import annotations
-import itertools
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 from app.game_logic.card import Card
 from app.game_logic.enums import HandRank
+from app.game_logic.backend import evaluate
+from app.game_logic.evaluator import POPCOUNT, pack_strength, unpack_strength
+
+
+def _build_run_tops() -> Dict[int, int]:
+    """
+    Rank mask -> straight top rank for every mask Hand.evaluate() treats as
+    a straight: a run of consecutive ranks (top = highest rank), or a run
+    ending at 5 plus an ace (ace plays low, top = 5).
+    """
+    run_tops = {}
+    for low in range(13):
+        for high in range(low, 13):
+            run_tops[(1 << (high + 1)) - (1 << low)] = high
+    for low in range(4):
+        run_tops[(1 << 4) - (1 << low) | 1 << 12] = 3
+    return run_tops
+
+
+_RUN_TOP = _build_run_tops()
+
+
+def _low_rank(mask: int) -> int:
+    return (mask & -mask).bit_length() - 1
+
+
+def _ranks_desc(mask: int) -> List[int]:
+    ranks = []
+    while mask:
+        r = mask.bit_length() - 1
+        ranks.append(r)
+        mask ^= 1 << r
+    return ranks
 
 
 class Hand:
@@ -12,133 +44,95 @@ class Hand:
         if not sorted:
             self.cards.sort()
         self.hand_rank, self.card_ranks = self.evaluate()
+        # Packed (hand_rank, card_ranks); compare Hands with plain int comparison
+        self.strength = pack_strength(self.hand_rank, self.card_ranks)
+
+    @classmethod
+    def from_strength(cls, cards: List[Card], strength: int) -> Hand:
+        """Build a Hand from an evaluator strength, skipping evaluate()."""
+        hand = cls.__new__(cls)
+        hand.cards = cards
+        hand.hand_rank, hand.card_ranks = unpack_strength(strength)
+        hand.strength = strength
+        return hand
 
     def evaluate(self) -> Tuple[HandRank, List[int]]:
         """
         Given a SORTED 5-card hand, determine the hand rank and card ranks used to
         break ties (kickers, top card of flush/straight, etc.).
         """
-        suit_counts: dict = {}
-        rank_counts: dict = {}
-
-        straight = True
-        ace_low_straight = False
-        prev_rank_index = Card.RANKS.index(self.cards[0].rank)
-
-        suit_counts[self.cards[0].suit] = suit_counts.get(self.cards[0].suit, 0) + 1
-        rank_counts[self.cards[0].rank] = rank_counts.get(self.cards[0].rank, 0) + 1
-
-        for i in range(1, len(self.cards)):
-            if Card.RANKS.index(self.cards[i].rank) != prev_rank_index + 1:
-                if Card.RANKS.index(self.cards[i].rank) == 12 and prev_rank_index == 3:
-                    ace_low_straight = True
-                else:
-                    straight = False
-            prev_rank_index = Card.RANKS.index(self.cards[i].rank)
-
-            suit_counts[self.cards[i].suit] = suit_counts.get(self.cards[i].suit, 0) + 1
-            rank_counts[self.cards[i].rank] = rank_counts.get(self.cards[i].rank, 0) + 1
-
-        flush_suit = [s for s in suit_counts if suit_counts[s] >= 5]
-
-        top_card_rank_index = Card.RANKS.index(self.cards[len(self.cards) - 1].rank)
-
-        # royal flush
-        if flush_suit and straight and top_card_rank_index == Card.RANKS.index("A"):
-            return (HandRank.ROYAL_FLUSH, [])
-
-        # straight flush
-        if flush_suit and straight:
-            if ace_low_straight:
-                return (HandRank.STRAIGHT_FLUSH, [3])
-            return (HandRank.STRAIGHT_FLUSH, [top_card_rank_index])
-
-        # quads
-        quads_rank = [r for r in rank_counts if rank_counts[r] == 4]
-        if quads_rank:
-            return (
-                HandRank.QUADS,
-                [Card.RANKS.index(quads_rank[0])]
-                + [Card.RANKS.index(c.rank) for c in self.cards if Card.RANKS.index(c.rank) != Card.RANKS.index(quads_rank[0])],
-            )
-
-        # full house
-        trips_rank = [r for r in rank_counts if rank_counts[r] == 3]
-        trips_rank = Card.RANKS.index(trips_rank[0]) if trips_rank else None
-
-        pair_ranks = [r for r in rank_counts if (rank_counts[r] == 2 and r != trips_rank)]
-        if pair_ranks:
-            pair_ranks = [Card.RANKS.index(pr) for pr in pair_ranks]
-            pair_ranks.sort(reverse=True)
-
-        if trips_rank is not None and pair_ranks:
-            return (HandRank.FULL_HOUSE, [trips_rank, pair_ranks[0]])
-
-        # flush
-        if flush_suit:
-            return (HandRank.FLUSH, [top_card_rank_index])
-
-        # straight
-        if straight:
-            if ace_low_straight:
-                return (HandRank.STRAIGHT, [3])
-            return (HandRank.STRAIGHT, [top_card_rank_index])
-
-        # trips
-        if trips_rank is not None:
-            return (
-                HandRank.TRIPS,
-                [trips_rank]
-                + list(reversed([Card.RANKS.index(c.rank) for c in self.cards if Card.RANKS.index(c.rank) != trips_rank])),
-            )
-
-        # two pair
+        ranks = []
+        suits = 0  # four 13-bit suit lanes
+        seen1 = seen2 = seen3 = seen4 = 0
+        for card in self.cards:
+            c = card._int
+            r = c >> 2
+            ranks.append(r)
+            bit = 1 << r
+            suits |= bit << 13 * (c & 3)
+            seen4 |= seen3 & bit
+            seen3 |= seen2 & bit
+            seen2 |= seen1 & bit
+            seen1 |= bit
+
+        # Distinct ranks forming a run (or a run up to 5 plus an ace) is a straight
+        straight_top = -1 if seen2 else _RUN_TOP.get(seen1, -1)
+        flush = len(ranks) >= 5 and (
+            POPCOUNT[suits & 0x1FFF] >= 5 or POPCOUNT[suits >> 13 & 0x1FFF] >= 5
+            or POPCOUNT[suits >> 26 & 0x1FFF] >= 5 or POPCOUNT[suits >> 39] >= 5
+        )
+
+        if flush and straight_top >= 0:
+            # A-2-3-4-5 suited is a 5-high straight flush, not royal
+            if straight_top == 12:
+                return (HandRank.ROYAL_FLUSH, [])
+            return (HandRank.STRAIGHT_FLUSH, [straight_top])
+
+        if seen4:
+            quads = _low_rank(seen4)
+            return (HandRank.QUADS, [quads] + [r for r in ranks if r != quads])
+
+        trips = _low_rank(seen3) if seen3 else None
+        pair_ranks = _ranks_desc(seen2 & ~seen3)
+        if trips is not None and pair_ranks:
+            return (HandRank.FULL_HOUSE, [trips, pair_ranks[0]])
+
+        if flush:
+            return (HandRank.FLUSH, [ranks[-1]])
+
+        if straight_top >= 0:
+            return (HandRank.STRAIGHT, [straight_top])
+
+        if trips is not None:
+            return (HandRank.TRIPS, [trips] + [r for r in reversed(ranks) if r != trips])
+
         if len(pair_ranks) == 2:
-            return (
-                HandRank.TWO_PAIR,
-                pair_ranks + [Card.RANKS.index(c.rank) for c in self.cards if Card.RANKS.index(c.rank) not in pair_ranks],
-            )
+            return (HandRank.TWO_PAIR, pair_ranks + [r for r in ranks if r not in pair_ranks])
 
-        # pair
         if pair_ranks:
-            return (
-                HandRank.PAIR,
-                [pair_ranks[0]]
-                + list(reversed([Card.RANKS.index(c.rank) for c in self.cards if Card.RANKS.index(c.rank) != pair_ranks[0]])),
-            )
+            return (HandRank.PAIR, [pair_ranks[0]] + [r for r in reversed(ranks) if r != pair_ranks[0]])
 
-        # high card
-        return (HandRank.HIGH_CARD, list(reversed([Card.RANKS.index(c.rank) for c in self.cards])))
+        return (HandRank.HIGH_CARD, ranks[::-1])
 
     def __lt__(self, other: Hand) -> bool:
-        if self.hand_rank == other.hand_rank:
-            for i in range(len(self.card_ranks)):
-                if self.card_ranks[i] < other.card_ranks[i]:
-                    return True
-                elif self.card_ranks[i] > other.card_ranks[i]:
-                    return False
-            return False
-        return self.hand_rank < other.hand_rank
+        return self.strength < other.strength
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Hand):
             return NotImplemented
-        if self.hand_rank == other.hand_rank:
-            for i in range(len(self.card_ranks)):
-                if self.card_ranks[i] != other.card_ranks[i]:
-                    return False
-            return True
-        return False
+        return self.strength == other.strength
+
+    def __hash__(self) -> int:
+        return hash(self.strength)
 
 
 def best_hand_from_cards(cards: List[Card]) -> Hand:
-    """Return the best 5-card Hand from an arbitrary list of Card objects."""
+    """
+    Return the best 5-card Hand from an arbitrary list of Card objects.
+    With 5+ cards the table evaluator is used and the returned Hand's cards
+    are all of the (sorted) input cards rather than the chosen five.
+    """
     all_cards = sorted(cards)
     if len(all_cards) < 5:
         return Hand(all_cards, sorted=True)
-    best = None
-    for combo in itertools.combinations(all_cards, 5):
-        hand = Hand(list(combo), sorted=True)
-        if best is None or hand > best:
-            best = hand
-    return best
+    return Hand.from_strength(all_cards, evaluate([c.to_int() for c in all_cards]))
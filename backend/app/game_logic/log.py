@@ -0,0 +1,69 @@
+"""
+Logging for the game engine.
+
+Engine modules log through children of the "app.game_logic" logger
+(logging.getLogger(__name__)) with %-style arguments, so a message is only
+formatted when its level is enabled. Anything costlier than reading a few
+attributes (pot chains, hand rankings) is guarded with isEnabledFor().
+Messages are an event name followed by key=value fields:
+
+    INFO   blinds, actions, board cards, pot awards and refunds
+    DEBUG  hole cards, pot layouts, hand rankings
+
+Nothing is emitted until configure() attaches a handler; with no handler
+the engine inherits the root logger's WARNING level and stays quiet.
+set_level("silent"), or ENGINE_LOG_LEVEL=silent, turns every engine
+message off for bots, benchmarks and busy servers.
+"""
+from __future__ import annotations
+import logging
+import os
+import sys
+from typing import IO, Optional, Union
+
+ENGINE_LOGGER = "app.game_logic"
+SILENT = logging.CRITICAL + 10
+LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "silent": SILENT,
+}
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
+
+_handler: Optional[logging.Handler] = None
+
+
+def _parse_level(level: Union[str, int]) -> int:
+    if isinstance(level, int):
+        return level
+    try:
+        return LEVELS[level.lower()]
+    except KeyError:
+        raise ValueError(f"unknown log level {level!r}, expected one of {tuple(LEVELS)}") from None
+
+
+def set_level(level: Union[str, int]) -> None:
+    """Set the engine log level: a LEVELS name ("silent" disables all engine logging) or an int."""
+    logging.getLogger(ENGINE_LOGGER).setLevel(_parse_level(level))
+
+
+def configure(level: Optional[Union[str, int]] = None, stream: Optional[IO[str]] = None) -> logging.Logger:
+    """
+    Attach a stream handler to the engine logger (once) and set its level.
+    level defaults to ENGINE_LOG_LEVEL, else "warning" in production and
+    "info" elsewhere; stream defaults to stdout.
+    """
+    global _handler
+    if level is None:
+        level = os.getenv("ENGINE_LOG_LEVEL", "warning" if os.getenv("FLASK_ENV") == "production" else "info")
+    logger = logging.getLogger(ENGINE_LOGGER)
+    if _handler is not None:
+        logger.removeHandler(_handler)
+    _handler = logging.StreamHandler(stream or sys.stdout)
+    _handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    logger.addHandler(_handler)
+    logger.propagate = False
+    set_level(level)
+    return logger
@@ -6,6 +6,8 @@ if TYPE_CHECKING:
 
 
 class Player:
+    __slots__ = ("name", "chips", "hole_cards", "current_bet", "playing", "folded", "allin", "seat")
+
     def __init__(self, name: str, chips: int = 1000) -> None:
         self.name = name
         self.chips = chips
@@ -14,6 +16,7 @@ class Player:
         self.playing = True
         self.folded = False
         self.allin = False
+        self.seat = -1  # index in Table._seats, kept current by Table
 
     def bet(self, amount: int) -> int:
         """
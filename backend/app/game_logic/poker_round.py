@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import Dict, List, Tuple, Union
+import logging
+from itertools import groupby
+from typing import Dict, List, NamedTuple, Optional, Tuple, Type, Union
 
 from app.game_logic.exceptions import (
     InvalidActionError,
@@ -9,18 +11,63 @@ from app.game_logic.exceptions import (
 )
 from app.game_logic.enums import Action, Phase
 from app.game_logic.card import Card, Deck
+from app.game_logic.evaluator import HandState
 from app.game_logic.hand import Hand, best_hand_from_cards
 from app.game_logic.player import Player
 from app.game_logic.table import Table
-from app.game_logic.pot import PotCollection
+from app.game_logic.pot import PotCollection, PotLedger
+from app.game_logic.rng import derive_seed, make_rng, new_seed, reseed
+
+log = logging.getLogger(__name__)
+
+
+# serialize_for_player() fields that differ between players
+PRIVATE_FIELDS = ("my_cards", "my_bet", "my_chips")
+
+
+class ActionOption(NamedTuple):
+    """One legal action at a decision point; min is the smallest legal amount for bets and raises."""
+    action: Action
+    min: Optional[int]
+    allin: bool
+
+    def to_dict(self) -> dict:
+        return {"action": self.action, "min": self.min, "allin": self.allin}
+
+
+_CHECK = ActionOption(Action.CHECK, None, False)
+_CALL = ActionOption(Action.CALL, None, False)
+_CALL_ALLIN = ActionOption(Action.CALL, None, True)
+_FOLD = ActionOption(Action.FOLD, None, False)
 
 
 class PokerRound:
+    """
+    Dealing randomness: with rng_kind "random" or "numpy" every hand is
+    dealt from its own seed (hand_seed), derived from the table seed
+    (random if None) and the hand count. Passing a recorded hand_seed to
+    reset() before start_round() re-deals that hand exactly. rng_kind
+    "secure" deals from the OS CSPRNG and leaves hand_seed as None.
+
+    pot_cls picks the pot engine: PotCollection splits chips into side
+    pots as they are bet, PotLedger keeps per-seat totals and derives the
+    same pots on demand.
+
+    state_version increases whenever the hand state changes (a new hand,
+    an action, a dealt street, a payout, a seat change); per-state results
+    such as available_actions() and serialize_public() are cached against
+    it. Code outside this class that changes a seat's chips goes through
+    set_chips() so the caches see it.
+    """
+
     def __init__(
         self,
         players: Union[List[str], List[Player], Table],
         small_blind: int,
         big_blind: int,
+        seed: Optional[int] = None,
+        rng_kind: str = "random",
+        pot_cls: Type[Union[PotCollection, PotLedger]] = PotCollection,
     ) -> None:
         if isinstance(players, Table):
             self.table = players
@@ -28,21 +75,42 @@ class PokerRound:
             self.table = Table(len(players), players)
         self.sb_amount = small_blind
         self.bb_amount = big_blind
+        self.rng_kind = rng_kind
+        self.pot_cls = pot_cls
+        self.seed = seed if seed is not None or rng_kind == "secure" else new_seed()
+        self._hands_dealt = 0
+        self.state_version = 0
+        self._actions_cache: Tuple[int, Optional[Player], Tuple[ActionOption, ...]] = (-1, None, ())
+        self._public_cache: Tuple[int, Optional[dict]] = (-1, None)
         self.reset()
 
-    def __del__(self) -> None:
-        print("PokerGame object is being deleted!")
-
-    def reset(self) -> None:
+    def reset(self, hand_seed: Optional[int] = None) -> None:
+        self.state_version += 1
         self.table.reset()
-        self.deck = Deck()
+        if self.rng_kind == "secure":
+            self.hand_seed = None
+        elif hand_seed is not None:
+            self.hand_seed = hand_seed
+        else:
+            self.hand_seed = derive_seed(self.seed, self._hands_dealt)
+            self._hands_dealt += 1
+        if hasattr(self, "deck"):
+            self.deck.reset(reseed(self.deck.rng, self.hand_seed, self.rng_kind))
+        else:
+            self.deck = Deck(make_rng(self.hand_seed, self.rng_kind))
         self.board: List[Card] = []
+        # Per-player masks over hole cards + board, advanced by deal_board();
+        # each entry keeps the hole-card list it was built from so a
+        # replaced hand or board falls back to a full evaluation
+        self._hand_states: Dict[Player, Tuple[List[Card], HandState]] = {}
+        self._states_board = self.board
         self.current_bet = 0
         self.heads_up = self.table.num_seats == 2
         self.final_betting_round_aggressor = None
         self.active_players: set = set(self.table._seats)
         self.allin_players: set = set()
-        self.pot = PotCollection()
+        # Snapshot of the seating; seats only change between hands
+        self.pot = self.pot_cls(tuple(self.table._seats))
 
         self.current_player: Player = None
         self.last_to_act: Player = None
@@ -60,11 +128,13 @@ class PokerRound:
         return self.table.num_seats
 
     def add_player(self, player: Player) -> None:
+        self.state_version += 1
         if self.table.num_seats == self.table.max_seats:
             raise TooManyPlayersError(self.table.max_seats)
         self.table.add_player(player)
 
     def remove_player(self, player: Player) -> None:
+        self.state_version += 1
         self.table.remove_player(player)
 
     def get_player(self, username: str) -> Player:
@@ -91,59 +161,88 @@ class PokerRound:
     def get_players(self) -> List[str]:
         return self.table.get_players()
 
+    def set_chips(self, player: Player, chips: int) -> None:
+        """Set a seat's stack from outside a hand (rebuys, cash-outs)."""
+        self.state_version += 1
+        player.chips = chips
+
     def refund_pot(self) -> None:
+        self.state_version += 1
         chip_changes = self.pot.refund_pot()
+        log.info("refund chips=%s", chip_changes)
         for player, amount in chip_changes.items():
             player.chips += amount
 
-    def serialize_for_player(self, username: str) -> dict:
-        player = self.get_player(username)
+    def serialize_public(self) -> dict:
+        """
+        The table view every seat shares: board, seats, pots, blinds and whose
+        turn it is. Built once per state_version and shared by every caller
+        until the state moves, so treat it as read-only.
+        """
+        cached = self._public_cache
+        if cached[0] == self.state_version:
+            return cached[1]
         data = self.get_player_to_act_and_actions() if not self.is_action_finished else None
-        player_to_act = data["player_to_act"] if data else None
-        actions = data["available_actions"] if data else None
-        return {
+        public = {
             "blinds": [self.sb_amount, self.bb_amount],
-            "my_cards": self.get_player_hand(player),
             "board": self.get_board(),
             "players": self.table.get_players_info(),
             "pots": self.get_pots(),
             "small_blind_player": str(self.table.sb),
             "big_blind_player": str(self.table.bb),
-            "player_to_act": player_to_act,
-            "available_actions": actions,
-            "my_bet": player.current_bet,
+            "player_to_act": data["player_to_act"] if data else None,
+            "available_actions": data["available_actions"] if data else None,
             "table_bet": self.current_bet,
-            "my_chips": player.chips,
             "phase": self.phase,
         }
+        self._public_cache = (self.state_version, public)
+        return public
+
+    def serialize_private(self, username: str) -> dict:
+        """The fields only this player sees (PRIVATE_FIELDS)."""
+        player = self.get_player(username)
+        return {
+            "my_cards": self.get_player_hand(player),
+            "my_bet": player.current_bet,
+            "my_chips": player.chips,
+        }
+
+    def serialize_for_player(self, username: str) -> dict:
+        """serialize_public() with username's PRIVATE_FIELDS on top; nested values are shared with the cache."""
+        return {**self.serialize_public(), **self.serialize_private(username)}
 
     # ── round lifecycle ──────────────────────────────────────────────────────
 
     def start_round(self) -> None:
         """Deal hole cards and post blinds."""
+        self.state_version += 1
         player = self.table.sb
         for _ in range(self.table.num_seats):
             player.hole_cards = self.deck.deal(2)
-            print(f"{player.name} got dealt: {player.hole_cards}")
+            self._hand_states[player] = (player.hole_cards, HandState(c._int for c in player.hole_cards))
+            log.debug("deal player=%s cards=%s", player.name, player.hole_cards)
             player = self.table.next_player(player)
 
         self.pot.add_contribution(self.table.sb, self.table.sb.bet(self.sb_amount))
-        print(f"{self.table.sb.name} is the SB, betting {self.table.sb.current_bet}")
+        log.info("blind player=%s position=sb amount=%d", self.table.sb.name, self.table.sb.current_bet)
         if self.table.sb.allin:
             self.allin_players.add(self.table.sb)
+            self.table.deactivate(self.table.sb)
 
         self.pot.add_contribution(self.table.bb, self.table.bb.bet(self.bb_amount))
-        print(f"{self.table.bb.name} is the BB, betting {self.table.bb.current_bet}")
+        log.info("blind player=%s position=bb amount=%d", self.table.bb.name, self.table.bb.current_bet)
         if self.table.bb.allin:
             self.allin_players.add(self.table.bb)
+            self.table.deactivate(self.table.bb)
 
         self.current_bet = max(self.table.sb.current_bet, self.table.bb.current_bet)
 
-        print(f"POT: {self.pot}")
+        log.debug("pots %s", self.pot)
         self.phase = Phase.PREFLOP
         self.current_player, self.last_to_act = self.get_betting_order(preflop=True)
 
     def start_next_phase(self) -> None:
+        self.state_version += 1
         if self.is_action_finished or self.is_poker_round_over:
             return
         if self.phase == Phase.PREFLOP:
@@ -168,6 +267,7 @@ class PokerRound:
         Called when action is over. Deals remaining board cards if needed,
         ranks players, awards pots, and applies chip changes.
         """
+        self.state_version += 1
         if not self.is_action_finished:
             raise Exception("ACTION IS NOT FINISHED, CANNOT CALL END ROUND")
         if not self.is_poker_round_over:
@@ -211,22 +311,25 @@ class PokerRound:
     def get_player_to_act_and_actions(self) -> dict:
         self.set_player_to_act()
         player = self.current_player
-        actions = self.get_player_available_actions(player)
+        actions = [option.to_dict() for option in self.available_actions(player)]
         return {"player_to_act": player.name, "available_actions": actions}
 
     def validate_player_action(self, player: Player, action: str, amount: int | None) -> None:
         if not self.current_player == player:
             raise NotPlayersTurnError(player)
-        available_actions = self.get_player_available_actions(player)
-        if action not in ([dic["action"] for dic in available_actions] + [Action.FOLD]):
-            raise InvalidActionError(action)
-        if amount and amount < [dic.get("min") for dic in available_actions if dic["action"] == action][0]:
+        option = next((o for o in self.available_actions(player) if o.action == action), None)
+        if option is None:
+            if action != Action.FOLD:
+                raise InvalidActionError(action)
+        elif amount and option.min is not None and amount < option.min:
             raise InvalidAmountError(amount)
 
     def apply_player_action(self, player: Player, action: str, amount: int | None) -> None:
+        self.state_version += 1
         if action == Action.FOLD:
             player.folded = True
             self.active_players.discard(player)
+            self.table.deactivate(player)
 
         elif action == Action.CALL:
             self.pot.add_contribution(player, player.bet(self.current_bet))
@@ -234,14 +337,17 @@ class PokerRound:
         elif action in (Action.RAISE, Action.RERAISE, Action.BET):
             self.pot.add_contribution(player, player.bet(amount))
             self.current_bet = max(player.current_bet, self.current_bet)
-            self.last_to_act = self.table.prev_player(player)
-            while self.last_to_act.folded or self.last_to_act.allin:
-                self.last_to_act = self.table.prev_player(self.last_to_act)
+            self.last_to_act = self.table.prev_active(player)
 
-        print(f"{player.name} now has {player.chips} and is in for {player.current_bet}. All in? {player.allin}")
+        if player.allin:
+            self.table.deactivate(player)
+        log.info(
+            "action player=%s action=%s chips=%d bet=%d allin=%s",
+            player.name, action, player.chips, player.current_bet, player.allin,
+        )
 
     def update_game_state(self) -> None:
-        print(f"POT: {self.pot}")
+        log.debug("pots %s", self.pot)
         if self.current_player.allin:
             self.allin_players.add(self.current_player)
         if self.last_to_act == self.current_player:
@@ -267,14 +373,11 @@ class PokerRound:
 
     def set_player_to_act(self) -> None:
         player = self.current_player
-        while True:
-            if player.folded or player.allin:
-                player = self.table.next_player(player)
-                continue
-            self.current_player = player
-            break
+        if player.folded or player.allin:
+            self.current_player = self.table.next_active(player)
 
     def end_betting_round(self) -> None:
+        self.state_version += 1
         self.current_bet = 0
         for player in self.table._seats:
             player.current_bet = 0
@@ -291,56 +394,53 @@ class PokerRound:
             last_to_act = self.table.btn
             starting_player = self.table.bb if self.heads_up else self.table.sb
 
-        while last_to_act.folded or last_to_act.allin:
-            last_to_act = self.table.prev_player(last_to_act)
+        if last_to_act.folded or last_to_act.allin:
+            last_to_act = self.table.prev_active(last_to_act)
 
         return starting_player, last_to_act
 
+    def available_actions(self, player: Optional[Player] = None) -> Tuple[ActionOption, ...]:
+        """
+        Legal actions for player (default: the current player), computed once
+        per decision point: the result is cached until state_version moves.
+        """
+        player = player or self.current_player
+        cached = self._actions_cache
+        if cached[0] == self.state_version and cached[1] is player:
+            return cached[2]
+        options = self._compute_actions(player)
+        self._actions_cache = (self.state_version, player, options)
+        return options
+
     def get_player_available_actions(
         self, player: Player, min_multiplier: int = 2
     ) -> List[dict]:
-        """Return the list of legal actions for this player."""
+        """Return the list of legal actions for this player, as dicts for the socket layer."""
+        if min_multiplier == 2:
+            options = self.available_actions(player)
+        else:
+            options = self._compute_actions(player, min_multiplier)
+        return [option.to_dict() for option in options]
+
+    def _compute_actions(self, player: Player, min_multiplier: int = 2) -> Tuple[ActionOption, ...]:
         minimum = min_multiplier * self.current_bet
         if self.current_bet > 0:
             if self.current_bet == player.current_bet:
-                return [
-                    {"action": Action.CHECK, "min": None, "allin": False},
-                    {"action": Action.RERAISE, "min": minimum, "allin": False},
-                ]
+                return (_CHECK, ActionOption(Action.RERAISE, minimum, False))
             else:
                 if player.chips + player.current_bet <= self.current_bet:
-                    return [
-                        {"action": Action.CALL, "min": None, "allin": True},
-                        {"action": Action.FOLD, "min": None, "allin": False},
-                    ]
+                    return (_CALL_ALLIN, _FOLD)
                 elif (len(self.active_players) - len(self.allin_players)) == 1:
-                    return [
-                        {"action": Action.CALL, "min": None, "allin": False},
-                        {"action": Action.FOLD, "min": None, "allin": False},
-                    ]
+                    return (_CALL, _FOLD)
                 elif player.chips + player.current_bet <= 2 * self.current_bet:
-                    return [
-                        {"action": Action.CALL, "min": None, "allin": False},
-                        {"action": Action.RAISE, "min": player.chips + player.current_bet, "allin": True},
-                        {"action": Action.FOLD, "min": None, "allin": False},
-                    ]
+                    return (_CALL, ActionOption(Action.RAISE, player.chips + player.current_bet, True), _FOLD)
                 else:
-                    return [
-                        {"action": Action.CALL, "min": None, "allin": False},
-                        {"action": Action.RAISE, "min": minimum, "allin": False},
-                        {"action": Action.FOLD, "min": None, "allin": False},
-                    ]
+                    return (_CALL, ActionOption(Action.RAISE, minimum, False), _FOLD)
         else:
             if player.chips < self.bb_amount:
-                return [
-                    {"action": Action.CHECK, "min": None, "allin": False},
-                    {"action": Action.BET, "min": player.chips, "allin": True},
-                ]
+                return (_CHECK, ActionOption(Action.BET, player.chips, True))
             else:
-                return [
-                    {"action": Action.CHECK, "min": None, "allin": False},
-                    {"action": Action.BET, "min": minimum, "allin": False},
-                ]
+                return (_CHECK, ActionOption(Action.BET, minimum, False))
 
     def rank_active_players(self) -> Tuple[List[List[Player]], Dict[Player, Hand]]:
         """
@@ -350,40 +450,45 @@ class PokerRound:
           - player_hands: maps each non-folded Player to their best Hand
         """
         player_hands: Dict[Player, Hand] = {
-            p: best_hand_from_cards(p.hole_cards + self.board)
-            for p in self.table._seats if not p.folded
+            p: self._best_hand(p) for p in self.table._seats if not p.folded
         }
 
-        ranked: List[List[Player]] = []
-        for player in self.table._seats:
-            if player.folded:
-                continue
-            hand = player_hands[player]
-            for i, group in enumerate(ranked):
-                if hand > player_hands[group[0]]:
-                    ranked.insert(i, [player])
-                    break
-                elif hand == player_hands[group[0]]:
-                    group.append(player)
-                    break
-            else:
-                ranked.append([player])
+        # sorted() is stable, so tied players stay in seat order
+        by_strength = sorted(player_hands, key=lambda p: player_hands[p].strength, reverse=True)
+        ranked: List[List[Player]] = [
+            list(group) for _, group in groupby(by_strength, key=lambda p: player_hands[p].strength)
+        ]
 
-        print(f"RANKING: {ranked}")
-        print(f"BOARD: {self.board}")
-        for player, hand in player_hands.items():
-            print(f"{player.name} makes {hand.hand_rank.label} from {player.hole_cards}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("ranking groups=%s board=%s", ranked, self.board)
+            for player, hand in player_hands.items():
+                log.debug("hand player=%s rank=%s cards=%s", player.name, hand.hand_rank.label, player.hole_cards)
 
         return ranked, player_hands
 
+    def _best_hand(self, player: Player) -> Hand:
+        """best_hand_from_cards(hole + board), from the player's incremental masks when current."""
+        tracked = self._hand_states.get(player)
+        if tracked is not None and tracked[0] is player.hole_cards and self._states_board is self.board:
+            state = tracked[1]
+            if state.num_cards == len(player.hole_cards) + len(self.board) and state.num_cards >= 5:
+                return Hand.from_strength(sorted(player.hole_cards + self.board), state.strength())
+        return best_hand_from_cards(player.hole_cards + self.board)
+
     # ── board / hands ────────────────────────────────────────────────────────
 
     def deal_board(self, num_cards: int) -> None:
-        """Deal cards to the board."""
-        self.board += self.deck.deal(num_cards)
-        print(f"\n\nBOARD: {self.board}\n\n")
-        print(f"POT: {self.pot}")
+        """Deal cards to the board and advance the live players' hand masks."""
+        self.state_version += 1
+        cards = self.deck.deal(num_cards)
+        self.board += cards
+        ints = [c._int for c in cards]
+        for player, (_, state) in self._hand_states.items():
+            if not player.folded:
+                state.add(ints)
+        log.info("board cards=%s", self.board)
+        log.debug("pots %s", self.pot)
 
     def end_round(self) -> None:
-        """Replace the deck for the next round."""
-        self.deck = Deck()
+        """Restore the full deck for the next round."""
+        self.deck.reset()
@@ -1,38 +1,68 @@
 from __future__ import annotations
+import logging
 import sys
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, Iterator, List, Optional, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from app.game_logic.player import Player
 
+log = logging.getLogger(__name__)
+
 
 class Pot:
-    def __init__(self) -> None:
-        self.player_contributions: dict = {}  # {player: contribution}
+    """
+    One pot in the chain. Contributions are stored by seat index
+    (Player.seat) in a list sized to the table, with a bitmask of the seats
+    that have put chips in; seats maps an index back to its Player.
+    """
+
+    __slots__ = ("seats", "contributions", "members", "amount", "next", "contribution_limit", "max_seen_contribution")
+
+    def __init__(self, seats: Sequence[Player]) -> None:
+        self.seats = seats
+        self.contributions: List[int] = [0] * len(seats)
+        self.members: int = 0  # bit s set once seat s has contributed (even 0)
         self.amount: int = 0
         self.next: Optional[Pot] = None
         self.contribution_limit: int = sys.maxsize
         self.max_seen_contribution: int = 0
 
+    def __contains__(self, player: Player) -> bool:
+        return bool(self.members >> player.seat & 1)
+
+    def member_seats(self) -> Iterator[int]:
+        members = self.members
+        while members:
+            low = members & -members
+            yield low.bit_length() - 1
+            members ^= low
+
+    @property
+    def player_contributions(self) -> Dict[Player, int]:
+        """{player: contribution} for every player in this pot, in seat order."""
+        return {self.seats[s]: self.contributions[s] for s in self.member_seats()}
+
     def add(self, player: Player, amount_to_add: int, allin: bool = False) -> int:
         """
         Add a player contribution to this pot. Returns any remainder that
         overflows the contribution limit (to be added to the next pot).
         """
-        old_contribution = self.player_contributions.get(player, 0)
+        seat = player.seat
+        self.members |= 1 << seat
+        old_contribution = self.contributions[seat]
 
         if old_contribution + amount_to_add > self.contribution_limit:
             self.amount += self.contribution_limit - old_contribution
-            self.player_contributions[player] = self.contribution_limit
+            self.contributions[seat] = self.contribution_limit
             return amount_to_add - (self.contribution_limit - old_contribution)
 
         self.amount += amount_to_add
-        self.player_contributions[player] = old_contribution + amount_to_add
+        contribution = self.contributions[seat] = old_contribution + amount_to_add
 
-        if self.player_contributions[player] > self.max_seen_contribution:
-            self.max_seen_contribution = self.player_contributions[player]
+        if contribution > self.max_seen_contribution:
+            self.max_seen_contribution = contribution
         if allin:
-            self.contribution_limit = self.player_contributions[player]
+            self.contribution_limit = contribution
         return 0
 
     def award_pot(
@@ -48,25 +78,21 @@ class Pot:
         Player → chips to add. Caller applies chip_changes to Player objects.
         """
         group_idx = 0
-        winners = [p for p in ranked_active_players[group_idx] if p in self.player_contributions]
+        winners = [p for p in ranked_active_players[group_idx] if p in self]
         while not winners:
             group_idx += 1
-            winners = [p for p in ranked_active_players[group_idx] if p in self.player_contributions]
+            winners = [p for p in ranked_active_players[group_idx] if p in self]
 
         share = self.amount // len(winners)
         amount = self.amount = share * len(winners)
 
-        print(f"------------- WITHIN POT ------------")
-        print(f"splitting {self.amount} among {winners}")
+        log.info("award amount=%d winners=%s share=%d", amount, winners, share)
         chip_changes: dict = {}
         for player in winners:
             self.amount -= share
             chip_changes[player] = share
-            print(f"{player} gets {share}")
-        print(f"-------------------------")
 
-        pot_players = set(self.player_contributions)
-        must_show = len(pot_players.intersection(active_players)) != 1
+        must_show = sum(self.seats[s] in active_players for s in self.member_seats()) != 1
         hand_rank = player_hands[winners[0]].hand_rank.label if must_show else "By Default"
 
         award_info = {
@@ -83,25 +109,30 @@ class Pot:
         if self.amount == 0:
             return {}
         chip_changes: dict = {}
-        for player in self.player_contributions:
-            chip_changes[player] = self.player_contributions[player]
-            self.amount -= self.player_contributions[player]
-            self.player_contributions[player] = 0
+        for s in self.member_seats():
+            chip_changes[self.seats[s]] = self.contributions[s]
+            self.amount -= self.contributions[s]
+            self.contributions[s] = 0
         return chip_changes
 
     def serialize(self) -> dict:
         return {
             "amount": self.amount,
-            "players": [str(p) for p in self.player_contributions],
+            "players": [str(self.seats[s]) for s in self.member_seats()],
         }
 
     def __repr__(self) -> str:
-        return f"POT:\n{self.amount}\n{[(p.name, self.player_contributions[p]) for p in self.player_contributions]}"
+        return f"POT:\n{self.amount}\n{[(self.seats[s].name, self.contributions[s]) for s in self.member_seats()]}"
 
 
 class PotCollection:
-    def __init__(self) -> None:
-        self.main_pot = Pot()
+    """The main pot and its side pots, for the players seated in seats."""
+
+    __slots__ = ("seats", "main_pot", "current_pot")
+
+    def __init__(self, seats: Sequence[Player]) -> None:
+        self.seats = seats
+        self.main_pot = Pot(seats)
         self.current_pot = self.main_pot
 
     def add_contribution(self, player: Player, amount_to_add: int) -> None:
@@ -110,7 +141,7 @@ class PotCollection:
         remainder = pot.add(player, amount_to_add, player.allin)
         while remainder:
             if not pot.next:
-                pot.next = Pot()
+                pot.next = Pot(self.seats)
             pot = pot.next
             remainder = pot.add(player, remainder, player.allin)
         if pot.max_seen_contribution > pot.contribution_limit:
@@ -122,13 +153,14 @@ class PotCollection:
         Called when a player calls all-in for less than the current bet.
         """
         temp = pot.next
-        pot.next = Pot()
+        pot.next = Pot(self.seats)
         pot.next.next = temp
 
-        for player in pot.player_contributions:
-            surplus = pot.player_contributions[player] - pot.contribution_limit
+        for s in pot.member_seats():
+            surplus = pot.contributions[s] - pot.contribution_limit
             if surplus > 0:
-                pot.player_contributions[player] -= surplus
+                player = self.seats[s]
+                pot.contributions[s] -= surplus
                 pot.amount -= surplus
                 pot.next.add(player, surplus, player.allin)
 
@@ -145,10 +177,10 @@ class PotCollection:
             curr = curr.next
 
         chip_changes: dict = {}
-        if len(curr.player_contributions) <= 1:
-            print(f"COLLECTING GARBAGE:\nPOT: {curr} dies now\n")
-            for player in curr.player_contributions:
-                chip_changes[player] = curr.amount
+        if curr.members & (curr.members - 1) == 0:  # at most one player in it
+            for s in curr.member_seats():
+                log.info("uncalled player=%s amount=%d", self.seats[s], curr.amount)
+                chip_changes[self.seats[s]] = curr.amount
             prev.next = None
             curr = prev
 
@@ -165,35 +197,149 @@ class PotCollection:
         Award all pots. Returns (pot_award_info_list, aggregated_chip_changes).
         Caller applies chip_changes to Player objects.
         """
-        print(f"----------------------POT COLLECTION--------------------------")
-        pot_award_info = []
-        all_chip_changes: dict = {}
-        pot = self.main_pot
-        while pot:
-            info, chip_changes = pot.award_pot(ranked_active_players, active_players, player_hands)
-            pot_award_info.append(info)
-            for player, amount in chip_changes.items():
-                all_chip_changes[player] = all_chip_changes.get(player, 0) + amount
-            pot = pot.next
-        print("-" * 80)
-        return pot_award_info, all_chip_changes
+        return _award_chain(self.main_pot, ranked_active_players, active_players, player_hands)
 
     def refund_pot(self) -> dict:
         """Refund all pots. Returns aggregated chip_changes map."""
-        all_chip_changes: dict = {}
+        return _refund_chain(self.main_pot)
+
+    def __repr__(self) -> str:
+        return _chain_repr(self.main_pot)
+
+
+class PotLedger:
+    """
+    Drop-in alternative to PotCollection that keeps one running total per
+    seat instead of splitting chips across pots as they go in.
+
+    The side pots are a pure function of those totals: the distinct
+    all-in totals L1 < L2 < ... (plus the largest total) cut the chips
+    into layers, and the layer (L[k-1], L[k]] holds min(total, L[k]) -
+    L[k-1] from every seat whose total exceeds L[k-1]. main_pot derives
+    that chain of Pot objects in one pass over the seats sorted by total
+    and caches it until the next contribution, so award_pot, refund_pot
+    and serialization run on exactly the pots PotCollection would build.
+    """
+
+    __slots__ = ("seats", "totals", "entered", "allin", "_chain")
+
+    def __init__(self, seats: Sequence[Player]) -> None:
+        self.seats = seats
+        self.totals: List[int] = [0] * len(seats)
+        self.entered: int = 0  # bit s set once seat s has contributed (even 0)
+        self.allin: int = 0  # bit s set once seat s has gone all-in
+        self._chain: Optional[Pot] = None
+
+    def add_contribution(self, player: Player, amount_to_add: int) -> None:
+        seat = player.seat
+        self.totals[seat] += amount_to_add
+        self.entered |= 1 << seat
+        if player.allin:
+            self.allin |= 1 << seat
+        self._chain = None
+
+    @property
+    def main_pot(self) -> Pot:
+        if self._chain is None:
+            self._chain = self._build_chain()
+        return self._chain
+
+    def _build_chain(self) -> Pot:
+        totals = self.totals
+        order = sorted((s for s in range(len(totals)) if self.entered >> s & 1), key=totals.__getitem__)
+        main = pot = Pot(self.seats)
+        pot.members = self.entered
+        if not order:
+            return main
+
+        allin_levels = {totals[s] for s in order if self.allin >> s & 1}
+        levels = sorted(allin_levels | {totals[order[-1]]})
+
+        floor = 0
+        lo = 0  # order[lo:] are the seats with total > floor
+        for k, level in enumerate(levels):
+            if k:
+                while totals[order[lo]] <= floor:
+                    lo += 1
+                pot.next = pot = Pot(self.seats)
+            for s in order[lo:]:
+                share = min(totals[s], level) - floor
+                pot.contributions[s] = share
+                pot.members |= 1 << s
+                pot.amount += share
+            pot.max_seen_contribution = level - floor
+            if level in allin_levels:
+                pot.contribution_limit = level - floor
+            floor = level
+        return main
+
+    def end_betting_round(self) -> dict:
+        """
+        Refund an uncalled bet: the top layer when at most one seat is in it.
+        Returns chip_changes, like PotCollection.end_betting_round.
+        """
         pot = self.main_pot
-        while pot:
-            for player, amount in pot.refund_pot().items():
-                all_chip_changes[player] = all_chip_changes.get(player, 0) + amount
+        if pot.next is None:
+            return {}  # the main pot is only ever settled at showdown
+        while pot.next:
             pot = pot.next
-        return all_chip_changes
+        chip_changes: dict = {}
+        if pot.members & (pot.members - 1) == 0:
+            for s in pot.member_seats():
+                log.info("uncalled player=%s amount=%d", self.seats[s], pot.amount)
+                chip_changes[self.seats[s]] = pot.amount
+                self.totals[s] -= pot.amount
+            self._chain = None
+        return chip_changes
+
+    def award_pot(
+        self,
+        ranked_active_players: List[List[Player]],
+        active_players: set = set(),
+        player_hands: dict = {},
+    ) -> tuple[list, dict]:
+        """Award all pots. Returns (pot_award_info_list, aggregated_chip_changes)."""
+        return _award_chain(self.main_pot, ranked_active_players, active_players, player_hands)
+
+    def refund_pot(self) -> dict:
+        """Refund all pots. Returns aggregated chip_changes map."""
+        return _refund_chain(self.main_pot)
 
     def __repr__(self) -> str:
-        curr = self.main_pot
-        parts = []
-        while curr:
-            parts.append(repr(curr))
-            curr = curr.next
-            if curr:
-                parts.append("\n|\n|\n|\nv\n")
-        return "".join(parts)
+        return _chain_repr(self.main_pot)
+
+
+def _award_chain(
+    pot: Optional[Pot],
+    ranked_active_players: List[List[Player]],
+    active_players: set,
+    player_hands: dict,
+) -> tuple[list, dict]:
+    pot_award_info = []
+    all_chip_changes: dict = {}
+    while pot:
+        info, chip_changes = pot.award_pot(ranked_active_players, active_players, player_hands)
+        pot_award_info.append(info)
+        for player, amount in chip_changes.items():
+            all_chip_changes[player] = all_chip_changes.get(player, 0) + amount
+        pot = pot.next
+    return pot_award_info, all_chip_changes
+
+
+def _refund_chain(pot: Optional[Pot]) -> dict:
+    all_chip_changes: dict = {}
+    while pot:
+        for player, amount in pot.refund_pot().items():
+            all_chip_changes[player] = all_chip_changes.get(player, 0) + amount
+        pot = pot.next
+    return all_chip_changes
+
+
+def _chain_repr(pot: Optional[Pot]) -> str:
+    parts = []
+    while pot:
+        parts.append(repr(pot))
+        pot = pot.next
+        if pot:
+            parts.append("\n|\n|\n|\nv\n")
+    return "".join(parts)
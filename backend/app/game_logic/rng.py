@@ -0,0 +1,77 @@
+"""
+Random-number sources for dealing and simulation.
+
+Three kinds are supported:
+  - "random": a seeded random.Random, one per table, for replayable hands
+  - "numpy":  a seeded numpy Generator; spawn_generators() gives simulation
+              workers independent streams derived from one root seed
+  - "secure": random.SystemRandom (OS CSPRNG) for production tables; it
+              cannot be seeded, so its hands cannot be replayed
+"""
+from __future__ import annotations
+import random
+import secrets
+from typing import Callable, List, Optional, Union
+
+import numpy as np
+
+RNG_KINDS = ("random", "numpy", "secure")
+SEED_BITS = 63
+_MASK64 = (1 << 64) - 1
+
+Rng = Union[random.Random, np.random.Generator]
+
+
+def new_seed() -> int:
+    """A fresh seed from the OS entropy pool."""
+    return secrets.randbits(SEED_BITS)
+
+
+def make_rng(seed: Optional[int] = None, kind: str = "random") -> Rng:
+    if kind == "random":
+        return random.Random(seed)
+    if kind == "numpy":
+        return np.random.default_rng(seed)
+    if kind == "secure":
+        if seed is not None:
+            raise ValueError("the secure RNG cannot be seeded")
+        return random.SystemRandom()
+    raise ValueError(f"unknown RNG kind {kind!r}, expected one of {RNG_KINDS}")
+
+
+def reseed(rng: Optional[Rng], seed: Optional[int], kind: str) -> Rng:
+    """Like make_rng(seed, kind), but reseed rng in place when it is reusable."""
+    if kind == "random" and type(rng) is random.Random:
+        rng.seed(seed)
+        return rng
+    if kind == "secure" and isinstance(rng, random.SystemRandom):
+        return rng
+    return make_rng(seed, kind)
+
+
+def derive_seed(seed: int, index: int) -> int:
+    """The index-th child seed of seed (splitmix64), e.g. one per hand at a table."""
+    z = (seed + (index + 1) * 0x9E3779B97F4A7C15) & _MASK64
+    z = (z ^ z >> 30) * 0xBF58476D1CE4E5B9 & _MASK64
+    z = (z ^ z >> 27) * 0x94D049BB133111EB & _MASK64
+    return (z ^ z >> 31) >> (64 - SEED_BITS)
+
+
+def randbelow(rng: Optional[Rng]) -> Callable[[int], int]:
+    """A function n -> uniform int in [0, n) drawing from rng (None: the global random module)."""
+    if rng is None:
+        return random.randrange
+    if isinstance(rng, np.random.Generator):
+        integers = rng.integers
+        return lambda n: int(integers(n))
+    return rng.randrange
+
+
+def spawn_seeds(seed: Optional[int], n: int) -> List[int]:
+    """n statistically independent child seeds of seed, e.g. one per worker process."""
+    return [int(s.generate_state(1, np.uint64)[0] >> 1) for s in np.random.SeedSequence(seed).spawn(n)]
+
+
+def spawn_generators(seed: Optional[int], n: int) -> List[np.random.Generator]:
+    """n independent numpy Generators derived from one root seed."""
+    return [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(n)]
@@ -1,9 +1,16 @@
 from __future__ import annotations
-from typing import List, Union
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 
 from app.game_logic.player import Player
 
 
+@lru_cache(maxsize=None)
+def _ring(n: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """(next, prev) seat links for a full ring of n seats."""
+    return tuple((s + 1) % n for s in range(n)), tuple((s - 1) % n for s in range(n))
+
+
 class Table:
     def __init__(
         self,
@@ -19,6 +26,12 @@ class Table:
         self._seats: List[Player] = list(players)
         self._btn_idx: int = 0
         self.num_seats: int = len(self._seats)
+        # Circular doubly linked list over the seats that can still act this
+        # hand (not folded, not all-in); see next_active / deactivate
+        self._next: List[int] = []
+        self._prev: List[int] = []
+        self._linked: int = 0  # bit s set while seat s is in the list
+        self._number_seats()
 
     # ── position properties ──────────────────────────────────────────────────
 
@@ -43,13 +56,60 @@ class Table:
 
     def next_player(self, player: Player) -> Player:
         """Player to the left — next to act in betting order."""
-        idx = self._seats.index(player)
-        return self._seats[(idx + 1) % self.num_seats]
+        return self._seats[(player.seat + 1) % self.num_seats]
 
     def prev_player(self, player: Player) -> Player:
         """Player to the right — used when walking backward (last-to-act after a raise)."""
-        idx = self._seats.index(player)
-        return self._seats[(idx - 1) % self.num_seats]
+        return self._seats[(player.seat - 1) % self.num_seats]
+
+    def next_active(self, player: Player) -> Optional[Player]:
+        """First player to the left of player who has not folded or gone all-in."""
+        nxt = self._seats[self._next[player.seat]]
+        if not (nxt.folded or nxt.allin):
+            return nxt
+        return self._walk_active(player.seat, self._next)
+
+    def prev_active(self, player: Player) -> Optional[Player]:
+        """First player to the right of player who has not folded or gone all-in."""
+        prev = self._seats[self._prev[player.seat]]
+        if not (prev.folded or prev.allin):
+            return prev
+        return self._walk_active(player.seat, self._prev)
+
+    def deactivate(self, player: Player) -> None:
+        """Unlink a player who folded or went all-in so traversal skips them."""
+        self._unlink(player.seat)
+
+    def _walk_active(self, seat: int, links: List[int]) -> Optional[Player]:
+        # An unlinked seat keeps the links it had when it left, which only
+        # skip seats that were already out, so walks can start from it.
+        # Seats flagged folded/all-in without deactivate() are unlinked here.
+        seats = self._seats
+        for _ in range(self.num_seats):
+            seat = links[seat]
+            player = seats[seat]
+            if not (player.folded or player.allin):
+                return player
+            self._unlink(seat)
+        return None
+
+    def _unlink(self, seat: int) -> None:
+        if self._linked >> seat & 1:
+            self._linked ^= 1 << seat
+            prev, nxt = self._prev[seat], self._next[seat]
+            self._next[prev] = nxt
+            self._prev[nxt] = prev
+
+    def _link_seats(self) -> None:
+        n = self.num_seats
+        ring_next, ring_prev = _ring(n)
+        if len(self._next) == n:
+            self._next[:] = ring_next
+            self._prev[:] = ring_prev
+        else:
+            self._next = list(ring_next)
+            self._prev = list(ring_prev)
+        self._linked = (1 << n) - 1
 
     # ── lifecycle ────────────────────────────────────────────────────────────
 
@@ -59,19 +119,28 @@ class Table:
     def reset(self) -> None:
         for player in self._seats:
             player.reset()
+        self._link_seats()
 
     # ── player management ────────────────────────────────────────────────────
 
+    def _number_seats(self) -> None:
+        for i, player in enumerate(self._seats):
+            player.seat = i
+        self._link_seats()
+
     def add_player(self, player: Player) -> None:
         """Insert new player at the btn position; new player becomes btn."""
         self._seats.insert(self._btn_idx, player)
         self.num_seats += 1
+        self._number_seats()
         # _btn_idx unchanged — it now points to the newly inserted player
 
     def remove_player(self, player: Player) -> None:
         idx = self._seats.index(player)
         self._seats.remove(player)
         self.num_seats -= 1
+        self._number_seats()
+        player.seat = -1
 
         if idx == self._btn_idx:
             # Removed player was btn; new btn is whatever is now at _btn_idx
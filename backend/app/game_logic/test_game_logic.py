@@ -1,5 +1,21 @@
-from app.game_logic import Player, PokerRound, Hand, Card, best_hand_from_cards
+from app.game_logic import Player, PokerRound, Hand, HandRank, Card, Deck, best_hand_from_cards
+from app.game_logic import ALL_CARDS, card_to_int, int_to_card, int_to_str
+from app.game_logic import evaluate_batch, encode_hands, calculate_equity, calculate_equity_vs_random
+from app.game_logic import canonical_key, cached_strength, cached_equity
+from app.game_logic import make_rng, spawn_generators, spawn_seeds
+from app.game_logic import InvalidActionError, InvalidAmountError
+from app.game_logic import ActionOption, PotCollection, PotLedger, Table, configure_logging, set_log_level
+from app.game_logic.backend import available_backends, load_backend
+from app.game_logic.canonical import canonical_cards, cache_info, clear_caches
+from app.game_logic.evaluator import HandState, evaluate, evaluate_masks, pack_strength, unpack_strength
+from app.game_logic.poker_round import PRIVATE_FIELDS
+import io
+import itertools
+import logging
+import numpy as np
+import random
 import unittest
+import unittest.mock
 
 class TestBettingFunctions(unittest.TestCase):
 
@@ -18,11 +34,184 @@ class TestBettingFunctions(unittest.TestCase):
         self.assertTrue(player2.allin)
         self.assertEqual(round.pot.main_pot.amount, 350)
 
+class TestAvailableActions(unittest.TestCase):
+
+    def test_cached_per_decision_point(self):
+        round = PokerRound(["a", "b", "c"], 5, 10, seed=3)
+        round.start_round()
+        info = round.get_player_to_act_and_actions()
+        options = round.available_actions()
+        self.assertIs(round.available_actions(), options)
+        self.assertEqual(options, (
+            ActionOption("call", None, False), ActionOption("raise", 20, False), ActionOption("fold", None, False),
+        ))
+        self.assertEqual(info["available_actions"], [
+            {"action": "call", "min": None, "allin": False},
+            {"action": "raise", "min": 20, "allin": False},
+            {"action": "fold", "min": None, "allin": False},
+        ])
+        with self.assertRaises(InvalidAmountError):
+            round.handle_player_action(info["player_to_act"], "raise", 15)
+        with self.assertRaises(InvalidActionError):
+            round.handle_player_action(info["player_to_act"], "check")
+        self.assertIs(round.available_actions(), options)
+
+        round.handle_player_action(info["player_to_act"], "raise", 40)
+        round.get_player_to_act_and_actions()
+        self.assertEqual(round.available_actions()[1], ActionOption("raise", 80, False))
+        with self.assertRaises(AttributeError):
+            round.available_actions()[0].min = 1
+
+
+class TestSerialization(unittest.TestCase):
+
+    def test_public_view_cached_per_version(self):
+        round = PokerRound(["a", "b", "c"], 5, 10, seed=3)
+        round.start_round()
+        public = round.serialize_public()
+        self.assertIs(round.serialize_public(), public)
+        a, b = round.serialize_for_player("a"), round.serialize_for_player("b")
+        self.assertIs(a["players"], public["players"])
+        self.assertEqual({k: v for k, v in a.items() if k not in PRIVATE_FIELDS}, public)
+        self.assertNotEqual(a["my_cards"], b["my_cards"])
+
+        round.handle_player_action(public["player_to_act"], "call")
+        moved = round.serialize_public()
+        self.assertIsNot(moved, public)
+        self.assertNotEqual(moved["player_to_act"], public["player_to_act"])
+
+        player = round.get_player("a")
+        round.set_chips(player, player.chips + 100)
+        chips = {p["username"]: p["chips"] for p in round.serialize_public()["players"]}
+        self.assertEqual(chips["a"], player.chips)
+
+
+class TestTable(unittest.TestCase):
+
+    def test_active_seat_links(self):
+        players = [Player(f"P{i}") for i in range(8)]
+        table = Table(8, players)
+        self.assertIs(table.next_player(players[7]), players[0])
+        self.assertIs(table.prev_player(players[0]), players[7])
+        for i in (1, 2, 5):
+            players[i].folded = True
+            table.deactivate(players[i])
+        players[6].allin = True  # flagged without deactivate(): pruned on the way past
+        self.assertIs(table.next_active(players[0]), players[3])
+        self.assertIs(table.next_active(players[4]), players[7])
+        self.assertIs(table.prev_active(players[0]), players[7])
+        self.assertIs(table.prev_active(players[3]), players[0])
+        # Walks can start from a seat that is no longer active
+        self.assertIs(table.next_active(players[1]), players[3])
+        self.assertIs(table.prev_active(players[6]), players[4])
+        for i in (0, 3, 4):
+            players[i].folded = True
+        self.assertIs(table.next_active(players[7]), players[7])
+        players[7].folded = True
+        self.assertIsNone(table.next_active(players[7]))
+        table.reset()
+        self.assertIs(table.next_active(players[0]), players[1])
+
+
+class TestLogging(unittest.TestCase):
+
+    def tearDown(self):
+        logger = logging.getLogger("app.game_logic")
+        logger.handlers.clear()
+        logger.propagate = True
+        logger.setLevel(logging.NOTSET)
+
+    def play_hand(self):
+        round = PokerRound(["a", "b", "c"], 5, 10, seed=17)
+        round.start_round()
+        while not round.is_action_finished:
+            info = round.get_player_to_act_and_actions()
+            round.handle_player_action(info["player_to_act"], info["available_actions"][0]["action"])
+        round.end_poker_round()
+
+    def test_levels(self):
+        with self.assertLogs("app.game_logic", "INFO") as logs:
+            self.play_hand()
+        messages = [r.getMessage() for r in logs.records]
+        self.assertIn("blind player=b position=sb amount=5", messages)
+        self.assertTrue(any(m.startswith("award amount=30 ") for m in messages))
+        self.assertFalse(any(r.levelno < logging.INFO for r in logs.records))
+
+    def test_silent_skips_formatting(self):
+        stream = io.StringIO()
+        configure_logging("silent", stream)
+        with unittest.mock.patch.object(PotCollection, "__repr__", side_effect=AssertionError("formatted")):
+            self.play_hand()
+        self.assertEqual(stream.getvalue(), "")
+        set_log_level("debug")
+        self.play_hand()
+        self.assertIn(" DEBUG app.game_logic.poker_round deal player=", stream.getvalue())
+        with self.assertRaises(ValueError):
+            set_log_level("chatty")
+
+
+class TestCardEncoding(unittest.TestCase):
+
+    def test_round_trip(self):
+        for i in range(52):
+            self.assertEqual(card_to_int(int_to_card(i)), i)
+            self.assertEqual(card_to_int(int_to_str(i)), i)
+            self.assertEqual(Card.from_str(int_to_str(i)), int_to_card(i))
+
+    def test_layout(self):
+        self.assertEqual(card_to_int(Card("2", "clubs")), 0)
+        self.assertEqual(card_to_int("A of diamonds"), 51)
+        self.assertEqual(card_to_int("10 of spades") >> 2, Card.RANKS.index("10"))
+        self.assertEqual(card_to_int("10 of spades") & 3, Card.SUITS.index("spades"))
+
+    def test_equal_to_constructed_card(self):
+        card = Card("K", "hearts")
+        self.assertEqual(card.to_int(), Card.from_str("K of hearts").to_int())
+        self.assertEqual(card, ALL_CARDS[card.to_int()])
+        self.assertEqual(hash(card), hash(ALL_CARDS[card.to_int()]))
+
+    def test_deck_deals_ints(self):
+        deck = Deck()
+        dealt = deck.deal_ints(52)
+        self.assertEqual(sorted(dealt), list(range(52)))
+
+    def test_deck_remove_and_iterate(self):
+        deck = Deck()
+        deck.remove("A of spades")
+        deck.remove(Card("2", "clubs"))
+        deck.remove(5)
+        self.assertEqual(len(deck), 49)
+        self.assertNotIn("A of spades", deck)
+        remaining = [c for c in range(52) if c not in (0, 5, card_to_int("A of spades"))]
+        self.assertEqual(list(deck), remaining)
+        with self.assertRaises(ValueError):
+            deck.remove(5)
+        self.assertEqual(sorted(deck.deal_ints(49)), remaining)
+        with self.assertRaises(Exception):
+            deck.deal(1)
+
+    def test_deck_reset_restores_all_cards(self):
+        deck = Deck()
+        deck.remove(10)
+        deck.deal(20)
+        deck.reset()
+        self.assertEqual(len(deck), 52)
+        self.assertEqual(list(deck), list(range(52)))
+        self.assertEqual(sorted(deck.deal_ints(52)), list(range(52)))
+
 class TestHandRankingFunctions(unittest.TestCase):
 
     def test_card_sort(self):
         self.assertTrue(Card("4", "spades") < Card("K", "hearts"))
 
+    def test_short_hands(self):
+        # Fewer than five cards (e.g. hole cards alone) keep their historical ranking
+        self.assertEqual(Hand([Card("6", "diamonds"), Card("5", "clubs")]).evaluate(), (HandRank.STRAIGHT, [4]))
+        self.assertEqual(Hand([Card("A", "diamonds"), Card("5", "clubs")]).evaluate(), (HandRank.STRAIGHT, [3]))
+        self.assertEqual(Hand([Card("A", "diamonds"), Card("2", "clubs")]).evaluate(), (HandRank.HIGH_CARD, [12, 0]))
+        self.assertEqual(Hand([Card("K", "diamonds"), Card("3", "clubs"), Card("K", "clubs")]).evaluate(), (HandRank.PAIR, [11, 1]))
+        self.assertEqual(Hand([Card("9", "diamonds"), Card("9", "clubs")]).evaluate(), (HandRank.PAIR, [7]))
+
     def test_royal_flush(self):
         hand = Hand([Card("K", "spades"), Card("A", "spades"), Card("J", "spades"), Card("10", "spades"), Card("Q", "spades")])
         self.assertEqual(hand.hand_rank, 10)
@@ -172,6 +361,287 @@ class TestHandRankingFunctions(unittest.TestCase):
         my_cards = [Card("10", "hearts"), Card("2", "hearts")]
         self.assertTrue(best_hand_from_cards(board + my_cards).hand_rank.label == "Trips")
 
+class TestEvaluator(unittest.TestCase):
+
+    def test_matches_best_of_combinations(self):
+        rng = random.Random(2024)
+        for n in (5, 6, 7):
+            for _ in range(300):
+                ints = rng.sample(range(52), n)
+                cards = sorted(ALL_CARDS[i] for i in ints)
+                expected = max(
+                    pack_strength(*Hand(list(combo), sorted=True).evaluate())
+                    for combo in itertools.combinations(cards, 5)
+                )
+                self.assertEqual(evaluate(ints), expected, cards)
+
+    def test_hand_state_matches_full_evaluation(self):
+        rng = random.Random(12)
+        for _ in range(500):
+            cards = rng.sample(range(52), 7)
+            state = HandState(cards[:2])
+            state.add(cards[2:5])
+            self.assertEqual(state.strength(), evaluate(cards[:5]))
+            self.assertEqual(evaluate_masks(*state.with_cards(cards[5:])), evaluate(cards))
+            state.add(cards[5:6])
+            state.add(cards[6:])
+            self.assertEqual(state.num_cards, 7)
+            self.assertEqual(state.strength(), evaluate(cards))
+
+    def test_batch_matches_scalar(self):
+        rng = np.random.default_rng(7)
+        for n in (5, 6, 7):
+            cards = np.argsort(rng.random((2000, 52)), axis=1)[:, :n]
+            expected = [evaluate(row) for row in cards.tolist()]
+            self.assertEqual(evaluate_batch(cards).tolist(), expected)
+
+    def test_batch_from_card_strings(self):
+        rows = [
+            ["A of spades", "K of spades", "Q of spades", "J of spades", "10 of spades", "2 of hearts", "3 of clubs"],
+            ["2 of clubs", "7 of diamonds", "A of spades", "K of hearts", "Q of clubs", "J of spades", "9 of diamonds"],
+        ]
+        strengths = evaluate_batch(encode_hands(rows))
+        self.assertEqual(strengths.shape, (2,))
+        self.assertEqual(strengths[0] >> 20, 10)
+        self.assertEqual(strengths[1], best_hand_from_cards([Card.from_str(c) for c in rows[1]]).strength)
+
+    def test_batch_rejects_bad_shape(self):
+        with self.assertRaises(ValueError):
+            evaluate_batch(np.zeros((3, 4), dtype=np.int64))
+
+    def test_pack_round_trip(self):
+        hand = Hand([Card("3", "diamonds"), Card("7", "hearts"), Card("4", "spades"), Card("8", "spades"), Card("3", "hearts")])
+        self.assertEqual(unpack_strength(pack_strength(hand.hand_rank, hand.card_ranks)), (hand.hand_rank, hand.card_ranks))
+
+    def test_strength_orders_hands(self):
+        pair = Hand([Card("8", "diamonds"), Card("5", "hearts"), Card("A", "clubs"), Card("2", "spades"), Card("2", "diamonds")])
+        high = Hand([Card("10", "diamonds"), Card("A", "diamonds"), Card("K", "hearts"), Card("9", "spades"), Card("3", "clubs")])
+        quads = Hand([Card("8", "diamonds"), Card("8", "hearts"), Card("8", "clubs"), Card("8", "spades"), Card("Q", "diamonds")])
+        self.assertEqual(sorted([quads, high, pair], key=lambda h: h.strength), [high, pair, quads])
+        self.assertEqual(pair.strength >> 20, 2)
+        self.assertEqual(best_hand_from_cards(list(pair.cards)).strength, pair.strength)
+
+    def test_strength_of_six_and_seven_card_high_card_hands(self):
+        six = [Card("2", "clubs"), Card("4", "hearts"), Card("7", "spades"), Card("9", "diamonds"), Card("J", "clubs"), Card("K", "hearts")]
+        seven = six + [Card("3", "spades")]
+        for cards in (six, seven):
+            hand = Hand(list(cards))
+            self.assertEqual(hand.hand_rank, HandRank.HIGH_CARD)
+            self.assertEqual(hand.card_ranks[:5], [11, 9, 7, 5, 2])
+            self.assertEqual(hand.strength, best_hand_from_cards(list(cards)).strength)
+        self.assertEqual(Hand(list(six)), Hand(list(seven)))
+        self.assertTrue(Hand(list(six)) < Hand(six[1:] + [Card("A", "spades")]))
+
+    def test_steel_wheel_is_straight_flush(self):
+        hand = Hand([Card("A", "clubs"), Card("2", "clubs"), Card("3", "clubs"), Card("4", "clubs"), Card("5", "clubs")])
+        self.assertEqual(hand.hand_rank, 9)
+        self.assertEqual(hand.card_ranks, [3])
+        best = best_hand_from_cards(hand.cards + [Card("K", "hearts"), Card("K", "spades")])
+        self.assertEqual((best.hand_rank, best.card_ranks), (9, [3]))
+
+    def test_best_hand_from_seven(self):
+        cards = [Card("A", "hearts"), Card("A", "spades"), Card("K", "clubs"), Card("K", "hearts"), Card("Q", "spades"), Card("Q", "clubs"), Card("2", "clubs")]
+        best = best_hand_from_cards(cards)
+        self.assertEqual(best.hand_rank, 3)
+        self.assertEqual(best.card_ranks, [12, 11, 10])
+
+class TestEvaluatorBackends(unittest.TestCase):
+    """Every installed backend must match the pure-Python reference."""
+
+    CATEGORY_HANDS = [
+        ["A of spades", "K of spades", "Q of spades", "J of spades", "10 of spades", "2 of hearts", "3 of clubs"],
+        ["A of hearts", "2 of hearts", "3 of hearts", "4 of hearts", "5 of hearts", "K of clubs", "K of spades"],
+        ["9 of clubs", "9 of hearts", "9 of spades", "9 of diamonds", "K of clubs", "K of spades", "2 of hearts"],
+        ["9 of clubs", "9 of hearts", "9 of spades", "K of diamonds", "K of clubs", "2 of spades", "2 of hearts"],
+        ["2 of clubs", "7 of clubs", "9 of clubs", "J of clubs", "K of clubs", "A of clubs", "A of hearts"],
+        ["A of clubs", "2 of hearts", "3 of spades", "4 of diamonds", "5 of clubs", "9 of hearts", "J of spades"],
+        ["7 of clubs", "7 of hearts", "7 of spades", "K of diamonds", "2 of clubs", "4 of spades", "9 of hearts"],
+        ["7 of clubs", "7 of hearts", "K of spades", "K of diamonds", "2 of clubs", "2 of spades", "9 of hearts"],
+        ["7 of clubs", "7 of hearts", "A of spades", "K of diamonds", "2 of clubs", "4 of spades", "9 of hearts"],
+        ["7 of clubs", "3 of hearts", "A of spades", "K of diamonds", "2 of clubs", "4 of spades", "9 of hearts"],
+    ]
+
+    def test_backends_match_reference_on_random_hands(self):
+        reference_eval, reference_batch = load_backend("python")
+        rng = np.random.default_rng(13)
+        for name, (evaluate_fn, batch_fn) in available_backends().items():
+            for n in (5, 6, 7):
+                with self.subTest(backend=name, cards=n):
+                    cards = np.argsort(rng.random((5000, 52)), axis=1)[:, :n]
+                    self.assertEqual(batch_fn(cards).tolist(), reference_batch(cards).tolist())
+                    rows = cards[:1000].tolist()
+                    self.assertEqual([evaluate_fn(r) for r in rows], [reference_eval(r) for r in rows])
+
+    def test_backends_match_reference_on_every_category(self):
+        rows = encode_hands(self.CATEGORY_HANDS)
+        reference_eval, _ = load_backend("python")
+        expected = [reference_eval(r) for r in rows.tolist()]
+        self.assertEqual(sorted({s >> 20 for s in expected}), list(range(1, 11)))
+        for name, (evaluate_fn, batch_fn) in available_backends().items():
+            with self.subTest(backend=name):
+                self.assertEqual([evaluate_fn(r) for r in rows.tolist()], expected)
+                self.assertEqual(batch_fn(rows).tolist(), expected)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            load_backend("fortran")
+
+class TestEquity(unittest.TestCase):
+    AA = ["A of spades", "A of hearts"]
+    KK = ["K of spades", "K of hearts"]
+
+    def test_flop_is_enumerated(self):
+        result = calculate_equity([self.AA, self.KK], board=["2 of clubs", "7 of diamonds", "9 of clubs"])
+        self.assertTrue(result.exact)
+        self.assertEqual(result.samples, 990)  # C(45, 2)
+        self.assertEqual(result.ci95, (0.0, 0.0))
+        self.assertAlmostEqual(sum(result.equity), 1.0)
+
+    def test_river_decides(self):
+        board = ["K of clubs", "2 of diamonds", "7 of clubs", "9 of spades", "4 of hearts"]
+        result = calculate_equity([self.AA, self.KK], board=board)
+        self.assertEqual(result.win, (0.0, 1.0))
+
+    def test_board_plays_is_a_tie(self):
+        board = ["K of clubs", "Q of diamonds", "J of clubs", "10 of spades", "9 of hearts"]
+        result = calculate_equity([["A of spades", "2 of hearts"], ["A of clubs", "2 of diamonds"]], board=board)
+        self.assertEqual(result.tie, (1.0, 1.0))
+        self.assertEqual(result.equity, (0.5, 0.5))
+
+    def test_preflop_monte_carlo(self):
+        result = calculate_equity([self.AA, self.KK], iterations=20_000, seed=1)
+        self.assertFalse(result.exact)
+        self.assertEqual(result.samples, 20_000)
+        self.assertLess(abs(result.equity[0] - 0.82), 3 * result.ci95[0] + 0.005)
+        self.assertEqual(result, calculate_equity([self.AA, self.KK], iterations=20_000, seed=1))
+
+    def test_time_budget_stops_early(self):
+        hands = [self.AA, self.KK, ["Q of spades", "Q of hearts"]]
+        result = calculate_equity(hands, iterations=10**9, time_budget=0.01, seed=0)
+        self.assertLess(result.samples, 10**9)
+        self.assertEqual(len(result.equity), 3)
+
+    def test_vs_random_hands(self):
+        heads_up = calculate_equity_vs_random(self.AA, 1, iterations=10_000, seed=0)
+        multiway = calculate_equity_vs_random(self.AA, 5, iterations=10_000, seed=0)
+        self.assertEqual(len(heads_up.equity), 1)
+        self.assertLess(abs(heads_up.equity[0] - 0.85), 3 * heads_up.ci95[0] + 0.005)
+        self.assertLess(multiway.equity[0], heads_up.equity[0])
+        with self.assertRaises(ValueError):
+            calculate_equity_vs_random(self.AA, 8)
+
+    def test_rejects_bad_input(self):
+        with self.assertRaises(ValueError):
+            calculate_equity([self.AA])
+        with self.assertRaises(ValueError):
+            calculate_equity([self.AA, ["A of spades", "2 of clubs"]])
+        with self.assertRaises(ValueError):
+            calculate_equity([self.AA, self.KK], board=["2 of clubs"] * 6)
+        for iterations in (0, -5):
+            with self.assertRaises(ValueError):
+                calculate_equity([self.AA, self.KK], iterations=iterations)
+            with self.assertRaises(ValueError):
+                calculate_equity_vs_random(self.AA, 1, iterations=iterations)
+
+class TestRng(unittest.TestCase):
+
+    def test_seeded_decks_deal_identically(self):
+        for kind in ("random", "numpy"):
+            a, b = Deck(make_rng(7, kind)), Deck(make_rng(7, kind))
+            self.assertEqual(a.deal_ints(20), b.deal_ints(20))
+
+    def test_reset_with_same_seed_replays(self):
+        deck = Deck(make_rng(3))
+        first = deck.deal_ints(9)
+        deck.deal_ints(5)
+        deck.reset(make_rng(3))
+        self.assertEqual(deck.deal_ints(9), first)
+
+    def test_secure_rng(self):
+        deck = Deck(make_rng(kind="secure"))
+        self.assertEqual(sorted(deck.deal_ints(52)), list(range(52)))
+        with self.assertRaises(ValueError):
+            make_rng(1, "secure")
+        with self.assertRaises(ValueError):
+            make_rng(kind="mersenne")
+
+    def test_poker_round_replays_hand_from_seed(self):
+        game = PokerRound(["a", "b", "c"], 5, 10, seed=42)
+        game.start_round()
+        hole = {p: game.get_player_hand(p) for p in game.get_players()}
+        seed = game.hand_seed
+        self.assertIsNotNone(seed)
+
+        replay = PokerRound(["a", "b", "c"], 5, 10)
+        replay.reset(hand_seed=seed)
+        replay.start_round()
+        self.assertEqual({p: replay.get_player_hand(p) for p in replay.get_players()}, hole)
+
+    def test_table_seed_fixes_hand_seeds(self):
+        first = PokerRound(["a", "b"], 5, 10, seed=9)
+        second = PokerRound(["a", "b"], 5, 10, seed=9)
+        self.assertEqual(first.hand_seed, second.hand_seed)
+        first.reset()
+        self.assertNotEqual(first.hand_seed, second.hand_seed)
+        self.assertIsNone(PokerRound(["a", "b"], 5, 10, rng_kind="secure").hand_seed)
+
+    def test_spawned_streams_are_independent(self):
+        seeds = spawn_seeds(0, 4)
+        self.assertEqual(len(set(seeds)), 4)
+        self.assertEqual(seeds, spawn_seeds(0, 4))
+        draws = [g.integers(1 << 30) for g in spawn_generators(0, 4)]
+        self.assertEqual(len(set(draws)), 4)
+
+    def test_equity_accepts_generator(self):
+        AA, KK = ["A of spades", "A of hearts"], ["K of spades", "K of hearts"]
+        a = calculate_equity([AA, KK], iterations=2_000, rng=make_rng(5, "numpy"))
+        b = calculate_equity([AA, KK], iterations=2_000, seed=5)
+        self.assertEqual(a, b)
+
+def ints(*cards):
+    return [card_to_int(c) for c in cards]
+
+class TestCanonical(unittest.TestCase):
+
+    def test_suit_permutations_share_a_key(self):
+        spades = canonical_key(ints("A of spades", "K of spades"), ints("2 of spades", "7 of spades", "J of clubs"))
+        hearts = canonical_key(ints("K of hearts", "A of hearts"), ints("J of diamonds", "7 of hearts", "2 of hearts"))
+        self.assertEqual(spades, hearts)
+
+    def test_different_spots_differ(self):
+        suited = canonical_key(ints("A of spades", "K of spades"), ints("2 of spades", "7 of spades", "J of clubs"))
+        offsuit = canonical_key(ints("A of spades", "K of hearts"), ints("2 of spades", "7 of spades", "J of clubs"))
+        hole_vs_board = canonical_key(ints("A of spades", "2 of spades"), ints("K of spades", "7 of spades", "J of clubs"))
+        self.assertNotEqual(suited, offsuit)
+        self.assertNotEqual(suited, hole_vs_board)
+
+    def test_representative_round_trip(self):
+        rng = random.Random(5)
+        for _ in range(200):
+            cards = rng.sample(range(52), 7)
+            key = canonical_key(cards[:2], cards[2:])
+            hole, board = canonical_cards(key)
+            self.assertEqual(canonical_key(hole, board), key)
+            self.assertEqual(evaluate(hole + board), evaluate(cards))
+            self.assertEqual(cached_strength(cards[:2], cards[2:]), evaluate(cards))
+
+    def test_equity_cache_hits_isomorphic_spots(self):
+        clear_caches()
+        board = ["2 of clubs", "7 of diamonds", "9 of clubs"]
+        first = cached_equity([["A of spades", "A of hearts"], ["K of spades", "K of hearts"]], board)
+        swapped = cached_equity(
+            [["A of hearts", "A of spades"], ["K of hearts", "K of spades"]],
+            ["2 of diamonds", "7 of clubs", "9 of diamonds"],
+        )
+        self.assertEqual(first, swapped)
+        self.assertEqual(cache_info()["equity"].hits, 1)
+        self.assertEqual(first, calculate_equity([["A of spades", "A of hearts"], ["K of spades", "K of hearts"]], board))
+        # Every hit shares the cached result, so callers must not be able to change it
+        with self.assertRaises(AttributeError):
+            first.equity.append(0.0)
+        with self.assertRaises(TypeError):
+            first.win[0] = 1.0
+
 class TestDetermineWinnerFunctions(unittest.TestCase):
 
     def test_determine_winner(self):
@@ -224,6 +694,18 @@ class TestDetermineWinnerFunctions(unittest.TestCase):
         ranked, _ = round.rank_active_players()
         self.assertEqual(ranked, [[louis], [sol], [beeps], [kenna]])
 
+    def test_incremental_ranking_matches_full_evaluation(self):
+        for seed in range(20):
+            round = PokerRound(['sol', 'kenna', 'georg', 'louis'], 5, 10, seed=seed)
+            round.start_round()
+            round.apply_player_action(round.table.btn, "fold", None)
+            for n in (3, 1, 1):
+                round.deal_board(n)
+            _, player_hands = round.rank_active_players()
+            self.assertEqual(len(player_hands), 3)
+            for player, hand in player_hands.items():
+                self.assertEqual(hand, best_hand_from_cards(player.hole_cards + round.board))
+
 class TestPots(unittest.TestCase):
     def test_multiple_rounds(self):
         p1 = Player("P1", 19000)
@@ -256,6 +738,89 @@ class TestPots(unittest.TestCase):
         ranked, player_hands = round.rank_active_players()
         round.pot.award_pot(ranked, player_hands=player_hands)
 
+    def test_contributions_are_seat_indexed(self):
+        p1, p2, p3 = Player("P1", 1000), Player("P2", 300), Player("P3", 1000)
+        round = PokerRound([p1, p2, p3], 0, 0)
+        self.assertEqual([p.seat for p in (p1, p2, p3)], [0, 1, 2])
+        round.pot.add_contribution(p3, p3.bet(200))
+        round.pot.add_contribution(p2, p2.bet(300))
+        round.pot.add_contribution(p1, p1.bet(300))
+        main = round.pot.main_pot
+        self.assertEqual(main.contributions, [300, 300, 200])
+        self.assertIn(p2, main)
+        self.assertEqual(main.serialize()["players"], ["P1", "P2", "P3"])
+        self.assertEqual(round.pot.refund_pot(), {p1: 300, p2: 300, p3: 200})
+        self.assertFalse(hasattr(p1, "__dict__"))
+        self.assertFalse(hasattr(main, "__dict__"))
+
+    def test_seats_renumbered_between_hands(self):
+        p1, p2, p3 = Player("P1"), Player("P2"), Player("P3")
+        round = PokerRound([p1, p2, p3], 5, 10)
+        round.remove_player(p1)
+        self.assertEqual((p1.seat, p2.seat, p3.seat), (-1, 0, 1))
+        round.add_player(p1)
+        self.assertEqual(sorted(p.seat for p in (p1, p2, p3)), [0, 1, 2])
+        round.start_next_round()
+        self.assertEqual(len(round.pot.main_pot.contributions), 3)
+
+    @staticmethod
+    def _random_action(rng, round):
+        info = round.get_player_to_act_and_actions()
+        options = info["available_actions"]
+        choice = rng.choice(options + [{"action": "fold", "min": None}] * (rng.random() < 0.15))
+        amount = None
+        if choice["action"] in ("bet", "raise", "reraise"):
+            player = round.get_player(info["player_to_act"])
+            low = max(choice["min"] or 0, round.bb_amount)
+            # Sometimes shove (bet() caps the amount at the player's stack)
+            amount = rng.randint(low, low + player.chips) if rng.random() < 0.8 else 10 ** 6
+        return info["player_to_act"], choice["action"], amount
+
+    def test_ledger_matches_pot_collection(self):
+        """Randomized hands with uneven stacks: both engines build, refund and award the same pots."""
+        rng = random.Random(15)
+        for table in range(40):
+            n = rng.randint(2, 6)
+            rounds = [
+                PokerRound([Player(f"P{i}", 0) for i in range(n)], 5, 10, seed=table, pot_cls=cls)
+                for cls in (PotCollection, PotLedger)
+            ]
+            for _ in range(10):
+                stacks = [rng.choice((rng.randint(10, 120), rng.randint(100, 2000))) for _ in range(n)]
+                for round in rounds:
+                    for player, chips in zip(round.table._seats, stacks):
+                        player.chips = chips
+                    round.start_next_round()
+                old, new = rounds
+                while not old.is_action_finished:
+                    action = self._random_action(rng, old)
+                    self.assertEqual(new.get_player_to_act_and_actions()["player_to_act"], action[0])
+                    old.handle_player_action(*action)
+                    new.handle_player_action(*action)
+                    self.assertEqual(old.get_pots(), new.get_pots())
+                    self.assertEqual([p.chips for p in old.table._seats], [p.chips for p in new.table._seats])
+                if rng.random() < 0.1:
+                    refunds = [{p.name: c for p, c in r.pot.refund_pot().items()} for r in rounds]
+                    self.assertEqual(refunds[0], refunds[1])
+                else:
+                    self.assertEqual(old.end_poker_round(), new.end_poker_round())
+                self.assertEqual(old.get_pots(), new.get_pots())
+                self.assertEqual([p.chips for p in old.table._seats], [p.chips for p in new.table._seats])
+
+    def test_ledger_side_pots(self):
+        p1, p2, p3 = Player("P1", 1000), Player("P2", 300), Player("P3", 100)
+        round = PokerRound([p1, p2, p3], 0, 0, pot_cls=PotLedger)
+        for player in (p3, p2, p1):
+            round.pot.add_contribution(player, player.bet(500))
+        self.assertEqual(round.get_pots(), [
+            {"amount": 300, "players": ["P1", "P2", "P3"]},
+            {"amount": 400, "players": ["P1", "P2"]},
+            {"amount": 200, "players": ["P1"]},
+        ])
+        # The uncalled 200 goes back to P1 when the betting round ends
+        self.assertEqual(round.pot.end_betting_round(), {p1: 200})
+        self.assertEqual([pot["amount"] for pot in round.get_pots()], [300, 400])
+
 class TestDetermineShowers(unittest.TestCase):
     def test_split_pot(self):
         round = PokerRound(['sol', 'kenna'], 50, 100)
@@ -10,7 +10,9 @@ games = {}
 #     "status": StatusEnum, 
 #     "joiner_queue": [],
 #     "leaver_queue": [],
-#     "rebuy_queue": []} - "game" is not set until game is started by host
+#     "rebuy_queue": [],
+#     "sync": StateSync,
+#     "deadlines": {kind: dict}} - "game" is not set until game is started by host; "sync" on first broadcast
 
 connected_users = {} # active_users[socket_sid] = {"username": str, "game_id": str} - user doesn't become "active" unless they get a game_id, otherwise null
 player_timers = {} # {game_id: {username: InactionTimer}}
@@ -0,0 +1,119 @@
+"""
+Socket payload encoding: JSON text built once and reused.
+
+socketio (app/extensions.py) encodes packets with SocketJSON, which uses
+orjson when it is installed and the standard json module otherwise. An
+Encoded string passed as a socketio.emit argument is spliced into the
+packet verbatim instead of being encoded again, so a payload shared by
+many emits is encoded once:
+
+    payload = encode({"message": "Table closing"})
+    for username in players:
+        socketio.emit("message", payload, to=username)
+
+join_objects() builds an object from encoded parts; StateSync uses it to
+encode the public view once per seq under every player's snapshot.
+
+encode_stats times every encode; its snapshot() is served at
+GET /admin/metrics.
+"""
+from __future__ import annotations
+import json
+import threading
+import time
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+ENCODER = "orjson" if orjson else "json"
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+
+
+class Encoded(str):
+    """JSON text for an emit argument; SocketJSON sends it as is."""
+    __slots__ = ()
+
+
+class EncodeStats:
+    """Encode count and time, and how many emits reused an Encoded payload."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.encodes = 0
+            self.reused = 0
+            self.seconds = 0.0
+            self.max_seconds = 0.0
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self.encodes += 1
+            self.seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    def add_reused(self, count: int) -> None:
+        with self._lock:
+            self.reused += count
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "encoder": ENCODER,
+                "encodes": self.encodes,
+                "reused": self.reused,
+                "total_ms": round(self.seconds * 1e3, 3),
+                "mean_us": round(self.seconds / self.encodes * 1e6, 2) if self.encodes else 0.0,
+                "max_us": round(self.max_seconds * 1e6, 2),
+            }
+
+
+encode_stats = EncodeStats()
+
+
+def _dumps(obj: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+        except TypeError:  # e.g. ints wider than 64 bits
+            pass
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def dumps(obj: Any) -> str:
+    """Compact JSON text for obj, timed into encode_stats."""
+    start = time.perf_counter()
+    text = _dumps(obj)
+    encode_stats.add(time.perf_counter() - start)
+    return text
+
+
+def encode(obj: Any) -> Encoded:
+    """Encode obj once for any number of emits."""
+    return Encoded(dumps(obj))
+
+
+def join_objects(*objects: str) -> Encoded:
+    """One JSON object from JSON object texts with disjoint keys, without decoding them."""
+    return Encoded("{" + ",".join(o[1:-1] for o in objects if o != "{}") + "}")
+
+
+class SocketJSON:
+    """json module for SocketIO(json=...): packet data is [event, *args]."""
+
+    @staticmethod
+    def dumps(obj: Any, **kwargs: Any) -> str:
+        if isinstance(obj, list) and any(isinstance(item, Encoded) for item in obj):
+            parts = [item if isinstance(item, Encoded) else dumps(item) for item in obj]
+            encode_stats.add_reused(sum(isinstance(item, Encoded) for item in obj))
+            return "[" + ",".join(parts) + "]"
+        return dumps(obj)
+
+    @staticmethod
+    def loads(text: Any, **kwargs: Any) -> Any:
+        return orjson.loads(text) if orjson is not None else json.loads(text, **kwargs)
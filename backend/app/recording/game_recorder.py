@@ -1,9 +1,10 @@
-import json
 import os
 import uuid
 import threading
 from datetime import datetime, timezone
 
+from app.payloads import dumps
+
 
 class GameRecorder:
     def __init__(self, data_dir: str):
@@ -13,7 +14,7 @@ class GameRecorder:
 
     def start_hand(self, game_id: str, hand_number: int, game) -> None:
         players = game.get_players()
-        game_state = game.serialize_for_player(players[0])
+        game_state = game.serialize_public()
         starting_stacks = {p: game.get_player(p).chips for p in players}
         record = {
             "hand_id": str(uuid.uuid4()),
@@ -22,6 +23,8 @@ class GameRecorder:
             "timestamp_utc": datetime.now(timezone.utc).isoformat(),
             "small_blind": game.sb_amount,
             "big_blind": game.bb_amount,
+            "rng": game.rng_kind,
+            "seed": game.hand_seed,  # PokerRound.reset(hand_seed=seed) re-deals this hand; None for "secure"
             "small_blind_player": game_state["small_blind_player"],
             "big_blind_player": game_state["big_blind_player"],
             "players_dealt_in": players,
@@ -35,7 +38,9 @@ class GameRecorder:
         record = self._in_progress.get(game_id)
         if record is None:
             return
-        game_state = game.serialize_for_player(actor)
+        # The view already built for this state's broadcast; no re-serializing
+        game_state = game.serialize_public()
+        private = game.serialize_private(actor)
         action_record = {
             "action_index": len(record["actions"]),
             "phase": game_state["phase"],
@@ -47,9 +52,9 @@ class GameRecorder:
             "small_blind_player": game_state["small_blind_player"],
             "big_blind_player": game_state["big_blind_player"],
             "actor": actor,
-            "actor_hole_cards": game_state["my_cards"],
-            "actor_chips": game_state["my_chips"],
-            "actor_current_bet": game_state["my_bet"],
+            "actor_hole_cards": private["my_cards"],
+            "actor_chips": private["my_chips"],
+            "actor_current_bet": private["my_bet"],
             "available_actions": game_state["available_actions"],
             "action_taken": action_taken,
             "amount": amount,
@@ -75,7 +80,7 @@ class GameRecorder:
         os.makedirs(self.data_dir, exist_ok=True)
         with self._lock:
             with open(path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(record) + "\n")
+                f.write(dumps(record) + "\n")
 
     def _today_file(self) -> str:
         date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
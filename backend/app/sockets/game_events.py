@@ -4,6 +4,7 @@ from app.extensions import socketio
 import app.state as state
 from app.sockets.helpers import validate_player, get_user_bankroll, update_player_chips
 from app.sockets.game_flow import handle_player_action_helper, handle_start_game_helper
+from app.timer.deadline import server_time_ms
 
 @socketio.on("start_game")
 def handle_start_game(data):
@@ -32,6 +33,24 @@ def handle_player_action(data):
         emit("error", {"message": str(e)})
         return
 
+@socketio.on("sync_state")
+def handle_sync_state():
+    """Full snapshot for a client that reconnected or missed a state_delta."""
+    username, game_id = validate_player(request)
+    game = state.get_game(game_id)
+    if not game:
+        emit("error", {"message": "Game has not started - no game object."})
+        return
+    emit("full_state", state.get_state_sync(game_id).encoded_snapshot(game, username))
+    # countdowns still running, so a reconnected client can resume ticking
+    now = server_time_ms()
+    for payload in state.get_deadlines(game_id):
+        if payload["deadline"] <= now:
+            continue
+        if payload["kind"] == "kick" and (payload["username"] != username or not state.get_player_timer(game_id, username)):
+            continue
+        emit("deadline", payload)
+
 @socketio.on("get_hand")
 def handle_get_hand():
     username, game_id = validate_player(request)
@@ -71,7 +90,9 @@ def handle_rebuy():
             return
 
         update_player_chips(username, bankroll - buy_in)
-        state.get_game(game_id).get_player(username).chips += buy_in
+        game = state.get_game(game_id)
+        player = game.get_player(username)
+        game.set_chips(player, player.chips + buy_in)
         state.remove_from_rebuy_queue(game_id, username)
 
         emit("rebuy_confirmed", {"buy_in": buy_in})
@@ -1,13 +1,17 @@
-from threading import Thread, Timer
-import time
+import os
 from flask import current_app
-from app.extensions import socketio
+from app.extensions import scheduler, socketio
 from app.sockets.helpers import create_and_fund_players, create_player_object, get_user_bankroll, update_player_chips, delete_game, cashout_player, remove_user_from_game
 from app.game_logic import PokerRound
 from app.timer.inaction_timer import InactionTimer
 import app.state as state
 from app.globals import StatusEnum
 from app.recording.game_recorder import recorder
+from app.timer.deadline import deadline_payload
+
+# "secure" deals from the OS CSPRNG; "random"/"numpy" deal from recorded, replayable seeds
+DECK_RNG = os.getenv("DECK_RNG", "secure" if os.getenv("FLASK_ENV") == "production" else "random")
+BOT_DELAY = 1  # brief pause so bot turns don't feel instant
 
 def emit_player_turn(game_id: str, delay=45):
     game = state.get_game(game_id)
@@ -18,13 +22,12 @@ def emit_player_turn(game_id: str, delay=45):
 
     if state.is_bot(game_id, player_to_act):
         app = current_app._get_current_object()
-        Thread(target=handle_bot_turn, args=(app, game_id, player_to_act)).start()
+        scheduler.call_later(BOT_DELAY, handle_bot_turn, app, game_id, player_to_act, name="bot_turn")
         return
 
     kick_player_after_delay(current_app._get_current_object(), game_id, player_to_act, delay=delay)
 
 def handle_bot_turn(app, game_id: str, username: str):
-    time.sleep(1)  # brief pause so bot turns don't feel instant
     with app.app_context():
         if not state.get_game(game_id) or not state.is_bot(game_id, username):
             return
@@ -37,20 +40,27 @@ def kick_player_after_delay(app, game_id: str, username: str, delay: int=30):
         state.append_to_leaver_queue(game_id, username)
         handle_player_action_helper(username, game_id, "fold", None)
 
-    timer = InactionTimer(socketio, app, game_id, username, delay, state.get_game, kick_player) # Timer(delay, kick_player, [game_id, username])
+    timer = InactionTimer(socketio, app, game_id, username, delay, state.get_game, kick_player, scheduler)
     state.set_player_timer(game_id, username, timer)
     print("set player timer", state.get_player_timer(game_id, username), f"for {username}")    
     timer.start()
+    state.set_deadline(game_id, timer.deadline)
+
+def emit_updated_game_state(game_id: str, game: PokerRound):
+    """Broadcast what changed since the last update: one room delta, plus private fields to their owners."""
+    def send(delta: dict | None, private_deltas: dict):
+        if delta:
+            socketio.emit("state_delta", delta, to=game_id)
+        for name, payload in private_deltas.items():
+            socketio.emit("private_state", payload, to=name)
 
-def emit_updated_game_state(game: PokerRound):
-    for name in game.get_players():
-        game_state = game.serialize_for_player(name)
-        socketio.emit("update_game_state", game_state, to=name)
+    # emitted under the table's sync lock, so concurrent updates go out in seq order
+    state.get_state_sync(game_id).publish(game, send)
 
 def emit_round_over(game_id: str):
     game = state.get_game(game_id)
     pot_award_info = game.end_poker_round() # [{"winners": list[str], "amount": int, "share": int}, {...}]
-    emit_updated_game_state(game) # additional update to show newly dealt cards if needed
+    emit_updated_game_state(game_id, game) # additional update to show newly dealt cards if needed
     socketio.emit("round_over", pot_award_info, to=game_id)
     return pot_award_info
 
@@ -131,7 +141,7 @@ def handle_player_action_and_emit_state(game_id: str, username: str, action: str
     game = state.get_game(game_id)
     recorder.record_action(game_id, username, action, amount, game)
     game.handle_player_action(username, action, amount)
-    emit_updated_game_state(game)
+    emit_updated_game_state(game_id, game)
 
 def cancel_old_player_timer(game_id: str, username: str):
     timer = state.get_player_timer(game_id, username)
@@ -151,7 +161,7 @@ def handle_start_game_helper(game_id: str):
     state.set_game_status(game_id, StatusEnum.in_progress.value)
     poker_players = create_and_fund_players(state.get_players(game_id), state.get_buy_in(game_id))
 
-    game = PokerRound(poker_players, small_blind=state.get_small_blind(game_id), big_blind=state.get_big_blind(game_id))
+    game = PokerRound(poker_players, small_blind=state.get_small_blind(game_id), big_blind=state.get_big_blind(game_id), rng_kind=DECK_RNG)
     print(game)
     game.start_round()
     state.set_game(game_id, game)
@@ -191,16 +201,13 @@ def handle_end_of_round(game_id):
     # set status and await next round
     state.set_game_status(game_id, StatusEnum.between_hands.value)
     delay = 20 if len(state.get_game(game_id).board) == 5 else 10 # more time for games that go to showdown
-    emit_countdown(game_id, delay, "round_countdown")
+    emit_deadline(game_id, deadline_payload("round", delay))
     start_next_round_after_delay(current_app._get_current_object(), game_id, delay=delay)
 
-def emit_countdown(game_id, seconds, event_name):
-    def countdown():
-        for i in reversed(range(seconds + 1)):
-            socketio.emit(event_name, {"seconds": i}, to=game_id)
-            time.sleep(1)
-    
-    Thread(target=countdown).start()
+def emit_deadline(game_id: str, payload: dict):
+    """One event per countdown; clients tick it down themselves (app/timer/deadline.py)."""
+    state.set_deadline(game_id, payload)
+    socketio.emit("deadline", payload, to=game_id)
 
 def start_next_round_after_delay(app, game_id, delay=10):
     def start_next_round():
@@ -230,7 +237,7 @@ def start_next_round_after_delay(app, game_id, delay=10):
             hand_number = state.increment_hand_number(game_id)
             recorder.start_hand(game_id, hand_number, game)
             socketio.emit("game_started", {"message": "Game joined successfully"}, to=game_id)
-            emit_updated_game_state(game)
+            emit_updated_game_state(game_id, game)
             emit_player_turn(game_id)
 
-    Timer(delay, start_next_round).start()
\ No newline at end of file
+    scheduler.call_later(delay, start_next_round, name="next_hand")
\ No newline at end of file
@@ -6,6 +6,12 @@ from flask_jwt_extended import decode_token
 from app.models.user import User
 from app.db import db
 import app.state as state
+from app.timer.deadline import server_time_ms
+
+@socketio.on("clock_sync")
+def handle_clock_sync(client_time=None):
+    """Clock-offset handshake for client-side countdowns; the return value is the ack."""
+    return {"client_time": client_time, "server_time": server_time_ms()}
 
 @socketio.on("connect")
 def connect_handler(auth):
@@ -27,7 +27,7 @@ def cashout_player(game: PokerRound, username: str) -> None:
         stack = player.chips
         print(f"cashing out {username}, with {stack} chips")
         update_player_chips(username, get_user_bankroll(username) + stack)
-        player.chips = 0
+        game.set_chips(player, 0)
     else:
         print(f"No player object found for player with username {username}")
 
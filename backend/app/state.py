@@ -1,6 +1,7 @@
 from app.globals import StatusEnum, games
 from app.globals import player_timers, connected_users, user_sids
 from app.game_logic import PokerRound
+from app.state_sync import StateSync
 from app.timer.inaction_timer import InactionTimer
 
 def check_game_id(game_id: str) -> bool:
@@ -29,6 +30,10 @@ def get_game(game_id: str) -> PokerRound | None:
 def set_game(game_id: str, game: PokerRound):
     games[game_id]["game"] = game
 
+def get_state_sync(game_id: str) -> StateSync:
+    """The table's versioned broadcast state (see app/state_sync.py), created on first use."""
+    return games[game_id].setdefault("sync", StateSync())
+
 def remove_game(game_id: str):
     if games.get(game_id):
         del games[game_id]
@@ -120,6 +125,13 @@ def get_game_status(game_id: str) -> StatusEnum:
 def set_game_status(game_id: str, status: StatusEnum):
     games[game_id]["status"] = status
 
+# countdown deadlines - the last "deadline" payload of each kind, resent on sync
+def set_deadline(game_id: str, payload: dict):
+    games[game_id].setdefault("deadlines", {})[payload["kind"]] = payload
+
+def get_deadlines(game_id: str) -> list[dict]:
+    return list(games.get(game_id, {}).get("deadlines", {}).values())
+
 # player timers
 def get_player_timer(game_id: str, username: str) -> InactionTimer | None:
     return player_timers.get(game_id, {}).get(username)
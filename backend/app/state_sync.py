@@ -0,0 +1,131 @@
+"""
+Versioned game-state sync: one room-wide delta per table update instead of
+a full serialize_for_player() snapshot per seat.
+
+Socket events:
+  state_delta    server -> game room, when the public view changed:
+                   {"seq": n,
+                    "changed":   {field: value},              # public fields replaced outright
+                    "board_add": [card, ...],                 # cards appended to the board
+                    "players":   {username: {field: value}}}  # seat changes, same roster and order
+                 (each key only when non-empty). Values are absolute, so a
+                 client at seq n - 1 reaches seq n by assignment; a client at
+                 any other seq asks for a snapshot instead.
+  private_state  server -> one player, when their PRIVATE_FIELDS changed:
+                   {"seq": n, field: value, ...}
+  sync_state     client -> server: snapshot please (reconnect, gap)
+  full_state     server -> client: {"seq": n, "state": {...serialize_for_player fields}}
+The GET /state route returns a snapshot's state fields plus "seq".
+
+Snapshots are built from JSON text: the public view is encoded once per
+seq and each requester's private fields are joined onto it.
+"""
+from __future__ import annotations
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+from app.game_logic import PokerRound
+from app.payloads import Encoded, dumps, join_objects
+
+
+def public_delta(old: dict, new: dict) -> dict:
+    """Fields of the public view new that differ from old, in state_delta form (without seq)."""
+    delta: dict = {}
+    changed = {}
+    for key, value in new.items():
+        if key not in old:
+            changed[key] = value
+            continue
+        before = old[key]
+        if before == value:
+            continue
+        if key == "board" and value[: len(before)] == before:
+            delta["board_add"] = value[len(before):]
+        elif key == "players" and [p["username"] for p in before] == [p["username"] for p in value]:
+            delta["players"] = {
+                now["username"]: {k: v for k, v in now.items() if was.get(k) != v}
+                for was, now in zip(before, value)
+                if was != now
+            }
+        else:
+            changed[key] = value
+    if changed:
+        delta["changed"] = changed
+    return delta
+
+
+class StateSync:
+    """
+    Per-table sync state: the sequence number, and the public and private
+    views as last broadcast. Updates may come from socket handlers, bot
+    threads and timers at once, so they are serialized by a lock; publish()
+    also emits under it, so clients receive deltas in seq order.
+    """
+
+    def __init__(self) -> None:
+        self.seq = 0
+        self._public: dict = {}
+        self._private: Dict[str, dict] = {}
+        self._public_json: Tuple[int, str] = (-1, "")
+        self._lock = threading.Lock()
+
+    def update(self, game: PokerRound) -> Tuple[Optional[dict], Dict[str, dict]]:
+        """
+        Diff the game against the last broadcast. Returns (state_delta
+        payload or None, {username: private_state payload}) to emit.
+        """
+        with self._lock:
+            return self._diff(game)
+
+    def publish(self, game: PokerRound, send: Callable[[Optional[dict], Dict[str, dict]], None]) -> None:
+        """update(), then send(delta, private_deltas) before the next update can take a seq."""
+        with self._lock:
+            send(*self._diff(game))
+
+    def _diff(self, game: PokerRound) -> Tuple[Optional[dict], Dict[str, dict]]:
+        public = game.serialize_public()
+        delta = public_delta(self._public, public)
+        if delta:
+            self.seq += 1
+            delta["seq"] = self.seq
+        self._public = public
+
+        private_deltas: Dict[str, dict] = {}
+        seated = game.get_players()
+        for name in seated:
+            private = game.serialize_private(name)
+            before = self._private.get(name, {})
+            changed = {k: v for k, v in private.items() if before.get(k) != v}
+            if changed:
+                changed["seq"] = self.seq
+                private_deltas[name] = changed
+            self._private[name] = private
+        for name in self._private.keys() - set(seated):
+            del self._private[name]
+        return delta or None, private_deltas
+
+    def snapshot(self, game: PokerRound, username: str) -> dict:
+        """
+        A full_state payload for username, consistent with seq: the views as
+        last broadcast, so the next state_delta applies on top of it.
+        """
+        with self._lock:
+            if not self._public:
+                return {"seq": self.seq, "state": game.serialize_for_player(username)}
+            private = self._private.get(username) or game.serialize_private(username)
+            return {"seq": self.seq, "state": {**self._public, **private}}
+
+    def encoded_state(self, game: PokerRound, username: str) -> Tuple[int, Encoded]:
+        """(seq, snapshot state as JSON text) - snapshot() without re-encoding the public view."""
+        with self._lock:
+            if not self._public:
+                return self.seq, Encoded(dumps(game.serialize_for_player(username)))
+            if self._public_json[0] != self.seq:
+                self._public_json = (self.seq, dumps(self._public))
+            private = self._private.get(username) or game.serialize_private(username)
+            return self.seq, join_objects(self._public_json[1], dumps(private))
+
+    def encoded_snapshot(self, game: PokerRound, username: str) -> Encoded:
+        """snapshot() as a full_state payload for socketio.emit."""
+        seq, state = self.encoded_state(game, username)
+        return Encoded(f'{{"seq":{seq},"state":{state}}}')
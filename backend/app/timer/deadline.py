@@ -0,0 +1,24 @@
+"""
+Countdowns as deadlines: the server sends one "deadline" event when a
+countdown starts and clients tick it down against their estimate of the
+server clock (frontend/src/helpers/clock.ts), instead of the server
+emitting every second.
+
+  deadline    server -> client: {"kind": "round" | "kick", "deadline": epoch ms,
+                                 "seconds": length, "username": kicked player (kick only)}
+  clock_sync  client -> server, with the client's Date.now(); the ack is
+              {"client_time": echoed, "server_time": epoch ms}, from which the
+              client estimates its offset NTP-style (half the round trip).
+"""
+import time
+
+
+def server_time_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def deadline_payload(kind: str, seconds: float, username: str | None = None) -> dict:
+    payload = {"kind": kind, "deadline": server_time_ms() + int(seconds * 1000), "seconds": seconds}
+    if username:
+        payload["username"] = username
+    return payload
@@ -1,6 +1,7 @@
 import threading
-import time
 import os
+from app import extensions
+from app.timer.deadline import deadline_payload
 
 class InactionTimer:
     def __init__(
@@ -11,7 +12,8 @@ class InactionTimer:
         username: str,
         delay: int = 30,
         get_game_callback=None,  # () => Game
-        kick_callback=None       # (username, game_id) => None
+        kick_callback=None,      # (username, game_id) => None
+        scheduler=None           # Scheduler that owns the kick deadline; default: the app's shared one
     ):
         self.socketio = socketio
         self.app = app
@@ -21,18 +23,18 @@ class InactionTimer:
 
         self.get_game_callback = get_game_callback
         self.kick_callback = kick_callback
+        self.scheduler = scheduler if scheduler is not None else extensions.scheduler
 
-        self.kick_timer = None
-        self.countdown_thread = None
+        self.kick_timer = None  # TimerHandle
+        self.deadline = None  # "deadline" event payload, set by start()
         self.cancel_event = threading.Event()
 
     def start(self):
         self.cancel_event.clear()
-        self.countdown_thread = threading.Thread(target=self._emit_countdown)
-        self.countdown_thread.start()
+        self.deadline = deadline_payload("kick", self.delay, self.username)
+        self.socketio.emit("deadline", self.deadline, to=self.username)
 
-        self.kick_timer = threading.Timer(self.delay, self._kick_player)
-        self.kick_timer.start()
+        self.kick_timer = self.scheduler.call_later(self.delay, self._kick_player, name="kick")
 
     def cancel(self):
         self.cancel_event.set()
@@ -41,19 +43,12 @@ class InactionTimer:
 
     def cleanup(self):
         self.kick_timer = None
-        self.countdown_thread = None
+        self.scheduler = None
         self.socketio = None
         self.app = None
         self.get_game_callback = None
         self.kick_callback = None
 
-    def _emit_countdown(self):
-        seconds_left = self.delay
-        while seconds_left >= 0 and not self.cancel_event.is_set():
-            self.socketio.emit("kick_countdown", {"seconds": seconds_left}, to=self.username)
-            time.sleep(1)
-            seconds_left -= 1
-
     def _kick_player(self):
         if self.cancel_event.is_set():
             return
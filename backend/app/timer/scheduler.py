@@ -0,0 +1,227 @@
+"""
+One timer queue for every table: kick deadlines, the pause between hands
+and bot wake-ups are entries in a single indexed min-heap instead of a
+thread or threading.Timer each.
+
+    handle = scheduler.call_later(45, kick, game_id, username, name="kick")
+    handle.cancel()
+
+Insert and cancel are O(log n): each handle knows its heap slot, so a
+cancelled timer is removed at once rather than left to expire. One loop
+task sleeps until the earliest deadline and hands due callbacks to spawn,
+one task each, so a slow callback (a bot asking a remote model) delays
+no other timer.
+
+The loop and the callbacks are started through spawn, which the app sets
+to socketio.start_background_task: green threads under eventlet, daemon
+threads in threading mode. The lock and condition come from threading,
+which eventlet.monkey_patch() makes green before this module is imported
+(app/__init__.py). metrics() reports scheduled and outstanding timers at
+GET /admin/metrics.
+"""
+from __future__ import annotations
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+log = logging.getLogger(__name__)
+
+Spawn = Callable[..., Any]
+
+
+def _spawn_thread(fn: Callable, *args: Any) -> threading.Thread:
+    thread = threading.Thread(target=fn, args=args, daemon=True)
+    thread.start()
+    return thread
+
+
+class TimerHandle:
+    """A scheduled callback; cancel() it any time before it fires."""
+
+    __slots__ = ("when", "seq", "name", "callback", "args", "_scheduler", "_index")
+
+    def __init__(self, scheduler: Scheduler, when: float, seq: int, name: str, callback: Callable, args: tuple) -> None:
+        self.when = when
+        self.seq = seq
+        self.name = name
+        self.callback = callback
+        self.args = args
+        self._scheduler = scheduler
+        self._index = -1  # heap slot, -1 once fired or cancelled
+
+    def __lt__(self, other: TimerHandle) -> bool:
+        return (self.when, self.seq) < (other.when, other.seq)
+
+    @property
+    def pending(self) -> bool:
+        return self._index >= 0
+
+    def cancel(self) -> bool:
+        """False if the timer already fired or was cancelled."""
+        return self._scheduler.cancel(self)
+
+    def __repr__(self) -> str:
+        return f"TimerHandle({self.name!r}, when={self.when:.3f}, pending={self.pending})"
+
+
+class Scheduler:
+    """
+    spawn(fn, *args) starts a task (default: a daemon thread). With
+    loop=False no loop task is started and the owner calls run_due(), as
+    tests do with a fake clock.
+    """
+
+    def __init__(
+        self,
+        spawn: Optional[Spawn] = None,
+        clock: Callable[[], float] = time.monotonic,
+        loop: bool = True,
+    ) -> None:
+        self._spawn = spawn or _spawn_thread
+        self._clock = clock
+        self._loop = loop
+        self._heap: List[TimerHandle] = []
+        self._cond = threading.Condition()
+        self._seq = 0
+        self._running = False
+        self._outstanding: Dict[str, int] = {}
+        self.scheduled = 0
+        self.fired = 0
+        self.cancelled = 0
+        self.max_lateness = 0.0
+
+    # ── public API ────────────────────────────────────────────────────────────
+
+    def call_later(self, delay: float, callback: Callable, *args: Any, name: str = "") -> TimerHandle:
+        """Run callback(*args) in delay seconds; starts the loop on first use."""
+        with self._cond:
+            self._seq += 1
+            handle = TimerHandle(self, self._clock() + delay, self._seq, name or callback.__name__, callback, args)
+            self._push(handle)
+            self.scheduled += 1
+            self._outstanding[handle.name] = self._outstanding.get(handle.name, 0) + 1
+            if handle._index == 0:
+                self._cond.notify()
+            if self._loop and not self._running:
+                self._running = True
+                self._spawn(self._run)
+        return handle
+
+    def cancel(self, handle: TimerHandle) -> bool:
+        with self._cond:
+            if handle._index < 0 or handle._scheduler is not self:
+                return False
+            was_first = handle._index == 0
+            self._remove(handle._index)
+            self.cancelled += 1
+            if was_first:
+                self._cond.notify()
+            return True
+
+    def run_due(self) -> int:
+        """Dispatch every timer that is due now; returns how many fired."""
+        with self._cond:
+            due = self._pop_due(self._clock())
+        for handle in due:
+            self._spawn(self._fire, handle)
+        return len(due)
+
+    def stop(self) -> None:
+        """End the loop task; pending timers stay queued until the next call_later."""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+
+    def metrics(self) -> dict:
+        with self._cond:
+            return {
+                "scheduled": self.scheduled,
+                "fired": self.fired,
+                "cancelled": self.cancelled,
+                "outstanding": len(self._heap),
+                "outstanding_by_name": {name: n for name, n in self._outstanding.items() if n},
+                "max_lateness_ms": round(self.max_lateness * 1e3, 3),
+            }
+
+    # ── loop ──────────────────────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running:
+                    now = self._clock()
+                    if self._heap and self._heap[0].when <= now:
+                        break
+                    self._cond.wait(self._heap[0].when - now if self._heap else None)
+                if not self._running:
+                    return
+                due = self._pop_due(self._clock())
+            for handle in due:
+                self._spawn(self._fire, handle)
+
+    def _pop_due(self, now: float) -> List[TimerHandle]:
+        due = []
+        while self._heap and self._heap[0].when <= now:
+            handle = self._heap[0]
+            self._remove(0)
+            self.fired += 1
+            self.max_lateness = max(self.max_lateness, now - handle.when)
+            due.append(handle)
+        return due
+
+    def _fire(self, handle: TimerHandle) -> None:
+        try:
+            handle.callback(*handle.args)
+        except Exception:
+            log.exception("timer %s failed", handle.name)
+
+    # ── indexed heap ──────────────────────────────────────────────────────────
+
+    def _push(self, handle: TimerHandle) -> None:
+        handle._index = len(self._heap)
+        self._heap.append(handle)
+        self._sift_up(handle._index)
+
+    def _remove(self, index: int) -> None:
+        heap = self._heap
+        handle = heap[index]
+        last = heap.pop()
+        if index < len(heap):
+            heap[index] = last
+            last._index = index
+            self._sift_down(index)
+            self._sift_up(last._index)
+        handle._index = -1
+        self._outstanding[handle.name] -= 1
+
+    def _sift_up(self, index: int) -> None:
+        heap = self._heap
+        handle = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not handle < heap[parent]:
+                break
+            heap[index] = heap[parent]
+            heap[index]._index = index
+            index = parent
+        heap[index] = handle
+        handle._index = index
+
+    def _sift_down(self, index: int) -> None:
+        heap = self._heap
+        size = len(heap)
+        handle = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if not heap[child] < handle:
+                break
+            heap[index] = heap[child]
+            heap[index]._index = index
+            index = child
+        heap[index] = handle
+        handle._index = index
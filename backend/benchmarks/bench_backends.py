@@ -0,0 +1,52 @@
+"""
+Hands per second for each installed evaluator backend (see app/game_logic/backend.py).
+
+Run from backend/:
+    python -m benchmarks.bench_backends --hands 1000000
+
+Each backend is warmed up first so JIT compilation is not timed. Scalar
+evaluate() runs over a Python list of hands, evaluate_batch() over one
+(N, k) array; both are checked against the pure-Python reference.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from app.game_logic.backend import BACKEND, available_backends, load_backend
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hands", type=int, default=1_000_000)
+    parser.add_argument("--scalar-hands", type=int, default=200_000)
+    parser.add_argument("--size", type=int, default=7, choices=(5, 6, 7))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    cards = np.argsort(rng.random((args.hands, 52)), axis=1)[:, : args.size]
+    rows = cards[: args.scalar_hands].tolist()
+    reference_eval, reference_batch = load_backend("python")
+    expected = reference_batch(cards)
+
+    print(f"{args.size}-card hands, seed={args.seed}, selected backend: {BACKEND}")
+    for name, (evaluate_fn, batch_fn) in available_backends().items():
+        evaluate_fn(rows[0])
+        batch_fn(cards[:10])
+
+        start = time.perf_counter()
+        scalar = [evaluate_fn(r) for r in rows]
+        scalar_rate = len(rows) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        batch = batch_fn(cards)
+        batch_rate = len(cards) / (time.perf_counter() - start)
+
+        mismatches = int((batch != expected).sum())
+        mismatches += sum(a != b for a, b in zip(scalar, (reference_eval(r) for r in rows)))
+        print(f"  {name:<7} scalar {scalar_rate:12,.0f} hands/s   batch {batch_rate:12,.0f} hands/s   mismatches {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark Hand.evaluate() against the original dict-and-list implementation.
+
+Run from backend/:
+    python -m benchmarks.bench_hand_class --hands 200000
+
+Both run on the same seeded sorted hands; every result is checked for the
+same (HandRank, card_ranks) output.
+"""
+import argparse
+import random
+import time
+
+from app.game_logic.card import ALL_CARDS, Card
+from app.game_logic.enums import HandRank
+from app.game_logic.hand import Hand
+
+
+def legacy_evaluate(cards: list) -> tuple:
+    """The pre-bitmask Hand.evaluate(), kept verbatim as the baseline."""
+    suit_counts: dict = {}
+    rank_counts: dict = {}
+
+    straight = True
+    ace_low_straight = False
+    prev_rank_index = Card.RANKS.index(cards[0].rank)
+
+    suit_counts[cards[0].suit] = suit_counts.get(cards[0].suit, 0) + 1
+    rank_counts[cards[0].rank] = rank_counts.get(cards[0].rank, 0) + 1
+
+    for i in range(1, len(cards)):
+        if Card.RANKS.index(cards[i].rank) != prev_rank_index + 1:
+            if Card.RANKS.index(cards[i].rank) == 12 and prev_rank_index == 3:
+                ace_low_straight = True
+            else:
+                straight = False
+        prev_rank_index = Card.RANKS.index(cards[i].rank)
+
+        suit_counts[cards[i].suit] = suit_counts.get(cards[i].suit, 0) + 1
+        rank_counts[cards[i].rank] = rank_counts.get(cards[i].rank, 0) + 1
+
+    flush_suit = [s for s in suit_counts if suit_counts[s] >= 5]
+
+    top_card_rank_index = Card.RANKS.index(cards[len(cards) - 1].rank)
+
+    if flush_suit and straight and not ace_low_straight and top_card_rank_index == Card.RANKS.index("A"):
+        return (HandRank.ROYAL_FLUSH, [])
+
+    if flush_suit and straight:
+        if ace_low_straight:
+            return (HandRank.STRAIGHT_FLUSH, [3])
+        return (HandRank.STRAIGHT_FLUSH, [top_card_rank_index])
+
+    quads_rank = [r for r in rank_counts if rank_counts[r] == 4]
+    if quads_rank:
+        return (
+            HandRank.QUADS,
+            [Card.RANKS.index(quads_rank[0])]
+            + [Card.RANKS.index(c.rank) for c in cards if Card.RANKS.index(c.rank) != Card.RANKS.index(quads_rank[0])],
+        )
+
+    trips_rank = [r for r in rank_counts if rank_counts[r] == 3]
+    trips_rank = Card.RANKS.index(trips_rank[0]) if trips_rank else None
+
+    pair_ranks = [r for r in rank_counts if (rank_counts[r] == 2 and r != trips_rank)]
+    if pair_ranks:
+        pair_ranks = [Card.RANKS.index(pr) for pr in pair_ranks]
+        pair_ranks.sort(reverse=True)
+
+    if trips_rank is not None and pair_ranks:
+        return (HandRank.FULL_HOUSE, [trips_rank, pair_ranks[0]])
+
+    if flush_suit:
+        return (HandRank.FLUSH, [top_card_rank_index])
+
+    if straight:
+        if ace_low_straight:
+            return (HandRank.STRAIGHT, [3])
+        return (HandRank.STRAIGHT, [top_card_rank_index])
+
+    if trips_rank is not None:
+        return (
+            HandRank.TRIPS,
+            [trips_rank]
+            + list(reversed([Card.RANKS.index(c.rank) for c in cards if Card.RANKS.index(c.rank) != trips_rank])),
+        )
+
+    if len(pair_ranks) == 2:
+        return (
+            HandRank.TWO_PAIR,
+            pair_ranks + [Card.RANKS.index(c.rank) for c in cards if Card.RANKS.index(c.rank) not in pair_ranks],
+        )
+
+    if pair_ranks:
+        return (
+            HandRank.PAIR,
+            [pair_ranks[0]]
+            + list(reversed([Card.RANKS.index(c.rank) for c in cards if Card.RANKS.index(c.rank) != pair_ranks[0]])),
+        )
+
+    return (HandRank.HIGH_CARD, list(reversed([Card.RANKS.index(c.rank) for c in cards])))
+
+
+def random_hands(n: int, size: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [sorted(ALL_CARDS[c] for c in rng.sample(range(52), size)) for _ in range(n)]
+
+
+def time_per_hand(fn, hands: list) -> float:
+    start = time.perf_counter()
+    for h in hands:
+        fn(h)
+    return (time.perf_counter() - start) / len(hands)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hands", type=int, default=200_000)
+    parser.add_argument("--size", type=int, default=5, choices=range(1, 8))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    hands = random_hands(args.hands, args.size, args.seed)
+    # Hand(...) sets up cards then calls evaluate(); call evaluate() alone to time just the scoring
+    shells = [Hand.__new__(Hand) for _ in hands]
+    for shell, cards in zip(shells, hands):
+        shell.cards = cards
+
+    mismatches = sum(shell.evaluate() != legacy_evaluate(cards) for shell, cards in zip(shells, hands))
+    new = time_per_hand(Hand.evaluate, shells)
+    legacy = time_per_hand(legacy_evaluate, hands)
+
+    print(f"{args.size}-card hands, seed={args.seed}, n={len(hands):,}")
+    print(f"  Hand.evaluate : {1 / new:12,.0f} hands/s  ({new * 1e6:.2f} us/hand)")
+    print(f"  legacy        : {1 / legacy:12,.0f} hands/s  ({legacy * 1e6:.2f} us/hand)")
+    print(f"  speedup       : {legacy / new:.1f}x")
+    print(f"  mismatches    : {mismatches} / {len(hands):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark the table evaluator against the original 21-combination loop.
+
+Run from backend/:
+    python -m benchmarks.bench_hand_eval --hands 2000000 --legacy-hands 50000
+
+The legacy path is ~two orders of magnitude slower, so it is timed on a
+smaller sample (drawn from the same seeded stream) and reported per hand.
+The NumPy batch evaluator is timed over the full sample as one array.
+All paths are checked for identical results on the legacy sample.
+"""
+import argparse
+import itertools
+import random
+import time
+
+import numpy as np
+
+from app.game_logic.card import ALL_CARDS
+from app.game_logic.evaluator import evaluate, evaluate_batch, pack_strength
+from app.game_logic.hand import Hand
+
+
+def legacy_best_strength(cards: list) -> int:
+    """The pre-evaluator best_hand_from_cards: build a Hand for every 5-card combo."""
+    best = None
+    for combo in itertools.combinations(sorted(cards), 5):
+        hand = Hand(list(combo), sorted=True)
+        if best is None or hand > best:
+            best = hand
+    return pack_strength(best.hand_rank, best.card_ranks)
+
+
+def random_hands(n: int, size: int, seed: int) -> list:
+    rng = random.Random(seed)
+    deck = list(range(52))
+    return [rng.sample(deck, size) for _ in range(n)]
+
+
+def time_per_hand(fn, hands: list) -> float:
+    start = time.perf_counter()
+    for h in hands:
+        fn(h)
+    return (time.perf_counter() - start) / len(hands)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hands", type=int, default=2_000_000)
+    parser.add_argument("--legacy-hands", type=int, default=50_000)
+    parser.add_argument("--size", type=int, default=7, choices=(5, 6, 7))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    hands = random_hands(args.hands, args.size, args.seed)
+    legacy_sample = [[ALL_CARDS[c] for c in h] for h in hands[: args.legacy_hands]]
+
+    mismatches = sum(
+        evaluate(ints) != legacy_best_strength(cards)
+        for ints, cards in zip(hands, legacy_sample)
+    )
+
+    new = time_per_hand(evaluate, hands)
+    legacy = time_per_hand(legacy_best_strength, legacy_sample)
+
+    array = np.array(hands, dtype=np.int64)
+    start = time.perf_counter()
+    batch_strengths = evaluate_batch(array)
+    batch = (time.perf_counter() - start) / len(hands)
+    mismatches += int((batch_strengths[: len(legacy_sample)] != [evaluate(h) for h in hands[: len(legacy_sample)]]).sum())
+
+    print(f"{args.size}-card hands, seed={args.seed}")
+    print(f"  evaluator : {1 / new:12,.0f} hands/s  ({new * 1e6:.2f} us/hand, n={len(hands):,})")
+    print(f"  legacy    : {1 / legacy:12,.0f} hands/s  ({legacy * 1e6:.2f} us/hand, n={len(legacy_sample):,})")
+    print(f"  batch     : {1 / batch:12,.0f} hands/s  ({batch * 1e6:.2f} us/hand, n={len(hands):,})")
+    print(f"  speedup   : {legacy / new:.1f}x scalar, {legacy / batch:.1f}x batch")
+    print(f"  mismatches: {mismatches} / {len(legacy_sample):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Memory footprint of the game engine: bytes per table and allocations per hand.
+
+Run from backend/:
+    python -m benchmarks.bench_memory --tables 200 --hands 200 --players 6
+
+"bytes per table" is the tracemalloc growth from building --tables idle
+PokerRounds (players, table, pot collection) divided by the table count.
+"per hand" plays --hands hands to showdown on one table (every player
+calls and checks down; uneven stacks create side pots) and reports, per
+hand, the memory blocks and bytes left allocated afterwards (pots, hands,
+chip-change maps the table holds on to) and the peak transient bytes
+while the hand runs. Engine logging is silenced.
+"""
+import argparse
+import tracemalloc
+
+from app.game_logic import Player, PokerRound, set_log_level
+
+
+def build_tables(count: int, players: int) -> list:
+    return [
+        PokerRound([Player(f"t{t}p{i}", 1_000 + 50 * i) for i in range(players)], 5, 10, seed=t)
+        for t in range(count)
+    ]
+
+
+def play_hand(game: PokerRound) -> None:
+    game.start_next_round()
+    while not game.is_action_finished:
+        info = game.get_player_to_act_and_actions()
+        actions = {a["action"] for a in info["available_actions"]}
+        action = "check" if "check" in actions else "call"
+        game.handle_player_action(info["player_to_act"], action, None)
+    game.end_poker_round()
+    # Refill stacks so the table never runs dry
+    for player in game.table._seats:
+        if player.chips < 500:
+            game.set_chips(player, 500)
+
+
+def bytes_per_table(tables: int, players: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build_tables(tables, players)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / tables
+
+
+def allocations_per_hand(hands: int, players: int) -> tuple:
+    """(blocks left allocated, bytes left allocated, peak transient bytes) per hand."""
+    game = build_tables(1, players)[0]
+    play_hand(game)  # warm caches and lazily built tables
+    tracemalloc.start()
+    blocks = size = peak = 0
+    for _ in range(hands):
+        snapshot = tracemalloc.take_snapshot()
+        start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        play_hand(game)
+        peak += tracemalloc.get_traced_memory()[1] - start
+        diff = tracemalloc.take_snapshot().compare_to(snapshot, "filename")
+        blocks += sum(max(s.count_diff, 0) for s in diff)
+        size += sum(max(s.size_diff, 0) for s in diff)
+    tracemalloc.stop()
+    return blocks / hands, size / hands, peak / hands
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", type=int, default=200)
+    parser.add_argument("--hands", type=int, default=200)
+    parser.add_argument("--players", type=int, default=6)
+    args = parser.parse_args()
+
+    set_log_level("silent")
+    per_table = bytes_per_table(args.tables, args.players)
+    blocks, size, peak = allocations_per_hand(args.hands, args.players)
+
+    print(f"{args.players}-player tables")
+    print(f"  bytes per table      : {per_table:10,.0f}  (n={args.tables})")
+    print(f"  blocks kept per hand : {blocks:10,.1f}  (n={args.hands})")
+    print(f"  bytes kept per hand  : {size:10,.0f}")
+    print(f"  peak bytes per hand  : {peak:10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Turn advancement cost: Table.next_active (seat links) against the old
+list.index walk that stepped seat by seat past folded and all-in players.
+
+Run from backend/:
+    python -m benchmarks.bench_table --seats 8 --hands 20000
+
+Each simulated hand folds or puts all-in a random subset of the table one
+player at a time, asking for the next player to act after every change,
+the way PokerRound does between actions. Both walks must agree.
+"""
+import argparse
+import random
+import time
+
+from app.game_logic import Player, Table
+
+
+def legacy_next_active(table: Table, player: Player) -> Player:
+    """The pre-link traversal: _seats.index on every hop."""
+    seats = table._seats
+    while True:
+        player = seats[(seats.index(player) + 1) % table.num_seats]
+        if not (player.folded or player.allin):
+            return player
+
+
+def scripts(hands: int, seats: int, seed: int) -> list:
+    """Per hand: the order in which seats drop out (all but one)."""
+    rng = random.Random(seed)
+    return [rng.sample(range(seats), seats - 1) for _ in range(hands)]
+
+
+def run(table: Table, hands: list, linked: bool) -> tuple:
+    players = table._seats
+    step = table.next_active if linked else (lambda p: legacy_next_active(table, p))
+    checksum = 0
+    start = time.perf_counter()
+    for order in hands:
+        table.reset()
+        current = players[0]
+        for seat in order:
+            player = players[seat]
+            player.folded = True
+            if linked:
+                table.deactivate(player)
+            current = step(current)
+            checksum += current.seat
+    return time.perf_counter() - start, checksum
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seats", type=int, default=8)
+    parser.add_argument("--hands", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    table = Table(args.seats, [Player(f"P{i}") for i in range(args.seats)], max_seats=args.seats)
+    hands = scripts(args.hands, args.seats, args.seed)
+    hops = args.hands * (args.seats - 1)
+
+    legacy_time, legacy_sum = run(table, hands, linked=False)
+    linked_time, linked_sum = run(table, hands, linked=True)
+    assert legacy_sum == linked_sum, "walks disagree"
+
+    print(f"{args.seats} seats, {hops:,} turn advances")
+    print(f"  list.index walk : {hops / legacy_time:12,.0f} advances/s")
+    print(f"  seat links      : {hops / linked_time:12,.0f} advances/s  ({legacy_time / linked_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+"""
+Benchmark suite for the game engine, with JSON results and regression checks.
+
+Run from backend/:
+    python -m benchmarks.suite                        # all cases, writes benchmarks/results/<commit>-<time>.json
+    python -m benchmarks.suite --only pot bot         # cases whose name contains "pot" or "bot"
+    python -m benchmarks.suite --scale 0.2 --baseline benchmarks/results/before.json
+
+Micro cases: hand evaluation (scalar and batch, selected backend),
+best_hand_from_cards over 7 Card objects, serialize_for_player, side-pot
+resolution with 8 all-in stacks (both pot engines). Macro cases: full
+PokerRound hands (check/call driver, no bots), full hands between
+heuristic and random bots, and heuristic bot decision latency per phase
+(with the postflop score cache cleared before each repeat).
+
+Every case is run --repeat times after a warm-up and reports the median
+(rates in ops/s, latencies in us/op) plus the spread. With --baseline the
+medians are compared against an earlier results file. Any case that is
+worse by more than --threshold (default 10%) is flagged, and the exit
+status is 1. --scale multiplies every case's workload (e.g. 0.1 for CI).
+Engine logging is silenced.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.bot.decision_engine import RandomDecisionEngine
+from app.bot.heuristic_engine import HeuristicDecisionEngine, _postflop_components
+from app.bot.simulator import play_hand
+from app.game_logic import ALL_CARDS, Player, PokerRound, PotCollection, PotLedger, best_hand_from_cards, set_log_level
+from app.game_logic.backend import BACKEND, evaluate, evaluate_batch
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+PHASES = ("preflop", "flop", "turn", "river")
+
+
+@dataclass
+class Case:
+    name: str
+    unit: str  # "ops/s" (higher is better) or "us/op" (lower is better)
+    ops: int  # workload at --scale 1
+    # setup(ops) -> run(); run() does the work and returns the op count it timed
+    # together with the seconds spent (or None to time the whole call)
+    setup: Callable[[int], Callable[[], tuple]]
+
+
+CASES: List[Case] = []
+
+
+def case(name: str, unit: str, ops: int):
+    def register(setup):
+        CASES.append(Case(name, unit, ops, setup))
+        return setup
+    return register
+
+
+def _seeded_hands(n: int, size: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return np.argsort(rng.random((n, 52)), axis=1)[:, :size]
+
+
+def _check_call(game: PokerRound, rng: random.Random) -> tuple:
+    """A cheap action for the player to act: mostly check/call, sometimes a min raise or fold."""
+    info = game.get_player_to_act_and_actions()
+    options = info["available_actions"]
+    roll = rng.random()
+    if roll < 0.1 and len(options) > 1 and options[1]["min"]:
+        return info["player_to_act"], options[1]["action"], options[1]["min"]
+    if roll < 0.2 and any(o["action"] == "fold" for o in options):
+        return info["player_to_act"], "fold", None
+    return info["player_to_act"], options[0]["action"], None
+
+
+def _table(players: int, seed: int, stacks: Optional[List[int]] = None) -> PokerRound:
+    stacks = stacks or [1_000 + 100 * i for i in range(players)]
+    return PokerRound([Player(f"p{i}", s) for i, s in enumerate(stacks)], 5, 10, seed=seed)
+
+
+def _refill(game: PokerRound, chips: int = 500) -> None:
+    for player in game.table._seats:
+        player.chips = max(player.chips, chips)
+
+
+# ── micro ──────────────────────────────────────────────────────────────────
+
+
+@case("hand_eval_7card", "ops/s", 200_000)
+def _hand_eval(ops: int):
+    rows = _seeded_hands(ops, 7).tolist()
+
+    def run():
+        for r in rows:
+            evaluate(r)
+        return len(rows), None
+    return run
+
+
+@case("hand_eval_7card_batch", "ops/s", 2_000_000)
+def _hand_eval_batch(ops: int):
+    cards = _seeded_hands(ops, 7)
+
+    def run():
+        evaluate_batch(cards)
+        return len(cards), None
+    return run
+
+
+@case("best_hand_from_cards_7", "ops/s", 50_000)
+def _best_hand(ops: int):
+    hands = [[ALL_CARDS[c] for c in row] for row in _seeded_hands(ops, 7).tolist()]
+
+    def run():
+        for h in hands:
+            best_hand_from_cards(h)
+        return len(hands), None
+    return run
+
+
+@case("serialize_for_player", "ops/s", 20_000)
+def _serialize(ops: int):
+    """serialize_for_player for every seat after every action of 6-max hands; only the serialization is timed."""
+    def run():
+        game, rng = _table(6, seed=1), random.Random(1)
+        names = [p.name for p in game.table._seats]
+        done = elapsed = 0
+        while done < ops:
+            _refill(game)
+            game.start_next_round()
+            while not game.is_action_finished and done < ops:
+                game.handle_player_action(*_check_call(game, rng))
+                start = time.perf_counter()
+                for name in names:
+                    game.serialize_for_player(name)
+                elapsed += time.perf_counter() - start
+                done += len(names)
+            if game.is_action_finished:
+                game.end_poker_round()
+        return done, elapsed
+    return run
+
+
+def _side_pot_setup(pot_cls):
+    def setup(ops: int):
+        players = [Player(f"p{i}", 100 * (i + 1)) for i in range(8)]
+        for seat, player in enumerate(players):
+            player.seat = seat
+        seats = tuple(players)
+        board = list(ALL_CARDS[:5])
+        hands = {p: best_hand_from_cards([ALL_CARDS[10 + 2 * i], ALL_CARDS[11 + 2 * i]] + board) for i, p in enumerate(players)}
+        ranked = [[p] for p in sorted(players, key=lambda p: hands[p].strength, reverse=True)]
+        active = set(players)
+
+        def run():
+            for _ in range(ops):
+                for player in players:
+                    player.chips = 100 * (player.seat + 1)
+                    player.current_bet = 0
+                    player.allin = False
+                pots = pot_cls(seats)
+                for player in reversed(players):  # shortest stack last: every all-in restructures
+                    pots.add_contribution(player, player.bet(1_000))
+                pots.end_betting_round()
+                pots.award_pot(ranked, active, hands)
+            return ops, None
+        return run
+    return setup
+
+
+case("pot_side_pots_collection", "ops/s", 5_000)(_side_pot_setup(PotCollection))
+case("pot_side_pots_ledger", "ops/s", 5_000)(_side_pot_setup(PotLedger))
+
+
+# ── macro ──────────────────────────────────────────────────────────────────
+
+
+@case("round_hands_checkdown", "ops/s", 2_000)
+def _round_hands(ops: int):
+    """Full 6-max PokerRound hands, engine only: cheap scripted actions, no bots."""
+    def run():
+        game, rng = _table(6, seed=2), random.Random(2)
+        for _ in range(ops):
+            _refill(game)
+            game.start_next_round()
+            while not game.is_action_finished:
+                game.handle_player_action(*_check_call(game, rng))
+            game.end_poker_round()
+        return ops, None
+    return run
+
+
+@case("simulate_bot_hands", "ops/s", 1_000)
+def _bot_hands(ops: int):
+    """Full 3-handed hands between the heuristic bot and two random bots (simulator.play_hand)."""
+    def run():
+        random.seed(3)
+        game = _table(3, seed=3)
+        engines = {"p0": HeuristicDecisionEngine(), "p1": RandomDecisionEngine(), "p2": RandomDecisionEngine()}
+        for _ in range(ops):
+            _refill(game)
+            play_hand(game, engines)
+        return ops, None
+    return run
+
+
+def _decision_states(count: int, seed: int = 4) -> Dict[str, list]:
+    """count (game_state, available_actions) pairs per phase, from seeded 4-max hands."""
+    states: Dict[str, list] = {phase: [] for phase in PHASES}
+    game, rng = _table(4, seed=seed), random.Random(seed)
+    while min(len(s) for s in states.values()) < count:
+        _refill(game)
+        game.start_next_round()
+        while not game.is_action_finished:
+            name = game.get_player_to_act_and_actions()["player_to_act"]
+            state = game.serialize_for_player(name)
+            bucket = states[str(state["phase"])]
+            if len(bucket) < count:
+                bucket.append((state, state["available_actions"]))
+            game.handle_player_action(*_check_call(game, rng))
+        game.end_poker_round()
+    return states
+
+
+def _bot_latency_setup(phase: str):
+    def setup(ops: int):
+        samples = _decision_states(ops)[phase]
+
+        def run():
+            _postflop_components.cache_clear()  # time the scoring, not cache hits from the last repeat
+            engine = HeuristicDecisionEngine()
+            for state, actions in samples:
+                engine.decide(state, actions)
+            return len(samples), None
+        return run
+    return setup
+
+
+for _phase in PHASES:
+    case(f"bot_decision_{_phase}", "us/op", 300)(_bot_latency_setup(_phase))
+
+
+# ── runner ─────────────────────────────────────────────────────────────────
+
+
+def run_case(c: Case, scale: float, repeat: int) -> dict:
+    run = c.setup(max(1, int(c.ops * scale)))
+    run()  # warm-up: JIT, lazily built tables, caches
+    values = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ops, elapsed = run()
+        elapsed = elapsed if elapsed is not None else time.perf_counter() - start
+        values.append(ops / elapsed if c.unit == "ops/s" else elapsed / ops * 1e6)
+    return {
+        "unit": c.unit,
+        "median": statistics.median(values),
+        "min": min(values),
+        "max": max(values),
+        "ops": ops,
+        "repeat": repeat,
+    }
+
+
+def metadata(scale: float) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "unknown"
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "evaluator_backend": BACKEND,
+        "scale": scale,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+    """Print current vs baseline medians; returns the names of regressed cases."""
+    regressions = []
+    print(f"\nvs baseline {baseline['meta'].get('commit')} ({baseline['meta'].get('timestamp')}), threshold {threshold:.0%}")
+    for name, current in results.items():
+        before = baseline["results"].get(name)
+        if before is None or before["unit"] != current["unit"]:
+            print(f"  {name:<28} (no baseline)")
+            continue
+        change = current["median"] / before["median"] - 1
+        worse = -change if current["unit"] == "ops/s" else change
+        flag = "REGRESSION" if worse > threshold else ""
+        if flag:
+            regressions.append(name)
+        print(f"  {name:<28} {before['median']:14,.2f} -> {current['median']:14,.2f} {current['unit']:<6} {change:+7.1%}  {flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="*", default=None, help="run cases whose name contains any of these")
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--out", default=None, help="results file (default: benchmarks/results/<commit>-<time>.json)")
+    parser.add_argument("--baseline", default=None, help="earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args()
+
+    cases = [c for c in CASES if not args.only or any(s in c.name for s in args.only)]
+    if args.list:
+        for c in cases:
+            print(f"{c.name:<28} {c.unit}")
+        return
+
+    set_log_level("silent")
+    meta = metadata(args.scale)
+    results = {}
+    for c in cases:
+        results[c.name] = r = run_case(c, args.scale, args.repeat)
+        print(f"  {c.name:<28} {r['median']:14,.2f} {c.unit:<6} (min {r['min']:,.2f}, max {r['max']:,.2f})", flush=True)
+
+    out = args.out
+    if out is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = meta["timestamp"].replace(":", "").replace("-", "")[:15]
+        out = os.path.join(RESULTS_DIR, f"{meta['commit']}-{stamp}.json")
+    with open(out, "w") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2)
+    print(f"results written to {out}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import threading
+from unittest.mock import MagicMock
+
+from app import extensions
+from app.timer.deadline import deadline_payload, server_time_ms
+from app.timer.inaction_timer import InactionTimer
+from app.timer.scheduler import Scheduler
+
+
+class TestDeadline:
+    def test_payload(self):
+        now = server_time_ms()
+        payload = deadline_payload("kick", 45, "bob")
+        assert payload["kind"] == "kick" and payload["username"] == "bob" and payload["seconds"] == 45
+        assert now + 45_000 <= payload["deadline"] <= server_time_ms() + 45_000
+        assert "username" not in deadline_payload("round", 10)
+
+    def test_inaction_timer_emits_one_deadline(self, monkeypatch):
+        monkeypatch.setenv("FLASK_ENV", "production")
+        socketio = MagicMock()
+        scheduler = Scheduler(loop=False)
+        threads = threading.active_count()
+        timer = InactionTimer(socketio, MagicMock(), "game_1", "bob", delay=45, scheduler=scheduler)
+        timer.start()
+        socketio.emit.assert_called_once_with("deadline", timer.deadline, to="bob")
+        assert timer.deadline["seconds"] == 45
+        assert threading.active_count() == threads  # the kick is a scheduler entry, not a thread
+        assert scheduler.metrics()["outstanding_by_name"] == {"kick": 1}
+        timer.cancel()
+        assert scheduler.metrics()["outstanding"] == 0
+
+    def test_inaction_timer_defaults_to_shared_scheduler(self, monkeypatch):
+        scheduler = Scheduler(loop=False)
+        monkeypatch.setattr(extensions, "scheduler", scheduler)
+        timer = InactionTimer(MagicMock(), MagicMock(), "game_1", "bob", delay=45)
+        timer.start()
+        assert timer.scheduler is scheduler
+        assert scheduler.metrics()["outstanding_by_name"] == {"kick": 1}
+        timer.cancel()
+        assert scheduler.metrics()["outstanding"] == 0
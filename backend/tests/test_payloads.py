@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from app.game_logic import PokerRound
+from app.payloads import Encoded, SocketJSON, dumps, encode, encode_stats, join_objects
+from app.state_sync import StateSync
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats():
+    encode_stats.reset()
+    yield
+    encode_stats.reset()
+
+
+class TestEncoding:
+    def test_dumps_matches_json(self):
+        game = PokerRound(["a", "b", "c"], 5, 10, seed=1)
+        game.start_round()
+        state = game.serialize_for_player("a")
+        assert json.loads(dumps(state)) == json.loads(json.dumps(state))
+        assert json.loads(dumps({"big": 1 << 70})) == {"big": 1 << 70}
+
+    def test_join_objects(self):
+        joined = join_objects(dumps({"a": 1, "b": [1, 2]}), "{}", dumps({"c": None}))
+        assert isinstance(joined, Encoded)
+        assert json.loads(joined) == {"a": 1, "b": [1, 2], "c": None}
+
+    def test_stats(self):
+        encode({"x": 1})
+        encode({"x": 2})
+        stats = encode_stats.snapshot()
+        assert stats["encodes"] == 2 and stats["reused"] == 0
+        assert stats["max_us"] > 0 and stats["encoder"] in ("orjson", "json")
+
+
+class TestSocketJSON:
+    def test_encoded_args_are_spliced(self):
+        payload = encode({"seconds": 7})
+        encodes = encode_stats.snapshot()["encodes"]
+        packet = SocketJSON.dumps(["deadline", payload], separators=(",", ":"))
+        assert packet == '["deadline",{"seconds":7}]'
+        stats = encode_stats.snapshot()
+        assert stats["encodes"] == encodes + 1  # the event name only
+        assert stats["reused"] == 1
+
+    def test_plain_packets(self):
+        packet = SocketJSON.dumps(["state_delta", {"seq": 3, "changed": {"phase": "flop"}}])
+        assert SocketJSON.loads(packet) == ["state_delta", {"seq": 3, "changed": {"phase": "flop"}}]
+
+
+class TestEncodedSnapshot:
+    def test_matches_snapshot(self):
+        game = PokerRound(["a", "b", "c"], 5, 10, seed=4)
+        game.start_round()
+        sync = StateSync()
+        assert json.loads(sync.encoded_snapshot(game, "a")) == sync.snapshot(game, "a")
+        sync.update(game)
+        for name in ("a", "b", "c"):
+            assert json.loads(sync.encoded_snapshot(game, name)) == sync.snapshot(game, name)
+
+    def test_public_view_encoded_once_per_seq(self):
+        game = PokerRound(["a", "b", "c"], 5, 10, seed=4)
+        game.start_round()
+        sync = StateSync()
+        sync.update(game)
+        sync.encoded_state(game, "a")
+        encodes = encode_stats.snapshot()["encodes"]
+        sync.encoded_state(game, "b")
+        sync.encoded_state(game, "c")
+        assert encode_stats.snapshot()["encodes"] == encodes + 2  # private fields only
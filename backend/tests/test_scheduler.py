@@ -0,0 +1,99 @@
+import random
+import threading
+
+from app.timer.scheduler import Scheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def inline(fn, *args):
+    fn(*args)
+
+
+def make_scheduler():
+    clock = FakeClock()
+    return Scheduler(spawn=inline, clock=clock, loop=False), clock
+
+
+class TestScheduler:
+    def test_fires_in_deadline_order(self):
+        scheduler, clock = make_scheduler()
+        fired = []
+        for delay, label in [(3, "c"), (1, "a"), (2, "b"), (1, "a2")]:
+            scheduler.call_later(delay, fired.append, label)
+        clock.now = 1.5
+        assert scheduler.run_due() == 2
+        assert fired == ["a", "a2"]
+        clock.now = 10
+        scheduler.run_due()
+        assert fired == ["a", "a2", "b", "c"]
+
+    def test_cancel(self):
+        scheduler, clock = make_scheduler()
+        fired = []
+        first = scheduler.call_later(1, fired.append, "first")
+        second = scheduler.call_later(2, fired.append, "second")
+        assert first.cancel() and not first.pending
+        assert not first.cancel()
+        clock.now = 5
+        scheduler.run_due()
+        assert fired == ["second"]
+        assert not second.cancel()
+
+    def test_heap_stays_ordered_under_random_cancels(self):
+        scheduler, clock = make_scheduler()
+        rng = random.Random(3)
+        fired, live = [], {}
+        for i in range(500):
+            live[i] = scheduler.call_later(rng.random() * 100, fired.append, i)
+        for i in rng.sample(sorted(live), 200):
+            assert live.pop(i).cancel()
+        assert all(h._index == i for i, h in enumerate(scheduler._heap))
+        clock.now = 100
+        scheduler.run_due()
+        assert fired == sorted(live, key=lambda i: live[i].when)
+
+    def test_metrics(self):
+        scheduler, clock = make_scheduler()
+        scheduler.call_later(1, lambda: None, name="kick")
+        scheduler.call_later(1, lambda: None, name="kick").cancel()
+        scheduler.call_later(5, lambda: None, name="next_hand")
+        clock.now = 1.25
+        scheduler.run_due()
+        assert scheduler.metrics() == {
+            "scheduled": 3,
+            "fired": 1,
+            "cancelled": 1,
+            "outstanding": 1,
+            "outstanding_by_name": {"next_hand": 1},
+            "max_lateness_ms": 250.0,
+        }
+
+    def test_failing_callback_does_not_stop_others(self):
+        scheduler, clock = make_scheduler()
+        fired = []
+        scheduler.call_later(1, lambda: 1 / 0, name="broken")
+        scheduler.call_later(1, fired.append, "ok")
+        clock.now = 1
+        scheduler.run_due()
+        assert fired == ["ok"]
+
+    def test_loop_task(self):
+        scheduler = Scheduler()
+        done = threading.Event()
+        order = []
+        scheduler.call_later(0.2, done.set)
+        scheduler.call_later(0.05, order.append, "early")
+        scheduler.call_later(0.01, order.append, "cancelled").cancel()
+        try:
+            assert done.wait(2)
+            assert order == ["early"]
+            assert scheduler.metrics()["outstanding"] == 0
+        finally:
+            scheduler.stop()
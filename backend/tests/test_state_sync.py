@@ -0,0 +1,141 @@
+import itertools
+import random
+import threading
+import time
+
+from app.game_logic import PokerRound
+from app.state_sync import StateSync, public_delta
+
+
+def apply_delta(view: dict, delta: dict) -> dict:
+    """What the client does with a state_delta (frontend/src/helpers/stateSync.ts)."""
+    view = {**view, **delta.get("changed", {})}
+    if "board_add" in delta:
+        view["board"] = view["board"] + delta["board_add"]
+    if "players" in delta:
+        view["players"] = [{**p, **delta["players"].get(p["username"], {})} for p in view["players"]]
+    return view
+
+
+def play_action(game: PokerRound, rng: random.Random) -> str:
+    info = game.get_player_to_act_and_actions()
+    options = [a["action"] for a in info["available_actions"]]
+    action = "call" if "call" in options else "check"
+    if rng.random() < 0.2 and "fold" in options:
+        action = "fold"
+    game.handle_player_action(info["player_to_act"], action, None)
+    return info["player_to_act"]
+
+
+class TestPublicDelta:
+    def test_fields(self):
+        old = {"board": ["2 of clubs"], "pots": [], "players": [{"username": "a", "chips": 10, "folded": False}]}
+        new = {"board": ["2 of clubs", "3 of clubs"], "pots": [{"amount": 5, "players": ["a"]}],
+               "players": [{"username": "a", "chips": 5, "folded": False}]}
+        assert public_delta(old, new) == {
+            "board_add": ["3 of clubs"],
+            "players": {"a": {"chips": 5}},
+            "changed": {"pots": [{"amount": 5, "players": ["a"]}]},
+        }
+        assert public_delta(new, new) == {}
+
+    def test_new_hand_and_reseating_replace_fields(self):
+        old = {"board": ["2 of clubs"], "players": [{"username": "a"}, {"username": "b"}]}
+        new = {"board": [], "players": [{"username": "b"}, {"username": "a"}]}
+        assert public_delta(old, new) == {"changed": new}
+
+
+class TestStateSync:
+    def test_deltas_rebuild_every_view(self):
+        rng = random.Random(5)
+        game = PokerRound(["a", "b", "c"], 5, 10, seed=5)
+        game.start_round()
+        sync = StateSync()
+        sync.update(game)
+        names = game.get_players()
+        views = {name: sync.snapshot(game, name)["state"] for name in names}
+        seq = sync.seq
+        for _ in range(4):
+            while not game.is_action_finished:
+                play_action(game, rng)
+                delta, private = sync.update(game)
+                if delta:
+                    assert delta["seq"] == seq + 1
+                    seq = delta["seq"]
+                    views = {name: apply_delta(v, delta) for name, v in views.items()}
+                for name, fields in private.items():
+                    views[name].update({k: v for k, v in fields.items() if k != "seq"})
+                for name in names:
+                    assert views[name] == game.serialize_for_player(name)
+            game.end_poker_round()
+            game.start_next_round()
+            delta, private = sync.update(game)
+            seq = delta["seq"]
+            assert "my_cards" in private["a"]
+            views = {name: {**apply_delta(v, delta), **{k: x for k, x in private[name].items() if k != "seq"}}
+                     for name, v in views.items()}
+            for name in names:
+                assert views[name] == game.serialize_for_player(name)
+
+    def test_street_sends_board_additions(self):
+        game = PokerRound(["a", "b"], 5, 10, seed=2)
+        game.start_round()
+        sync = StateSync()
+        sync.update(game)
+        game.handle_player_action(game.get_player_to_act_and_actions()["player_to_act"], "call")
+        sync.update(game)
+        game.handle_player_action(game.get_player_to_act_and_actions()["player_to_act"], "check")
+        delta, _ = sync.update(game)
+        assert len(delta["board_add"]) == 3
+        assert "board" not in delta.get("changed", {})
+
+    def test_no_change_no_broadcast(self):
+        game = PokerRound(["a", "b"], 5, 10, seed=1)
+        game.start_round()
+        sync = StateSync()
+        first, private = sync.update(game)
+        assert first["seq"] == 1 and set(private) == {"a", "b"}
+        assert sync.update(game) == (None, {})
+        assert sync.seq == 1
+
+    def test_snapshot_matches_last_broadcast(self):
+        rng = random.Random(1)
+        game = PokerRound(["a", "b", "c"], 5, 10, seed=1)
+        game.start_round()
+        sync = StateSync()
+        sync.update(game)
+        broadcast = game.serialize_for_player("b")
+        play_action(game, rng)  # not broadcast yet
+        snapshot = sync.snapshot(game, "b")
+        assert snapshot == {"seq": 1, "state": broadcast}
+        delta, _ = sync.update(game)
+        assert apply_delta(snapshot["state"], delta)["players"] == game.serialize_public()["players"]
+
+    def test_publish_sends_in_seq_order(self):
+        class ChangingGame:
+            """Every serialize_public() is a new public view."""
+            def __init__(self):
+                self.counter = itertools.count()
+
+            def serialize_public(self):
+                return {"phase": next(self.counter)}
+
+            def get_players(self):
+                return []
+
+        game, sync, sent = ChangingGame(), StateSync(), []
+
+        def send(delta, private):
+            time.sleep(0.001)  # an emit that yields, widening the race
+            sent.append(delta["seq"])
+
+        def publisher():
+            for _ in range(20):
+                sync.publish(game, send)
+
+        threads = [threading.Thread(target=publisher) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sent == list(range(1, 161))
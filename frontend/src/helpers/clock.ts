@@ -0,0 +1,57 @@
+import { useEffect, useState } from "react";
+import { Socket } from "socket.io-client";
+import { Deadline } from "../types";
+
+// Countdowns tick locally against the server clock; the server only sends
+// the deadline (see backend/app/timer/deadline.py)
+
+let offsetMs = 0; // server clock minus local clock
+
+export const serverNow = () => Date.now() + offsetMs;
+
+const sampleOffset = (socket: Socket) =>
+  new Promise<{ offset: number; rtt: number }>((resolve) => {
+    const sent = Date.now();
+    socket.emit("clock_sync", sent, ({ server_time }: { server_time: number }) => {
+      const received = Date.now();
+      resolve({ offset: server_time - (sent + received) / 2, rtt: received - sent });
+    });
+  });
+
+// NTP-style: keep the offset from the sample with the shortest round trip
+export const syncClock = async (socket: Socket, samples = 4) => {
+  let best = { offset: 0, rtt: Infinity };
+  for (let i = 0; i < samples; i++) {
+    const sample = await sampleOffset(socket);
+    if (sample.rtt < best.rtt) {
+      best = sample;
+    }
+  }
+  offsetMs = best.offset;
+};
+
+const secondsLeft = (deadline: Deadline) =>
+  Math.max(0, Math.ceil((deadline.deadline - serverNow()) / 1000));
+
+// Whole seconds until the deadline, re-rendered as they tick over
+export const useCountdown = (deadline: Deadline | null, idle = 999) => {
+  const [seconds, setSeconds] = useState(idle);
+
+  useEffect(() => {
+    if (!deadline) {
+      setSeconds(idle);
+      return;
+    }
+    setSeconds(secondsLeft(deadline));
+    const interval = setInterval(() => {
+      const left = secondsLeft(deadline);
+      setSeconds(left);
+      if (left === 0) {
+        clearInterval(interval);
+      }
+    }, 250);
+    return () => clearInterval(interval);
+  }, [deadline, idle]);
+
+  return seconds;
+};
@@ -0,0 +1,20 @@
+import { GameData, PrivateState, StateDelta } from "../types";
+
+// Mirrors the state_delta format documented in backend/app/state_sync.py
+export const applyStateDelta = (data: GameData, delta: StateDelta): GameData => {
+  const next = { ...data, ...delta.changed };
+  if (delta.board_add) {
+    next.board = [...next.board, ...delta.board_add];
+  }
+  if (delta.players) {
+    const changes = delta.players;
+    next.players = next.players.map((p) => ({ ...p, ...changes[p.username] }));
+  }
+  return next;
+};
+
+export const applyPrivateState = (data: GameData, update: PrivateState): GameData => {
+  const next = { ...data, ...update };
+  delete (next as Partial<PrivateState>).seq;
+  return next;
+};
@@ -15,6 +15,27 @@ export interface GameData {
   phase: string;
 }
 
+export interface StateDelta {
+  seq: number;
+  changed?: Partial<GameData>;
+  board_add?: string[];
+  players?: Record<string, Partial<GamePlayer>>;
+}
+
+export type PrivateState = { seq: number } & Partial<Pick<GameData, "my_cards" | "my_bet" | "my_chips">>;
+
+export interface Deadline {
+  kind: "round" | "kick";
+  deadline: number; // server epoch ms
+  seconds: number;
+  username?: string;
+}
+
+export interface FullState {
+  seq: number;
+  state: GameData;
+}
+
 export interface GamePlayer {
   username: string,
   chips: number,
@@ -1,11 +1,22 @@
-import { useEffect, useState } from "react";
+import { useCallback, useEffect, useRef, useState } from "react";
 import { game_api } from "../services/api";
 import { handleError } from "../helpers/ErrorHandler";
 import { toast } from "react-toastify";
 import PokerGamePage from "../components/PokerGamePage";
 import PlayerActionPanel from "../components/PlayerActionPanel";
 import RoundOverOverlay from "../components/NewRoundOverOverlay";
-import { GameData, PlayerTurnData, ActionItem, PotAwardItem } from "../types";
+import { applyPrivateState, applyStateDelta } from "../helpers/stateSync";
+import { syncClock, useCountdown } from "../helpers/clock";
+import {
+  GameData,
+  PlayerTurnData,
+  ActionItem,
+  PotAwardItem,
+  StateDelta,
+  PrivateState,
+  FullState,
+  Deadline,
+} from "../types";
 import { useAuth } from "../context/useAuth";
 import { useSocket } from "../context/useSocket";
 import { Button, Col, Container, Row } from "react-bootstrap";
@@ -19,8 +30,10 @@ const Game = () => {
   const [playerToAct, setPlayerToAct] = useState("");
   const [actionList, setActionList] = useState<Array<ActionItem> | null>(null);
   const [showRoundOver, setShowRoundOver] = useState(false);
-  const [countDownTimer, setCountDownTimer] = useState(999);
-  const [kickTimer, setKickTimer] = useState(999);
+  const [roundDeadline, setRoundDeadline] = useState<Deadline | null>(null);
+  const [kickDeadline, setKickDeadline] = useState<Deadline | null>(null);
+  const countDownTimer = useCountdown(roundDeadline);
+  const kickTimer = useCountdown(kickDeadline);
   const [potAwards, setPotAwards] = useState<PotAwardItem[]>([]);
   const [host, setHost] = useState("");
   const [showConfirm, setShowConfirm] = useState(false);
@@ -29,10 +42,19 @@ const Game = () => {
     {}
   );
   const [rebuyInfo, setRebuyInfo] = useState<{ buy_in: number } | null>(null);
+  // seq of the state shown; null until the first snapshot arrives
+  const seqRef = useRef<number | null>(null);
+  // a sync_state request is out; deltas are skipped until full_state lands
+  const syncPendingRef = useRef(false);
   const { user } = useAuth();
   const socket = useSocket();
   const navigate = useNavigate();
 
+  const requestSync = useCallback(() => {
+    syncPendingRef.current = true;
+    socket.emit("sync_state"); // backend resolves the game from the session
+  }, [socket]);
+
   // should also handle REDIRECTING user if they have no "game_id" localStorage or
   // if they are not in the game they try to join
 
@@ -45,16 +67,22 @@ const Game = () => {
             toast.warn(response.data.error);
             setErrorMessage(response.data.error);
           } else {
-            setGameData(response.data);
+            const { seq, ...state } = response.data;
+            seqRef.current = seq;
+            setGameData(state);
             setPlayerToAct(response.data.player_to_act);
             setActionList(response.data.available_actions);
             console.log("available actions:", response.data.available_actions);
           }
+        })
+        .catch((error) => {
+          handleError(error);
+          requestSync(); // the snapshot arrives as full_state instead
         });
     } catch (error) {
       handleError(error);
     }
-  }, []);
+  }, [requestSync]);
 
   useEffect(() => {
     try {
@@ -79,26 +107,56 @@ const Game = () => {
     setActionList(data.available_actions);
   };
 
-  const updateGameState = (data: GameData) => {
-    console.log("updating game state:", data);
-    setGameData(data);
-    setShowRoundOver(false);
-  };
-
   useEffect(() => {
+    const handleStateDelta = (delta: StateDelta) => {
+      if (syncPendingRef.current) {
+        return; // a snapshot is on its way and will include this change
+      }
+      if (seqRef.current === null) {
+        requestSync(); // no snapshot yet (GET /state failed or is slow)
+        return;
+      }
+      if (delta.seq !== seqRef.current + 1) {
+        console.log("state gap at seq", seqRef.current, "got", delta.seq);
+        requestSync();
+        return;
+      }
+      seqRef.current = delta.seq;
+      setGameData((data) => data && applyStateDelta(data, delta));
+      setShowRoundOver(false);
+    };
+    const handlePrivateState = (update: PrivateState) => {
+      setGameData((data) => data && applyPrivateState(data, update));
+    };
+    const handleFullState = ({ seq, state }: FullState) => {
+      syncPendingRef.current = false;
+      seqRef.current = seq;
+      setGameData(state);
+    };
+    const handleDeadline = (deadline: Deadline) => {
+      if (deadline.kind === "round") {
+        setRoundDeadline(deadline);
+      } else {
+        setKickDeadline(deadline);
+      }
+    };
+    const handleReconnect = () => {
+      syncClock(socket);
+      requestSync();
+    };
+
     console.log("Socket status:", socket?.connected);
     socket.on("player_turn", handlePlayerTurn);
-    socket.on("update_game_state", updateGameState);
+    socket.on("state_delta", handleStateDelta);
+    socket.on("private_state", handlePrivateState);
+    socket.on("full_state", handleFullState);
+    socket.on("deadline", handleDeadline);
+    socket.io.on("reconnect", handleReconnect);
+    syncClock(socket);
     socket.on("round_over", (data: PotAwardItem[]) => {
       setPotAwards(data);
       setShowRoundOver(true);
     });
-    socket.on("round_countdown", (data) => {
-      setCountDownTimer(data.seconds);
-    });
-    socket.on("kick_countdown", (data) => {
-      setKickTimer(data.seconds);
-    });
     socket.on("game_deleted", (game) => {
       if (localStorage.getItem("game_id") === game.game_id) {
         localStorage.removeItem("game_id");
@@ -107,12 +165,15 @@ const Game = () => {
     });
     return () => {
       socket.off("player_turn", handlePlayerTurn);
-      socket.off("update_game_state");
+      socket.off("state_delta", handleStateDelta);
+      socket.off("private_state", handlePrivateState);
+      socket.off("full_state", handleFullState);
+      socket.off("deadline", handleDeadline);
+      socket.io.off("reconnect", handleReconnect);
       socket.off("round_over");
       socket.off("game_deleted");
-      socket.off("kick_countdown");
     };
-  }, [socket, navigate]);
+  }, [socket, navigate, requestSync]);
 
   const handleOpenConfirm = (type: "leave" | "end") => {
     setActionType(type);